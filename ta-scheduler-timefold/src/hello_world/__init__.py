@@ -1,4 +1,18 @@
-from .main import run_demo, generate_demo_data_with_default_params
-from .benchmark import run_benchmark
-__all__ = ['run_demo', 'generate_demo_data_with_default_params', 'run_benchmark']
+import importlib
 
+# The entry points are imported on first use: importing the domain starts the JVM, which `timefold-run-demo --daemon`
+# (a thin client of the solver daemon, see hello_world.daemon) never needs.
+_LAZY_ATTRIBUTES = {
+    'run_demo'                                  : 'main',
+    'generate_demo_data_with_default_params'    : 'demo_data',
+    'run_benchmark'                             : 'benchmark',
+    'run_microbenchmark'                        : 'microbenchmark',
+    'run_daemon'                                : 'daemon',
+}
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRIBUTES:
+        return getattr(importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+__all__ = ['run_demo', 'generate_demo_data_with_default_params', 'run_benchmark', 'run_microbenchmark', 'run_daemon']
@@ -0,0 +1,106 @@
+import asyncio
+
+from typing import AsyncIterator, Callable, Optional
+
+from timefold.solver import SolverJob, SolverJobBuilder, SolverStatus
+
+from hello_world.domain           import Timetable
+from hello_world.solution_events  import BestSolutionEvent
+
+_END_OF_SOLUTIONS = object()    # queued after the final best solution (or the error)
+
+class AsyncSolverJob:
+    """A SolverManager job driven by its consumers instead of status polling, for asyncio code.
+
+    The consumers run on Timefold's consumer thread and hand the solutions over to the event loop of the
+    coroutine that started the job: `await job.result()` returns the final best solution as soon as the
+    solver terminates, and `async for event in job.solutions()` yields the best solution events
+    (see hello_world.solution_events) up to the final one. `finish`, if given, makes the result out of the final
+    best solution, on the event loop (e.g., to merge the solution of a sub-problem back into the whole problem).
+    """
+    def __init__(self, problem_id: str, loop: Optional[asyncio.AbstractEventLoop] = None,
+                 finish: Optional[Callable[[Timetable], Timetable]] = None):
+        self.problem_id     = problem_id
+        self.loop           = loop or asyncio.get_running_loop()
+        self.finish         = finish
+        self.final_solution : asyncio.Future[Timetable] = self.loop.create_future()
+        self.best_solution  : Optional[Timetable] = None
+        self.best_event     : Optional[BestSolutionEvent] = None
+        self.solver_job     : Optional[SolverJob] = None
+        self._solutions     : asyncio.Queue = asyncio.Queue()
+
+    def start(self, builder: SolverJobBuilder) -> "AsyncSolverJob":
+        """Runs a solve builder whose best and final best solution consumers call on_best_solution and
+        on_final_best_solution (see TimetableSolverWithSolverManager._solve_builder)."""
+        self.solver_job = builder.with_exception_handler(self.on_exception).run()
+        return self
+
+    # Consumers (called on the solver's consumer thread)
+    def on_best_solution(self, event: BestSolutionEvent) -> None:
+        self.loop.call_soon_threadsafe(self._add_best_event, event)
+
+    def on_final_best_solution(self, solution: Timetable) -> None:
+        self.loop.call_soon_threadsafe(self._finish, solution, None)
+
+    def on_exception(self, problem_id: str, error: BaseException) -> None:
+        if not isinstance(error, BaseException):   # a Java throwable without a Python counterpart
+            error = RuntimeError(f"Solving failed for problem_id ({problem_id}): {error}")
+        self.loop.call_soon_threadsafe(self._finish, None, error)
+
+    # Event loop side
+    def _add_best_event(self, event: BestSolutionEvent) -> None:
+        self.best_event = event
+        if event.solution is not None:
+            self.best_solution = event.solution
+        self._solutions.put_nowait(event)
+
+    def _finish(self, solution: Optional[Timetable], error: Optional[BaseException]) -> None:
+        if not self.final_solution.done():
+            if error is None and self.finish is not None:
+                try:
+                    solution = self.finish(solution)
+                except Exception as finish_error:
+                    error = finish_error
+            if error is None:
+                self.best_solution = solution
+                self.final_solution.set_result(solution)
+            else:
+                self.final_solution.set_exception(error)
+        self._solutions.put_nowait(_END_OF_SOLUTIONS)
+
+    def get_solver_status(self) -> SolverStatus:
+        return self.solver_job.get_solver_status()
+
+    async def terminate_early(self) -> None:
+        """Stops the solver; the final best solution (so far) still resolves `result()`."""
+        await asyncio.to_thread(self.solver_job.terminate_early)     # blocks until the solver has stopped
+
+    async def cancel(self) -> None:
+        """Stops the solver and cancels `result()`."""
+        self.final_solution.cancel()
+        await self.terminate_early()
+
+    async def result(self, timeout: Optional[float] = None) -> Timetable:
+        """The final best solution. After `timeout` seconds the solver is terminated early and its best solution
+        so far is returned; cancelling the awaiting task cancels the job."""
+        try:
+            return await asyncio.wait_for(asyncio.shield(self.final_solution), timeout)
+        except asyncio.TimeoutError:
+            await self.terminate_early()
+            return await self.final_solution
+        except asyncio.CancelledError:
+            await asyncio.shield(self.cancel())
+            raise
+
+    async def solutions(self) -> AsyncIterator[BestSolutionEvent]:
+        """Yields the best solution events, up to the final one (it raises the solver's error, if any)."""
+        while True:
+            event = await self._solutions.get()
+            if event is _END_OF_SOLUTIONS:
+                break
+            yield event
+        if self.final_solution.done() and not self.final_solution.cancelled() and self.final_solution.exception() is not None:
+            raise self.final_solution.exception()
+
+    def __aiter__(self) -> AsyncIterator[BestSolutionEvent]:
+        return self.solutions()
@@ -19,7 +19,8 @@ from timefold.solver.score  import ScoreAnalysis
 from hello_world.domain      import Timetable, ShiftAssignment, Shift, TA, ConstraintParameters
 from hello_world.demo_data   import RandomTimetableGenerator, ProblemRandomizationParameters
 from hello_world.utils       import print_ta_availability, initialize_logger, create_logger_info
-from hello_world.solver      import TimetableSolverBlocking, TimetableSolverWithSolverManager
+from hello_world.solver      import TimetableSolverBase, TimetableSolverBlocking, TimetableSolverWithSolverManager, TimetableSolverLocalSearch
+from hello_world.solution_history import SolutionHistory
 
 
 def get_args() -> argparse.Namespace:
@@ -27,7 +28,7 @@ def get_args() -> argparse.Namespace:
     
     parser.add_argument('--constraint_version',
                         type=str,
-                        choices=['default', 'tabriz'],
+                        choices=['default', 'tabriz', 'fast'],
                         help='Choose the constraint version to use',
                         default='default')
     
@@ -44,14 +45,19 @@ def get_args() -> argparse.Namespace:
 
     parser.add_argument('--solving_method', 
                         type=str, 
-                        choices=["solver_manager", "blocking", "tqdm"],
-                        help='the solver instantiation method',
+                        choices=["solver_manager", "blocking", "tqdm", "local_search"],
+                        help='the solver instantiation method (local_search: the NumPy backend, on the same generated problems for a given seed)',
                         default='solver_manager')
     
     parser.add_argument('--use_config_xml',
                         action='store_true',
                         help='uses the solver_config.xml file to configure the solver',
                         default=False)
+
+    parser.add_argument('--profile_constraints',
+                        action='store_true',
+                        help='writes the calls and time of the constraint-stream callbacks into the results (overrides the config)',
+                        default=False)
     
     parser.add_argument('--path_to_config_xml',
                         type=str, 
@@ -76,6 +82,12 @@ def process_score_analysis(score_analysis: ScoreAnalysis) -> Any:
             justification = match_analysis.justification
     # logger.info(solution_manager.analyze(solution=solution))
 
+def last_solution_history(solver: TimetableSolverBase) -> Optional[SolutionHistory]:
+    """The best-solution history of the last solve, for the solvers that keep one (those with a SolverManager)."""
+    if isinstance(solver, TimetableSolverWithSolverManager) and solver.solution_history_by_job_id:
+        return solver.get_solution_history()
+    return None
+
 @dataclass
 class BenchmarkConfig:
     num_of_runs         : int
@@ -95,9 +107,13 @@ class BenchmarkRunnerBase(ABC):
             **self.config_data["BenchmarkConfig"]
         )
 
-        self.solver = TimetableSolverWithSolverManager(
+        solver_class = TimetableSolverLocalSearch if self.args.solving_method == "local_search" else TimetableSolverWithSolverManager
+        solver_kwargs = dict(self.config_data["TimetableSolver"])
+        if self.args.profile_constraints:
+            solver_kwargs["profile_constraints"] = True
+        self.solver = solver_class(
             logger=self.logger,
-            **self.config_data["TimetableSolver"]
+            **solver_kwargs
         )
 
         self.constraint_parameters = ConstraintParameters(**self.config_data["ConstraintParameters"])
@@ -136,7 +152,8 @@ class BenchmarkRunnerBase(ABC):
             self.logger.info("=================================================================")
 
             solution, score_analysis, metadata = self._run_iteration()
-            self._add_iteration(iteration_index=iteration_index, solution=solution, score_analysis=score_analysis, metadata=metadata)
+            self._add_iteration(iteration_index=iteration_index, solution=solution, score_analysis=score_analysis, metadata=metadata,
+                                constraint_profile=self.solver.constraint_profile, solution_history=last_solution_history(self.solver))
 
             self.logger.info("=================================================================")
             self.logger.info(f"End of iteration {iteration_index + 1} / {self.benchmark_config.num_of_runs}\n")
@@ -157,8 +174,9 @@ class BenchmarkRunnerBase(ABC):
 
         return solution, score_analysis, metadata
         
-    def _add_iteration(self, iteration_index: int, solution: Timetable, score_analysis: ScoreAnalysis, metadata: Dict[str, Any]):
-        self.iterations.append({
+    def _add_iteration(self, iteration_index: int, solution: Timetable, score_analysis: ScoreAnalysis, metadata: Dict[str, Any],
+                       constraint_profile: Optional[Dict[str, Any]] = None, solution_history: Optional[SolutionHistory] = None):
+        iteration = {
             "iteration": {
                 "id": iteration_index,
                 "score": str(solution.score),
@@ -176,7 +194,14 @@ class BenchmarkRunnerBase(ABC):
                     }
                 }
             }
-        })
+        }
+        # calls and time of the constraint-stream callbacks (with profile_constraints, see hello_world.constraint_profiling)
+        if constraint_profile is not None:
+            iteration["iteration"]["iteration_metadata"]["constraint_profile"] = constraint_profile
+        # time-to-feasible and score over time (solvers with a SolverManager, see hello_world.solution_history)
+        if solution_history is not None:
+            iteration["iteration"]["iteration_metadata"]["solution_history"] = solution_history.summary()
+        self.iterations.append(iteration)
 
         self.solutions.append(solution)
 
@@ -255,7 +280,7 @@ class BenchmarkRunnerWithDatabase(BenchmarkRunnerBase):
                 self.logger.info(f"!!! skipping {iteration_index} because the solution is None type")
                 continue
 
-            metadata        = {key : val for key, val in asdict(scheduling_problem).items() if key != "problem"}  # Add metadata if you want to track from generator or elsewhere
+            metadata        = {key : val for key, val in asdict(scheduling_problem).items() if key not in ("problem", "constraint_profile")}  # Add metadata if you want to track from generator or elsewhere
             solution        = self.problem_database.solutions[iteration_index]
             score_analysis  = self.solver.post_process_solution(solution=solution, log_analysis=False)
 
@@ -263,7 +288,8 @@ class BenchmarkRunnerWithDatabase(BenchmarkRunnerBase):
                 iteration_index=iteration_index,
                 solution=solution,
                 score_analysis=score_analysis,
-                metadata=metadata
+                metadata=metadata,
+                constraint_profile=scheduling_problem.constraint_profile
             )
 
             self.logger.info("=================================================================")
@@ -308,7 +334,9 @@ class SchedulingProblem:
     avg_desired_shifts_per_ta:  float = 0.0
     ta_to_shift_ratio:          float = 0.0
     solve_time_seconds:         int = 0
+    time_to_feasible_seconds:   Optional[float] = None  # SolutionHistory.time_to_feasible() of the solve
     difficulty_label:           str = "unknown"
+    constraint_profile:         Optional[Dict[str, Any]] = None    # ConstraintProfiler.report() of the solve (profile_constraints)
 
     @classmethod
     def from_timetable(
@@ -419,7 +447,7 @@ class SchedulingProblemDatabase:
     def generate_and_solve_problems(
         cls,
         generator: "RandomTimetableGenerator",
-        solver: "TimetableSolverWithSolverManager",
+        solver: "TimetableSolverBase",
         constraint_params: ConstraintParameters,
         num_problems: int,
         logger: logging.Logger,
@@ -449,9 +477,13 @@ class SchedulingProblemDatabase:
             scheduling_problem = SchedulingProblem.from_timetable(
                 timetable=timetable,
                 score=(hard_score, medium_score, soft_score),
-                solve_time_seconds=solver.get_solver_job(index=-1).get_solving_duration().seconds,
+                solve_time_seconds=solver.get_solving_duration().seconds,
                 difficulty_label=None
             )
+            scheduling_problem.constraint_profile = solver.constraint_profile
+            solution_history = last_solution_history(solver)
+            if solution_history is not None:
+                scheduling_problem.time_to_feasible_seconds = solution_history.time_to_feasible()
 
             problems.append(scheduling_problem)
             solutions.append(solution)
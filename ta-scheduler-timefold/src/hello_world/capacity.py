@@ -0,0 +1,188 @@
+import logging
+import numpy as np
+
+from dataclasses    import dataclass, field, asdict
+from typing         import Dict, List, Any, Optional
+
+# Custom Imports
+from hello_world.domain     import Timetable
+from hello_world.problem_ir import CompiledProblem, DESIRED, NEUTRAL, UNAVAILABLE
+
+# Severity of the issues, mirroring the score levels of the constraints they predict
+ERROR   = "error"       # the hard constraints cannot all be met (hard score < 0 for any solution)
+WARNING = "warning"     # medium (weekly bounds) or soft (preferences) constraints will be violated
+INFO    = "info"        # worth knowing, does not affect the sanity flag
+
+@dataclass
+class SanityIssue:
+    code: str
+    severity: str
+    message: str
+    week_id: Optional[int]  = None
+    series: Optional[str]   = None
+    shift_id: Optional[str] = None
+    ta_id: Optional[str]    = None
+
+@dataclass
+class CapacityReport:
+    """Structured result of the capacity analysis (see analyze_capacity)."""
+    problem: str
+    num_tas: int
+    num_shifts: int
+    num_of_weeks: int
+    # per week (the weeks with shifts, in order)
+    week_ids: List[int]
+    weekly_demand: List[int]            # TA slots to fill
+    weekly_supply_max: List[int]        # slots the TAs can fill within their availability and max_shifts_per_week
+    weekly_supply_min: List[int]        # slots needed to give every TA their min_shifts_per_week
+    # per shift (same order as the problem shifts)
+    shift_ids: List[str]
+    shift_required_tas: List[int]
+    shift_available_tas: List[int]      # TAs not unavailable
+    shift_willing_tas: List[int]        # TAs for which the shift is desired or neutral
+    shift_desired_tas: List[int]
+    # per TA (same order as the problem TAs)
+    ta_ids: List[str]
+    ta_required_per_semester: List[int]
+    ta_semester_min: List[int]          # sum of the weekly minimums the TA can meet
+    ta_semester_max: List[int]          # sum of the weekly maximums the TA can meet
+    issues: List[SanityIssue] = field(default_factory=list)
+
+    @property
+    def is_feasible(self) -> bool:
+        """False if no solution can satisfy all the hard constraints."""
+        return not any(issue.severity == ERROR for issue in self.issues)
+
+    @property
+    def is_sane(self) -> bool:
+        """False if any hard or medium/soft issue was found (the historical sanity flag)."""
+        return not any(issue.severity in (ERROR, WARNING) for issue in self.issues)
+
+    def issues_with(self, severity: str) -> List[SanityIssue]:
+        return [issue for issue in self.issues if issue.severity == severity]
+
+    def to_dict(self) -> Dict[str, Any]:
+        report = asdict(self)
+        report["is_feasible"]   = self.is_feasible
+        report["is_sane"]       = self.is_sane
+        return report
+
+    def log(self, logger: logging.Logger) -> None:
+        logger.info(f"\tProblem has {self.num_tas} TAs and {self.num_shifts} shifts over {self.num_of_weeks} week(s).")
+        for issue in self.issues:
+            if issue.severity == INFO:
+                logger.info(f"\tℹ️  SANITY CHECK NOTE [{issue.code}]: {issue.message}")
+            else:
+                logger.warning(f"\t⚠️  SANITY CHECK {issue.severity.upper()} [{issue.code}]: {issue.message}")
+
+def _sum_by_week(matrix: np.ndarray, shift_week: np.ndarray, num_of_weeks: int) -> np.ndarray:
+    """Sums the columns (shifts) of `matrix` by week in one pass (prefix sums over the week-sorted columns)."""
+    order       = np.argsort(shift_week, kind="stable")
+    bounds      = np.searchsorted(shift_week[order], np.arange(num_of_weeks + 1))
+    prefix_sums = np.zeros((matrix.shape[0], matrix.shape[1] + 1), dtype=np.int64)
+    np.cumsum(matrix[:, order], axis=1, out=prefix_sums[:, 1:])
+    return prefix_sums[:, bounds[1:]] - prefix_sums[:, bounds[:-1]]
+
+def analyze_capacity(problem: Timetable | CompiledProblem) -> CapacityReport:
+    """Vectorized sanity/capacity analysis over the TA x shift availability matrix.
+
+    Checks, per shift, the available supply against the required TAs; per week, the demand against what
+    the TAs can take within their availability and weekly bounds; and per TA, whether the semester
+    requirement lies within the range reachable with the weekly bounds.
+    """
+    compiled    = problem if isinstance(problem, CompiledProblem) else CompiledProblem.from_timetable(problem)
+    # the per-week arrays follow the weeks that have shifts: week ids need not start at 0 nor be consecutive
+    week_ids, week_position = np.unique(compiled.shift_week, return_inverse=True)
+    num_of_weeks = len(week_ids)
+    week, required, series = compiled.shift_week, compiled.shift_required_tas, compiled.series_names[compiled.shift_series]
+    issues: List[SanityIssue] = []
+
+    # ----- per shift -----
+    available   = compiled.availability != UNAVAILABLE
+    willing     = compiled.availability >= NEUTRAL
+    shift_available = available.sum(axis=0)
+    shift_willing   = willing.sum(axis=0)
+    shift_desired   = (compiled.availability == DESIRED).sum(axis=0)
+
+    for i in np.flatnonzero(required > shift_available):
+        message = (f"All TAs are unavailable for shift series '{series[i]}' in week '{week[i]}'." if shift_available[i] == 0 else
+                   f"Only {shift_available[i]} TAs are available for shift series '{series[i]}' in week '{week[i]}', but {required[i]} are required.")
+        issues.append(SanityIssue("TMTBL.shifts.unavailable", ERROR, message, int(week[i]), str(series[i]), str(compiled.shift_ids[i])))
+    for i in np.flatnonzero(required > shift_willing):
+        message = (f"All TAs are undesired for shift series '{series[i]}' in week '{week[i]}'." if shift_willing[i] == 0 else
+                   f"Only {shift_willing[i]} TAs find shift series '{series[i]}' in week '{week[i]}' desired/neutral, but {required[i]} are required.")
+        issues.append(SanityIssue("TMTBL.shifts.undesired", WARNING, message, int(week[i]), str(series[i]), str(compiled.shift_ids[i])))
+    for i in np.flatnonzero(shift_desired == 0):
+        issues.append(SanityIssue("TMTBL.shifts.desired", INFO, f"No TAs have shift series '{series[i]}' in week '{week[i]}' as desired.",
+                                  int(week[i]), str(series[i]), str(compiled.shift_ids[i])))
+
+    # ----- per TA and week -----
+    ta_week_available   = _sum_by_week(available, week_position, num_of_weeks)                                   # [num_tas, num_of_weeks]
+    ta_week_max         = np.minimum(compiled.ta_max_per_week[:, None], ta_week_available)
+    ta_week_min         = np.minimum(compiled.ta_min_per_week[:, None], ta_week_max)
+    weekly_demand       = np.bincount(week_position, weights=required, minlength=num_of_weeks).astype(np.int64)
+    weekly_supply_max   = ta_week_max.sum(axis=0)
+    weekly_supply_min   = np.broadcast_to(compiled.ta_min_per_week.sum(), (num_of_weeks,)).astype(np.int64)
+
+    total_demand = int(weekly_demand.sum())
+    total_supply = int(compiled.ta_max_per_week.sum()) * num_of_weeks
+    if total_demand > total_supply:
+        issues.append(SanityIssue("TMTBL.workforce.count", WARNING,
+                                  f"Total required TAs ({total_demand}) over the planning problem exceeds anticipated TA duties ({total_supply}). "
+                                  f"Consider increasing the number of TAs or their maximum shifts per week, or reducing the required TAs per shift."))
+    total_required_per_semester = int(compiled.ta_required_per_semester.sum())
+    if total_required_per_semester != total_demand:
+        issues.append(SanityIssue("TMTBL.workforce.semester", ERROR,
+                                  f"The TAs require {total_required_per_semester} shifts over the semester in total, but the shifts require {total_demand} TAs."))
+
+    for w in np.flatnonzero(weekly_demand > weekly_supply_max):
+        issues.append(SanityIssue("TMTBL.week.capacity", WARNING,
+                                  f"Week '{week_ids[w]}' requires {weekly_demand[w]} TAs, but the TAs can only take {weekly_supply_max[w]} within their availability and max shifts per week.",
+                                  week_id=int(week_ids[w])))
+    for w in np.flatnonzero(weekly_demand < weekly_supply_min):
+        issues.append(SanityIssue("TMTBL.week.min_load", WARNING,
+                                  f"Week '{week_ids[w]}' requires {weekly_demand[w]} TAs, fewer than the {weekly_supply_min[w]} needed to give every TA their min shifts per week.",
+                                  week_id=int(week_ids[w])))
+    for t, w in zip(*np.nonzero(ta_week_available < compiled.ta_min_per_week[:, None])):
+        issues.append(SanityIssue("TMTBL.ta.weekly_min", WARNING,
+                                  f"TA '{compiled.ta_names[t]}' is available for {ta_week_available[t, w]} shifts in week '{week_ids[w]}', below their min of {compiled.ta_min_per_week[t]}.",
+                                  week_id=int(week_ids[w]), ta_id=str(compiled.ta_ids[t])))
+
+    # ----- per TA over the semester -----
+    ta_available_total  = ta_week_available.sum(axis=1)
+    ta_semester_max     = ta_week_max.sum(axis=1)
+    ta_semester_min     = ta_week_min.sum(axis=1)
+    ta_required         = compiled.ta_required_per_semester
+    for t in np.flatnonzero(ta_required > ta_available_total):
+        issues.append(SanityIssue("TMTBL.ta.semester_available", ERROR,
+                                  f"TA '{compiled.ta_names[t]}' requires {ta_required[t]} shifts over the semester, but is available for only {ta_available_total[t]}.",
+                                  ta_id=str(compiled.ta_ids[t])))
+    for t in np.flatnonzero((ta_required > ta_semester_max) & (ta_required <= ta_available_total)):
+        issues.append(SanityIssue("TMTBL.ta.semester_max", WARNING,
+                                  f"TA '{compiled.ta_names[t]}' requires {ta_required[t]} shifts over the semester, more than the {ta_semester_max[t]} allowed by their max shifts per week.",
+                                  ta_id=str(compiled.ta_ids[t])))
+    for t in np.flatnonzero(ta_required < ta_semester_min):
+        issues.append(SanityIssue("TMTBL.ta.semester_min", WARNING,
+                                  f"TA '{compiled.ta_names[t]}' requires {ta_required[t]} shifts over the semester, fewer than the {ta_semester_min[t]} implied by their min shifts per week.",
+                                  ta_id=str(compiled.ta_ids[t])))
+
+    return CapacityReport(
+        problem                 = str(problem),
+        num_tas                 = compiled.num_tas,
+        num_shifts              = compiled.num_shifts,
+        num_of_weeks            = num_of_weeks,
+        week_ids                = week_ids.tolist(),
+        weekly_demand           = weekly_demand.tolist(),
+        weekly_supply_max       = weekly_supply_max.tolist(),
+        weekly_supply_min       = weekly_supply_min.tolist(),
+        shift_ids               = compiled.shift_ids.tolist(),
+        shift_required_tas      = required.tolist(),
+        shift_available_tas     = shift_available.tolist(),
+        shift_willing_tas       = shift_willing.tolist(),
+        shift_desired_tas       = shift_desired.tolist(),
+        ta_ids                  = compiled.ta_ids.tolist(),
+        ta_required_per_semester= ta_required.tolist(),
+        ta_semester_min         = ta_semester_min.tolist(),
+        ta_semester_max         = ta_semester_max.tolist(),
+        issues                  = issues,
+    )
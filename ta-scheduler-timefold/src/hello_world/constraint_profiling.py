@@ -0,0 +1,178 @@
+import types
+import jpype
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from timefold.solver.score import constraint_provider, ConstraintFactory, Constraint, ConstraintCollectors, Joiners
+
+# Custom Imports
+from hello_world.constraints    import constraint_generator_dict
+from hello_world.scoring        import CONSTRAINT_PACKAGE
+
+class CallbackCounter:
+    """Call count and cumulative wall time of one constraint-stream callback (e.g., a filter or a group_by key).
+
+    The callbacks are translated to Java bytecode and called from the JVM, where writes to captured Python objects
+    go to a Java copy of them; captured Java objects are shared, so the counters are java.util.concurrent AtomicLongs.
+    """
+    def __init__(self, site: str):
+        atomic_long = jpype.JClass("java.util.concurrent.atomic.AtomicLong")
+        self.site   = site              # e.g., "filter", "group_by#2", "Joiners.equal"
+        self.calls  = atomic_long()
+        self.nanos  = atomic_long()
+
+    def read(self, reset: bool = False) -> Tuple[int, int]:
+        """Returns (calls, nanoseconds), setting both to zero if `reset`."""
+        if reset:
+            return int(self.calls.getAndSet(0)), int(self.nanos.getAndSet(0))
+        return int(self.calls.get()), int(self.nanos.get())
+
+def profile_callback(function: Callable, counter: CallbackCounter) -> Callable:
+    """Wraps a constraint-stream callback so each call is counted and timed in `counter`.
+
+    The wrapper has the arity of the callback (the bytecode translator rejects *args wrappers); anything other
+    than a plain function with 1-4 arguments is returned as it is. The JVM passes the missing side of a concat
+    or if_not_exists tuple as a Java null, which only the outermost callback accepts, so the wrapper maps it to None.
+    """
+    if not isinstance(function, types.FunctionType):
+        return function
+    calls, nanos, clock = counter.calls, counter.nanos, jpype.JClass("java.lang.System")
+    objects = jpype.JClass("java.util.Objects")
+    arity = function.__code__.co_argcount
+    if arity == 1:
+        def profiled(a):
+            start   = clock.nanoTime()
+            result  = function(None if objects.isNull(a) else a)
+            nanos.addAndGet(clock.nanoTime() - start)
+            calls.incrementAndGet()
+            return result
+    elif arity == 2:
+        def profiled(a, b):
+            start   = clock.nanoTime()
+            result  = function(None if objects.isNull(a) else a, None if objects.isNull(b) else b)
+            nanos.addAndGet(clock.nanoTime() - start)
+            calls.incrementAndGet()
+            return result
+    elif arity == 3:
+        def profiled(a, b, c):
+            start   = clock.nanoTime()
+            result  = function(None if objects.isNull(a) else a, None if objects.isNull(b) else b, None if objects.isNull(c) else c)
+            nanos.addAndGet(clock.nanoTime() - start)
+            calls.incrementAndGet()
+            return result
+    elif arity == 4:
+        def profiled(a, b, c, d):
+            start   = clock.nanoTime()
+            result  = function(None if objects.isNull(a) else a, None if objects.isNull(b) else b, None if objects.isNull(c) else c, None if objects.isNull(d) else d)
+            nanos.addAndGet(clock.nanoTime() - start)
+            calls.incrementAndGet()
+            return result
+    else:
+        return function
+    return profiled
+
+class _ProfiledProxy:
+    """Forwards to a constraint factory, stream, builder or to Joiners/ConstraintCollectors, wrapping the callbacks
+    passed to its methods (and, for streams, the streams and builders they return)."""
+    def __init__(self, delegate: Any, profiler: "ConstraintProfiler", prefix: str = "", wrap_results: bool = True):
+        self._delegate      = delegate
+        self._profiler      = profiler
+        self._prefix        = prefix
+        self._wrap_results  = wrap_results
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._delegate, name)
+        if not callable(attribute):
+            return attribute
+
+        def method(*args, **kwargs):
+            if name == "as_constraint":
+                self._profiler._name_constraint(args[0] if args else kwargs["constraint_name"])
+            args    = [self._profiler._prepare_argument(self._prefix + name, arg) for arg in args]
+            kwargs  = {key: self._profiler._prepare_argument(self._prefix + name, arg) for key, arg in kwargs.items()}
+            result  = attribute(*args, **kwargs)
+            if self._wrap_results and (hasattr(result, "as_constraint") or hasattr(result, "penalize")):
+                return _ProfiledProxy(result, self._profiler)
+            return result
+        return method
+
+class ConstraintProfiler:
+    """Counts the calls of the constraint-stream callbacks of a constraint version and their cumulative time, per constraint.
+
+    Use constraint_provider() in place of constraints_provider_dict[constraint_version]. Each callback is timed
+    with two System.nanoTime() calls, so an instrumented solve evaluates fewer moves per second than a normal one;
+    compare the constraints with each other rather than with an uninstrumented run.
+    """
+    def __init__(self, constraint_version: str):
+        if constraint_version not in constraint_generator_dict:
+            raise ValueError(f"Invalid constraint version: {constraint_version}. Choose from {list(constraint_generator_dict)}")
+        self.constraint_version = constraint_version
+        # constraint name -> counters of its callbacks (from every time the provider ran)
+        self.counters: Dict[str, List[CallbackCounter]] = {}
+        self._pending:  List[CallbackCounter] = []     # counters of the constraint being built
+        self._provider: Optional[Callable[[ConstraintFactory], List[Constraint]]] = None
+
+    def constraint_provider(self) -> Callable[[ConstraintFactory], List[Constraint]]:
+        """The constraint provider function of the constraint version, with profiled callbacks."""
+        if self._provider is None:
+            generator_class = constraint_generator_dict[self.constraint_version]
+            profiler        = self
+
+            @constraint_provider
+            def define_profiled_constraints(constraint_factory: ConstraintFactory) -> List[Constraint]:
+                profiler._pending = []
+                return generator_class(_ProfiledProxy(constraint_factory, profiler),
+                                       joiners      = _ProfiledProxy(Joiners, profiler, "Joiners.", wrap_results=False),
+                                       collectors   = _ProfiledProxy(ConstraintCollectors, profiler, "ConstraintCollectors.", wrap_results=False)).create_constraints()
+
+            self._provider = define_profiled_constraints
+        return self._provider
+
+    def report(self, reset: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Calls and seconds per constraint id (as in ScoreAnalysis), and per callback, the most expensive constraint first.
+
+        With `reset`, the counters start from zero again (e.g., between solves).
+        """
+        report = {}
+        for name, counters in self.counters.items():
+            callbacks: Dict[str, List[int]] = {}
+            for counter in counters:
+                calls, nanos = counter.read(reset=reset)
+                totals = callbacks.setdefault(counter.site, [0, 0])
+                totals[0] += calls
+                totals[1] += nanos
+            calls = sum(totals[0] for totals in callbacks.values())
+            nanos = sum(totals[1] for totals in callbacks.values())
+            report[f"{CONSTRAINT_PACKAGE}/{name}"] = {
+                "calls":        calls,
+                "seconds":      nanos / 1e9,
+                "ns_per_call":  round(nanos / calls) if calls else 0,
+                "callbacks":    {site: {"calls": totals[0], "seconds": totals[1] / 1e9} for site, totals in callbacks.items()},
+            }
+        return dict(sorted(report.items(), key=lambda item: item[1]["seconds"], reverse=True))
+
+    def reset(self):
+        """Sets all counters to zero."""
+        self.report(reset=True)
+
+    def _prepare_argument(self, site: str, argument: Any) -> Any:
+        if isinstance(argument, _ProfiledProxy):
+            return argument._delegate
+        if not isinstance(argument, types.FunctionType):
+            return argument
+        sites   = [counter.site.split("#")[0] for counter in self._pending]
+        counter = CallbackCounter(site if site not in sites else f"{site}#{sites.count(site) + 1}")
+        self._pending.append(counter)
+        return profile_callback(argument, counter)
+
+    def _name_constraint(self, name: str):
+        self.counters.setdefault(name, []).extend(self._pending)
+        self._pending = []
+
+def format_constraint_profile(report: Dict[str, Dict[str, Any]]) -> str:
+    """Formats a ConstraintProfiler.report() as a table for the logs."""
+    total = sum(entry["seconds"] for entry in report.values()) or 1.0
+    lines = [f"{'calls':>12} {'seconds':>9} {'share':>6} {'ns/call':>8}  constraint"]
+    for constraint_id, entry in report.items():
+        lines.append(f"{entry['calls']:>12} {entry['seconds']:>9.3f} {entry['seconds'] / total:>6.1%} {entry['ns_per_call']:>8}  {constraint_id}")
+    return "\n".join(lines)
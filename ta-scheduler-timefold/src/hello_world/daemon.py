@@ -0,0 +1,196 @@
+import os
+import random
+import logging
+import argparse
+import threading
+
+from contextlib                 import contextmanager
+from multiprocessing.connection import Listener, Connection
+from pathlib                    import Path
+from typing                     import Any, Dict, Iterator, List, Optional
+
+from hello_world.domain         import Timetable
+from hello_world.constraints    import constraints_provider_dict
+from hello_world.solver         import TimetableSolverWithSolverManager
+from hello_world.solver_cache   import solver_cache_info
+from hello_world.solution_events import BestSolutionEvent
+from hello_world.main           import SEED, get_args as get_demo_args, create_the_problem, create_the_solver, solve_the_problem
+from hello_world.daemon_client  import DEFAULT_SOCKET_PATH, daemon_is_running, stop_daemon
+
+STREAM_INTERVAL_SECONDS = 0.5   # at most one best solution per interval is streamed to a client
+
+class _ClientChannel:
+    """Replies to one client, from the request and from the solver threads; remembers a disconnected client."""
+    def __init__(self, connection: Connection):
+        self.connection = connection
+        self.closed     = False
+        self._lock      = threading.Lock()
+
+    def send(self, message: Dict[str, Any]) -> bool:
+        with self._lock:
+            if self.closed:
+                return False
+            try:
+                self.connection.send(message)
+                return True
+            except OSError:
+                self.closed = True
+                return False
+
+class _ChannelLogHandler(logging.Handler):
+    """Forwards the log of a request to its client."""
+    def __init__(self, channel: _ClientChannel):
+        super().__init__(level=logging.INFO)
+        self.channel = channel
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.channel.send({"type": "log", "level": record.levelname, "message": self.format(record)})
+
+@contextmanager
+def working_directory(path: Path | str) -> Iterator[None]:
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+def solution_assignments(solution: Timetable) -> Dict[str, Optional[str]]:
+    """{shift assignment id: TA id} of a solution (plain data, so the clients need not import the domain)."""
+    return {assignment.id: assignment.get_ta_id() for assignment in solution.shift_assignments}
+
+class SolverDaemon:
+    """Keeps a JVM with warm solvers (one SolverFactory/SolverManager per configuration, see hello_world.solver_cache)
+    and runs main.py for clients (timefold-run-demo --daemon) over a Unix socket, streaming the log and the best
+    solutions back.
+
+    Requests run one at a time, in the order they connect; a solve already uses the CPU the JVM gives it.
+    """
+    def __init__(self, socket_path: Path | str = DEFAULT_SOCKET_PATH, logger: Optional[logging.Logger] = None):
+        self.socket_path    = Path(socket_path)
+        self.logger         = logger or logging.getLogger("daemon")
+        self.request_count  : int  = 0     # run_demo requests received
+        self._running       : bool = False
+
+    def warm_up(self, constraint_versions: List[str], seconds: int = 2) -> None:
+        """Builds the default solver of each constraint version and runs its constraints on a small problem for
+        `seconds`, so the first request skips the constraint translation and the JIT warm-up."""
+        for constraint_version in constraint_versions:
+            create_the_solver(logger=self.logger, args=get_demo_args(["--constraint_version", constraint_version])).warm_up(seconds=seconds)
+
+    def serve_forever(self) -> None:
+        """Serves requests until a client sends "shutdown"."""
+        if daemon_is_running(self.socket_path):
+            raise RuntimeError(f"A solver daemon is already listening on {self.socket_path}")
+        if self.socket_path.exists():
+            self.socket_path.unlink()   # left behind by a daemon that did not exit cleanly
+
+        with Listener(str(self.socket_path), family="AF_UNIX") as listener:
+            os.chmod(self.socket_path, 0o600)
+            self.logger.info(f"🛰️  Solver daemon (pid {os.getpid()}) listening on {self.socket_path}")
+            self._running = True
+            while self._running:
+                with listener.accept() as connection:
+                    self._handle(connection)
+        self.logger.info("👋 Solver daemon stopped.")
+
+    def _handle(self, connection: Connection) -> None:
+        try:
+            message = connection.recv()
+        except (EOFError, OSError):
+            return
+        channel = _ClientChannel(connection)
+        kind    = message.get("type")
+        if kind == "ping":
+            channel.send({"type": "pong", "pid": os.getpid(), "solvers": solver_cache_info()["entries"], "request_count": self.request_count})
+        elif kind == "shutdown":
+            self._running = False
+            channel.send({"type": "result"})
+        elif kind == "run_demo":
+            self._run_demo(channel, argv=message["argv"], cwd=message["cwd"])
+        else:
+            channel.send({"type": "error", "message": f"Unknown request type: {kind}"})
+
+    def _run_demo(self, channel: _ClientChannel, argv: List[str], cwd: str) -> None:
+        """Runs main.py's run_demo with `argv` on a warm solver."""
+        request_index       = self.request_count
+        self.request_count += 1
+        logger = logging.getLogger(f"{self.logger.name}.request")     # one request at a time
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        handler = _ChannelLogHandler(channel)
+        logger.addHandler(handler)
+        self.logger.info(f"▶️  Request {request_index}: {' '.join(argv)}")
+        try:
+            with working_directory(cwd):
+                args = get_demo_args(argv)
+                random.seed(SEED)
+                problem = create_the_problem(logger=logger, args=args)
+                solver  = create_the_solver(logger=logger, args=args)     # its SolverFactory comes from the process-wide cache
+
+                terminating = threading.Event()
+
+                def stream_best_solution(problem_id: str, event: BestSolutionEvent):
+                    sent = channel.send({"type": "best_solution", "score": str(event.score), "assignments": event.assignments})
+                    if not sent and not terminating.is_set():   # the client is gone
+                        # from another thread: this listener runs on the solver's consumer thread, which
+                        # terminate_early waits for
+                        terminating.set()
+                        threading.Thread(target=solver.get_solver_job().terminate_early, name=f"daemon-terminate-{request_index}",
+                                         daemon=True).start()
+
+                if isinstance(solver, TimetableSolverWithSolverManager):
+                    # the clients only need the assignments, a few times a second
+                    solver.best_solution_interval_seconds   = STREAM_INTERVAL_SECONDS
+                    solver.best_solution_diffs              = True
+                    solver.best_solution_listeners.append(stream_best_solution)
+                solution = solve_the_problem(logger=logger, args=args, solver=solver, problem=problem)
+            channel.send({"type": "result", "score": str(solution.score), "assignments": solution_assignments(solution),
+                          "seconds": solver.solve_duration.total_seconds()})
+        except SystemExit as error:     # argparse and create_the_problem exit on invalid input
+            channel.send({"type": "error", "message": f"invalid request (exit code {error.code}), see the daemon log"})
+        except Exception as error:
+            self.logger.exception(f"Request {request_index} failed")
+            channel.send({"type": "error", "message": repr(error)})
+        finally:
+            logger.removeHandler(handler)
+
+def get_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Run the solver daemon: a warm JVM that runs timefold-run-demo --daemon requests')
+
+    parser.add_argument('--socket',
+                        type=str,
+                        help='the Unix socket to listen on',
+                        default=str(DEFAULT_SOCKET_PATH))
+
+    parser.add_argument('--constraint_versions',
+                        type=str,
+                        nargs='*',
+                        choices=list(constraints_provider_dict.keys()),
+                        help='the constraint versions to warm up at start-up',
+                        default=list(constraints_provider_dict.keys()))
+
+    parser.add_argument('--warm_up_seconds',
+                        type=int,
+                        help='the time to run the constraints of each version on a demo problem at start-up',
+                        default=2)
+
+    parser.add_argument('--stop',
+                        action='store_true',
+                        help='stops the daemon listening on --socket',
+                        default=False)
+
+    return parser.parse_args()
+
+def run_daemon() -> None:
+    args = get_args()
+    if args.stop:
+        stop_daemon(args.socket)
+        return
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    daemon = SolverDaemon(socket_path=args.socket, logger=logging.getLogger("daemon"))
+    daemon.warm_up(args.constraint_versions, seconds=args.warm_up_seconds)
+    daemon.serve_forever()
+
+if __name__ == "__main__":
+    run_daemon()
@@ -0,0 +1,53 @@
+import os
+import sys
+import tempfile
+
+from multiprocessing.connection import Client, Connection
+from pathlib    import Path
+from typing     import Any, Dict, Iterator, List
+
+# Client side of the solver daemon (hello_world.daemon); only uses the standard library, so it starts without a JVM.
+DEFAULT_SOCKET_PATH = Path(os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()) / f"ta-scheduler-{os.getuid()}.sock"
+FINAL_REPLY_TYPES   = ("result", "error", "pong")     # the last reply to a request
+
+def connect(socket_path: Path | str = DEFAULT_SOCKET_PATH) -> Connection:
+    """Opens a connection to the daemon; messages are pickled dicts with a "type" key."""
+    return Client(str(socket_path), family="AF_UNIX")
+
+def request(message: Dict[str, Any], socket_path: Path | str = DEFAULT_SOCKET_PATH) -> Iterator[Dict[str, Any]]:
+    """Sends a request to the daemon and yields its replies ("log", "best_solution", ...) up to the final one."""
+    with connect(socket_path) as connection:
+        connection.send(message)
+        while True:
+            reply = connection.recv()
+            yield reply
+            if reply["type"] in FINAL_REPLY_TYPES:
+                return
+
+def daemon_is_running(socket_path: Path | str = DEFAULT_SOCKET_PATH) -> bool:
+    try:
+        return [reply["type"] for reply in request({"type": "ping"}, socket_path)] == ["pong"]
+    except (OSError, EOFError):
+        return False
+
+def stop_daemon(socket_path: Path | str = DEFAULT_SOCKET_PATH) -> None:
+    """Asks the daemon to exit once the running request (if any) is done."""
+    for _ in request({"type": "shutdown"}, socket_path):
+        pass
+
+def run_demo_with_daemon(argv: List[str], socket_path: Path | str = DEFAULT_SOCKET_PATH) -> int:
+    """Runs main.py with the command line arguments `argv` in the daemon and prints its log; returns the exit code.
+
+    Relative paths in `argv` are resolved from the current directory, as in a local run.
+    """
+    try:
+        for reply in request({"type": "run_demo", "argv": argv, "cwd": os.getcwd()}, socket_path):
+            if reply["type"] == "log":
+                print(reply["message"], flush=True)
+            elif reply["type"] == "error":
+                print(f"The solver daemon could not run the request: {reply['message']}", file=sys.stderr)
+                return 1
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"No solver daemon is listening on {socket_path}; start one with timefold-solver-daemon.", file=sys.stderr)
+        return 1
+    return 0
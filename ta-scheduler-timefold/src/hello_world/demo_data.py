@@ -255,6 +255,7 @@ class RandomTimetableGenerator:
             shift_assignments=self.shift_assignments,
             constraint_parameters=self.constraint_params,
         )
+        self.generated_problem.build_availability_index()
 
         metadata: Dict[str, Dict[str, Any]] = {
             "shift_metadata": shift_metadata,
@@ -717,13 +718,15 @@ def demo_data_weekly_scheduling(name: str, logger: logging.Logger, constraint_pa
    shift_assignments.append(ShiftAssignment(id= next(ids), shift= shifts[shift_index], assigned_ta= None))
    shift_assignments.append(ShiftAssignment(id= next(ids), shift= shifts[shift_index], assigned_ta= None))
 
-   return Timetable(
+   timetable = Timetable(
                   id= name, 
                   shifts=shifts, 
                   tas=course_tas, 
                   shift_assignments= shift_assignments,
                   constraint_parameters=constraint_params
          )
+   timetable.build_availability_index()
+   return timetable
 
 def demo_data_semeseter_scheduling(name: str, logger: logging.Logger) -> Timetable:
    # TODO
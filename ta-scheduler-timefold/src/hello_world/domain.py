@@ -4,16 +4,25 @@ from timefold.solver.domain import (planning_entity, planning_solution, Planning
                                     PlanningScore, PlanningPin)
 from timefold.solver import SolverStatus
 from timefold.solver.score import HardSoftScore, HardMediumSoftScore
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, MISSING
 from datetime import time, date, timedelta, datetime
-from typing import Annotated, List
-from pydantic import Field
+from typing import Annotated, List, TYPE_CHECKING
 
-import logging
 from collections import defaultdict
 
 from typing import Dict, Tuple
 
+from hello_world.jvm_cache import start_jvm
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+start_jvm()     # with the on-disk class cache, before the decorators below start it without
+
+DAYS_OF_WEEK: Tuple[str, ...]   = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+MINUTES_PER_DAY: int            = 24 * 60
+MINUTES_PER_WEEK: int           = 7 * MINUTES_PER_DAY
+
 def id_generator():
     """Generates unique IDs for the shift assignments."""
     current = 0
@@ -21,7 +30,38 @@ def id_generator():
         yield str(current)
         current += 1
 
-@dataclass
+class PlanningIdObject:
+    """Base of the domain classes: equality and hashing use the PlanningId (`id`) only.
+
+    Plain dataclasses compare (and would hash) every field, including the nested availability lists,
+    which makes them unhashable and slow to compare. The classes intentionally do not use __slots__:
+    jpyinterpreter falls back to slow attribute access on slotted objects, which cuts the score
+    calculation speed by more than an order of magnitude (see microbenchmark.benchmark_domain_footprint).
+    """
+    # Declared here too: jpyinterpreter creates the `id` field on this base class (used by __eq__/__hash__),
+    # and without the annotation the subclasses' PlanningId is lost, so the solver cannot look up
+    # the working objects (required by multithreaded solving and problem changes)
+    id: Annotated[str, PlanningId]
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, type(self)) and other.id == self.id
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        # Fields missing from older pickles (e.g., results/*/baseline.pkl) fall back to their defaults
+        for f in fields(self):
+            if f.name in state:
+                continue
+            if f.default is not MISSING:
+                state[f.name] = f.default
+            elif f.default_factory is not MISSING:
+                state[f.name] = f.default_factory()
+        self.__dict__.update(state)
+
+# hashed by identity, like the other problem facts: score explanations key their indictments by it
+@dataclass(eq=False)
 class ConstraintParameters:
     undesired_assignment_penalty:   int = 20    # Soft
     desired_assignment_reward:      int = 5     # Soft
@@ -32,8 +72,8 @@ class ConstraintParameters:
     def __str__(self):
         return f"ConstraintParameters"
 
-@dataclass
-class Shift():
+@dataclass(eq=False)
+class Shift(PlanningIdObject):
     id: Annotated[str, PlanningId]
     series: str
     day_of_week: str
@@ -44,9 +84,31 @@ class Shift():
     # Optional
     alias: str = "DEFAULT"
     shift_date: date = date(1900, 1, 1)
+    # Dense position in Timetable.shifts (set by Timetable.build_availability_index, -1 if not indexed)
+    index: int = -1
+    # Absolute [start, end) minutes from the start of week 0 and the Shift.index of the overlapping shifts
+    # (set by Timetable.build_availability_index, -1/empty if not indexed)
+    start_minute: int = -1
+    end_minute: int = -1
+    conflicting_indices: frozenset[int] = field(default_factory=frozenset)
 
     def __str__(self):
         return f'{self.series} {self.day_of_week} {self.start_time.strftime("%H:%M")} - week {self.week_id}'
+
+    def get_absolute_interval(self) -> Tuple[int, int]:
+        """Returns the [start, end) of the shift in minutes from the start of week 0 (Monday 00:00)."""
+        if self.start_minute >= 0:
+            return self.start_minute, self.end_minute
+
+        day = self.day_of_week[:3].title()
+        if day not in DAYS_OF_WEEK:
+            raise ValueError(f"Shift {self.id} has an unknown day of the week '{self.day_of_week}'")
+        day_start   = self.week_id * MINUTES_PER_WEEK + DAYS_OF_WEEK.index(day) * MINUTES_PER_DAY
+        start       = day_start + self.start_time.hour * 60 + self.start_time.minute
+        end         = day_start + self.end_time.hour * 60 + self.end_time.minute
+        if end <= start:    # the shift runs past midnight
+            end += MINUTES_PER_DAY
+        return start, end
     
     def is_from_the_same_series_as(self, other: 'Shift') -> bool:
         """Check if this shift is from the same series as another shift."""
@@ -58,54 +120,104 @@ class Shift():
         return end_time_dt - start_time_dt
     
     def overlaps_with_other_shift(self, other: 'Shift') -> bool:
-        if self.day_of_week == other.day_of_week:
-            if other.end_time <= self.end_time and other.end_time >= self.start_time:
-                return True
-            elif other.start_time <= self.end_time and other.start_time >= self.start_time:
-                return True
-        return False
-@dataclass    
-class TA():
+        """Check if the two shifts overlap in time (back-to-back shifts do not overlap)."""
+        if self.index >= 0 and other.index >= 0:
+            return other.index in self.conflicting_indices
+        start, end              = self.get_absolute_interval()
+        other_start, other_end  = other.get_absolute_interval()
+        return self.id != other.id and start < other_end and other_start < end
+
+@dataclass(eq=False)
+class TA(PlanningIdObject):
     id: Annotated[str, PlanningId]
     name: str
     required_shifts_per_semester: int
     skill_level: int
-    desired: Annotated[list[Shift], Field(default_factory=list)]
-    undesired: Annotated[list[Shift], Field(default_factory=list)]
-    unavailable: Annotated[list[Shift], Field(default_factory=list)]
+    desired: list[Shift]
+    undesired: list[Shift]
+    unavailable: list[Shift]
 
     # favourite_partners: list['TA'] = None
     is_grad_student: bool = True
     min_shifts_per_week: int = 0
     max_shifts_per_week: int = 2
+    # Dense position in Timetable.tas (set by Timetable.build_availability_index, -1 if not indexed)
+    index: int = -1
 
+    # Precomputed availability index (see build_availability_index)
+    #   *_series:  series with the same status in every week they run (e.g., "L01")
+    #   *_indices: Shift.index of the remaining shifts that are not covered by a series entry
+    is_indexed:             bool            = False
+    desired_series:         frozenset[str]  = field(default_factory=frozenset)
+    undesired_series:       frozenset[str]  = field(default_factory=frozenset)
+    unavailable_series:     frozenset[str]  = field(default_factory=frozenset)
+    desired_indices:        frozenset[int]  = field(default_factory=frozenset)
+    undesired_indices:      frozenset[int]  = field(default_factory=frozenset)
+    unavailable_indices:    frozenset[int]  = field(default_factory=frozenset)
     
     def __str__(self):
         return f'{self.name}'
     
     def get_status_for_shift(self, shift: Shift) -> str:
-        if shift in self.desired:
+        if self.is_desired_shift(shift):
             return '** Desired **'
-        if shift in self.undesired:
+        if self.is_undesired_shift(shift):
             return '>> Undesired <<'
-        if shift in self.unavailable:
+        if self.is_unavailable_shift(shift):
             return 'X Unavailable X'
         return 'Neutral'
     
     def is_available_for_shift(self, shift: Shift) -> bool:
-        return shift not in self.unavailable
+        return not self.is_unavailable_shift(shift)
+
+    # Constant-time lookups (fall back to list scans if the index was not built)
+    def is_desired_shift(self, shift: Shift) -> bool:
+        if self.is_indexed:
+            return shift.series in self.desired_series or shift.index in self.desired_indices
+        return shift in self.desired
+
+    def is_undesired_shift(self, shift: Shift) -> bool:
+        if self.is_indexed:
+            return shift.series in self.undesired_series or shift.index in self.undesired_indices
+        return shift in self.undesired
+
+    def is_unavailable_shift(self, shift: Shift) -> bool:
+        if self.is_indexed:
+            return shift.series in self.unavailable_series or shift.index in self.unavailable_indices
+        return shift in self.unavailable
+
+    def build_availability_index(self, index_by_shift_id: Dict[str, int], indices_by_series: Dict[str, frozenset[int]]) -> None:
+        """Compiles the desired/undesired/unavailable lists into series-level and shift-index sets.
+
+        A series goes into the series-level set when the TA has the same status for that series in every
+        week it runs. Only the leftover (week-specific) shifts are kept as integer indices.
+        """
+        def compile_status(shifts: List[Shift]) -> Tuple[frozenset[str], frozenset[int]]:
+            indices = {index_by_shift_id[shift.id] for shift in shifts if shift.id in index_by_shift_id}
+            series  = frozenset(shift.series for shift in shifts
+                                if shift.series in indices_by_series and indices_by_series[shift.series] <= indices)
+            for name in series:
+                indices -= indices_by_series[name]
+            return series, frozenset(indices)
+
+        self.desired_series,     self.desired_indices     = compile_status(self.desired)
+        self.undesired_series,   self.undesired_indices   = compile_status(self.undesired)
+        self.unavailable_series, self.unavailable_indices = compile_status(self.unavailable)
+        self.is_indexed = True
 
 
 
 @planning_entity
-@dataclass
-class ShiftAssignment():
+@dataclass(eq=False)
+class ShiftAssignment(PlanningIdObject):
     id: Annotated[str, PlanningId]
     shift: Shift
     assigned_ta: Annotated[TA | None,
-                        PlanningVariable, # allow unassigned: PlanningVariable(allows_unassigned=True) -> Constraint Streams filter out planning entities with a null planning variable by default. Use forEachIncludingUnassigned() to avoid such unwanted behaviour.
-                        Field(default=None)]
-    # pinned: Annotated[bool, PlanningPin] # Pin down planning entities with @PlanningPin
+                        PlanningVariable] # allow unassigned: PlanningVariable(allows_unassigned=True) -> Constraint Streams filter out planning entities with a null planning variable by default. Use forEachIncludingUnassigned() to avoid such unwanted behaviour.
+    # Dense position in Timetable.shift_assignments (set by Timetable.build_availability_index, -1 if not indexed)
+    index: int = -1
+    # Pinned assignments keep their assigned_ta during the solve (see hello_world.warm_start)
+    pinned: Annotated[bool, PlanningPin] = False
     
     def __str__(self):
         return f'assigning {self.shift.series} to {self.assigned_ta}'
@@ -138,21 +250,21 @@ class ShiftAssignment():
         if not self.is_assigned_a_ta():
             raise ValueError("Shift assignment is not valid. Ensure that both assigned_ta and shift are set.")   
          
-        return self.shift in self.assigned_ta.desired
+        return self.assigned_ta.is_desired_shift(self.shift)
     
     def is_undesired(self) -> bool:
         """Check if the shift assignment is undesired by the TA."""
         if not self.is_assigned_a_ta():
             raise ValueError("Shift assignment is not valid. Ensure that both assigned_ta and shift are set.") 
         
-        return self.shift in self.assigned_ta.undesired
+        return self.assigned_ta.is_undesired_shift(self.shift)
     
     def is_unavailable(self) -> bool:
         """Check if the shift assignment is unavailable for the TA."""
         if not self.is_assigned_a_ta():
             raise ValueError("Shift assignment is not valid. Ensure that both assigned_ta and shift are set.") 
         
-        return self.shift in self.assigned_ta.unavailable
+        return self.assigned_ta.is_unavailable_shift(self.shift)
     
     def has_the_same_ta(self, other: 'ShiftAssignment') -> bool:
         """Check if this assignment has the same TA as another assignment."""
@@ -196,79 +308,75 @@ class Timetable():
     shift_assignments: Annotated[List[ShiftAssignment],
                        PlanningEntityCollectionProperty]
     # score and solver status
-    solver_status: Annotated[SolverStatus | None, Field(default=None)]  = Field(default=None)
+    solver_status: SolverStatus | None = None
     score: Annotated[HardMediumSoftScore, PlanningScore] = field(default=None)
     # score: Annotated[BendableScore, PlanningScore(bendable_hard_levels_size=2, bendable_soft_levels_size=3)] # custom score levels
     def __str__(self):
         return f"timetable_{self.id} - {len(self.shifts)} shifts - {len(self.tas)} TAs - [{len(self.shift_assignments)} planning variables]"
 
 
-    def sanity_check(self, logger: logging.Logger) -> Tuple[bool, Dict[str, Dict[str, Dict[int, int]]]]:
+    # "Logger" only resolves for type checkers: Timefold translates the classes in the hints of the solution's
+    # methods to Java when it creates a SolverFactory, and the logging module's classes alone take about 8 seconds
+    def sanity_check(self, logger: "Logger") -> Tuple[bool, Dict[str, Dict[str, Dict[int, int]]]]:
+        """Logs the capacity analysis (see hello_world.capacity.analyze_capacity) and returns the sanity flag
+        with the unavailable/undesired/desired TA counts by series and week."""
+        from hello_world.capacity import analyze_capacity   # local import: capacity depends on this module
 
-        sanity          = True
-        count_tas       = len(self.tas)
-        count_shifts    = len(self.shifts)
-        logger.info(f"\tProblem has {count_tas} TAs and {count_shifts} shifts.")
+        report = analyze_capacity(self)
+        report.log(logger)
 
-        # (1) Check if there are enough TAs for the shifts
-        total_required_tas              = sum(shift.required_tas for shift in self.shifts)
-        total_available_tas_per_week    = sum(ta.max_shifts_per_week for ta in self.tas)
-        
-        num_of_weeks = len(set(shift.week_id for shift in self.shifts))
-        total_available_tas = total_available_tas_per_week * num_of_weeks
-
-        if total_required_tas > total_available_tas:
-            logger.warning(f"\t⚠️  SANITY CHECK WARNING [TMTBL.workforce.count]: Total required TAs ({total_required_tas}) over the planning problem exceeds anticipated TA duties ({total_available_tas}).")
-            logger.warning(f"\t\tCount_TAs: {count_tas}, Num_of_weeks: {num_of_weeks}, Total_available_TAs_per_week: {total_available_tas_per_week}")
-            logger.warning(f"\t\tConsider increasing the number of TAs or their maximum shifts per week, or reducing the required TAs per shift.")
-            sanity = False
-
-        # (2) Check if too many TAs are unavailable for any shift
-        count_unavailable_by_series_week_id : Dict[str, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
-        count_undesired_by_series_week_id : Dict[str, Dict[int, int]]   = defaultdict(lambda: defaultdict(int))
-        count_desired_by_series_week_id : Dict[str, Dict[int, int]]     = defaultdict(lambda: defaultdict(int))
-
-        # Populate the counts
-        for ta in self.tas:
-            for shift in ta.unavailable:
-                count_unavailable_by_series_week_id[shift.series][shift.week_id] += 1
-            for shift in ta.undesired:
-                count_undesired_by_series_week_id[shift.series][shift.week_id] += 1
-            for shift in ta.desired:
-                count_desired_by_series_week_id[shift.series][shift.week_id] += 1
-        
-        # Analyze the counts for each shift
-        for shifts in self.shifts:
-            series  = shifts.series
-            week_id = shifts.week_id
-            count_unavailable = count_unavailable_by_series_week_id.get(series, {}).get(week_id, 0)
-            count_undesired   = count_undesired_by_series_week_id.get(series, {}).get(week_id, 0)
-            count_desired     = count_desired_by_series_week_id.get(series, {}).get(week_id, 0)
-            # UNAVAILABLE CHECKS
-            if count_unavailable == count_tas:
-                logger.warning(f"\t⚠️  SANITY CHECK WARNING [TMTBL.shifts.unavailable]: All TAs are unavailable for shift series '{series}' in week '{week_id}'.")
-                sanity = False
-            elif shifts.required_tas > count_tas - count_unavailable:
-                logger.warning(f"\t⚠️  SANITY CHECK WARNING [TMTBL.shifts.unavailable]: Only {count_tas - count_unavailable} TAs are available for shift series '{series}' in week '{week_id}', but {shifts.required_tas} are required.")
-                sanity = False
-            # UNDESIRED CHECKS
-            if count_undesired == count_tas:
-                logger.warning(f"\t⚠️  SANITY CHECK WARNING [TMTBL.shifts.undesired]: All TAs are undesired for shift series '{series}' in week '{week_id}'.")
-                sanity = False
-            elif shifts.required_tas > count_tas - count_undesired:
-                logger.warning(f"\t⚠️  SANITY CHECK WARNING [TMTBL.shifts.undesired]: Only {count_tas - count_undesired} TAs find shift series '{series}' in week '{week_id}' desired/neutral, but {shifts.required_tas} are required.")
-                sanity = False
-            # DESIRED CHECKS
-            if count_desired == 0:
-                logger.warning(f"\t⚠️  SANITY CHECK WARNING [TMTBL.shifts.desired]: No TAs have shift series '{series}' in week '{week_id}' as desired.")
-                # sanity = False
-            
-        return sanity, {
-            "unavailable": count_unavailable_by_series_week_id,
-            "undesired": count_undesired_by_series_week_id,
-            "desired": count_desired_by_series_week_id
-            }
+        count_by_series_week_id: Dict[str, Dict[str, Dict[int, int]]] = {status: defaultdict(lambda: defaultdict(int)) for status in ["unavailable", "undesired", "desired"]}
+        for shift, available, willing, desired in zip(self.shifts, report.shift_available_tas, report.shift_willing_tas, report.shift_desired_tas):
+            count_by_series_week_id["unavailable"][shift.series][shift.week_id] += report.num_tas - available
+            count_by_series_week_id["undesired"][shift.series][shift.week_id]   += available - willing
+            count_by_series_week_id["desired"][shift.series][shift.week_id]     += desired
+        return report.is_sane, count_by_series_week_id
     
+    def build_availability_index(self) -> None:
+        """Assigns dense shift/TA/assignment indices and precomputes each TA's availability index
+        and the shift conflict index (absolute shift times and overlapping shifts).
+
+        Call once the shifts and TAs are final (i.e., at problem load, before solving); the
+        constraint streams then look availability up in constant time instead of scanning lists.
+        """
+        index_by_shift_id: Dict[str, int]       = {}
+        indices_by_series: Dict[str, set[int]]  = defaultdict(set)
+        for index, shift in enumerate(self.shifts):
+            shift.index = index
+            index_by_shift_id[shift.id] = index
+            indices_by_series[shift.series].add(index)
+
+        for index, shift_assignment in enumerate(self.shift_assignments):
+            shift_assignment.index = index
+        self.build_conflict_index()
+
+        frozen_indices_by_series = {series: frozenset(indices) for series, indices in indices_by_series.items()}
+        for index, ta in enumerate(self.tas):
+            ta.index = index
+            ta.build_availability_index(index_by_shift_id=index_by_shift_id, indices_by_series=frozen_indices_by_series)
+
+    def build_conflict_index(self) -> None:
+        """Sets the absolute [start, end) minutes of every shift and the indices of the shifts overlapping it.
+
+        Sweeps the shifts by start time, so only the overlapping pairs are compared (O(n log n + conflicts)).
+        Requires the dense Shift.index (called by build_availability_index).
+        """
+        for shift in self.shifts:
+            shift.start_minute = -1
+            shift.start_minute, shift.end_minute = shift.get_absolute_interval()
+
+        conflicts: Dict[int, set[int]] = {shift.index: set() for shift in self.shifts}
+        active: List[Shift] = []
+        for shift in sorted(self.shifts, key=lambda shift: shift.start_minute):
+            active = [other for other in active if other.end_minute > shift.start_minute]
+            for other in active:
+                conflicts[shift.index].add(other.index)
+                conflicts[other.index].add(shift.index)
+            active.append(shift)
+
+        for shift in self.shifts:
+            shift.conflicting_indices = frozenset(conflicts[shift.index])
+
     def re_generate_empty_shift_assignments(self, shifts: List[Shift]) -> List[ShiftAssignment]:
         shift_assignments = []
         id_gen = id_generator()
@@ -0,0 +1,201 @@
+import logging
+import numpy as np
+
+from collections    import deque
+from dataclasses    import dataclass
+from typing         import List, Optional
+
+# Custom Imports
+from hello_world.domain     import Timetable
+from hello_world.problem_ir import CompiledProblem, UNAVAILABLE
+
+class FlowNetwork:
+    """Residual graph solved with Dinic's algorithm (edge `e` and its reverse edge `e ^ 1` are stored side by side)."""
+    def __init__(self, num_nodes: int):
+        self.adjacency: List[List[int]] = [[] for _ in range(num_nodes)]
+        self.head:      List[int]       = []
+        self.capacity:  List[int]       = []
+
+    def add_edge(self, tail: int, head: int, capacity: int) -> int:
+        edge = len(self.head)
+        self.adjacency[tail].append(edge)
+        self.head.append(head)
+        self.capacity.append(capacity)
+        self.adjacency[head].append(edge + 1)
+        self.head.append(tail)
+        self.capacity.append(0)
+        return edge
+
+    def flow_on(self, edge: int) -> int:
+        return self.capacity[edge ^ 1]
+
+    def max_flow(self, source: int, sink: int) -> int:
+        flow = 0
+        while True:
+            level = self._levels(source)
+            if level[sink] < 0:
+                return flow
+            next_edge = [0] * len(self.adjacency)
+            while True:
+                pushed = self._augment(source, sink, level, next_edge)
+                if pushed == 0:
+                    break
+                flow += pushed
+
+    def _levels(self, source: int) -> List[int]:
+        level = [-1] * len(self.adjacency)
+        level[source] = 0
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            for edge in self.adjacency[node]:
+                head = self.head[edge]
+                if self.capacity[edge] > 0 and level[head] < 0:
+                    level[head] = level[node] + 1
+                    queue.append(head)
+        return level
+
+    def _augment(self, source: int, sink: int, level: List[int], next_edge: List[int]) -> int:
+        """Pushes flow along one shortest augmenting path (iterative DFS on the level graph)."""
+        path: List[int] = []
+        node = source
+        while True:
+            if node == sink:
+                pushed = min(self.capacity[edge] for edge in path)
+                for edge in path:
+                    self.capacity[edge]     -= pushed
+                    self.capacity[edge ^ 1] += pushed
+                return pushed
+
+            edges = self.adjacency[node]
+            while next_edge[node] < len(edges):
+                edge = edges[next_edge[node]]
+                if self.capacity[edge] > 0 and level[self.head[edge]] == level[node] + 1:
+                    break
+                next_edge[node] += 1
+            else:
+                # dead end: retreat and skip the edge that led here
+                if not path:
+                    return 0
+                level[node] = -1
+                node = self.head[path.pop() ^ 1]
+                next_edge[node] += 1
+                continue
+            path.append(edge)
+            node = self.head[edge]
+
+@dataclass
+class FeasibilityResult:
+    """Outcome of the max-flow pre-check (see check_feasibility)."""
+    is_feasible: bool               # every shift staffed and every TA at their semester requirement, within availability
+    respects_weekly_bounds: bool    # ... and nobody above their max_shifts_per_week
+    demand: int                     # TA slots to fill
+    max_flow: int                   # slots filled by the best flow found
+    slot_ta: np.ndarray             # TA index per slot (-1 if left unassigned)
+
+    def __str__(self):
+        status = "feasible" if self.is_feasible else "infeasible"
+        weekly = "within" if self.respects_weekly_bounds else "not within"
+        return f"{status} ({self.max_flow}/{self.demand} slots, {weekly} the weekly bounds)"
+
+def _solve_flow(problem: CompiledProblem, fixed_slot_ta: np.ndarray, weekly_bounds: bool) -> tuple[int, np.ndarray]:
+    """Builds and solves source -> shift -> (TA, week) -> TA -> sink; returns (flow, slot_ta)."""
+    num_shifts, num_tas, num_of_weeks = problem.num_shifts, problem.num_tas, problem.num_of_weeks
+    shift_node      = lambda s: 1 + s
+    ta_week_node    = lambda t, w: 1 + num_shifts + t * num_of_weeks + w
+    ta_node         = lambda t: 1 + num_shifts + num_tas * num_of_weeks + t
+    source, sink    = 0, 1 + num_shifts + num_tas * num_of_weeks + num_tas
+    network         = FlowNetwork(sink + 1)
+
+    # the fixed (e.g., pinned) assignments use up their seats and TA capacity before the flow starts
+    fixed           = fixed_slot_ta >= 0
+    fixed_shift     = problem.slot_shift[fixed]
+    fixed_ta        = fixed_slot_ta[fixed]
+    seats_left      = problem.shift_required_tas - np.bincount(fixed_shift, minlength=num_shifts)
+    semester_left   = problem.ta_required_per_semester - np.bincount(fixed_ta, minlength=num_tas)
+    week_load       = np.zeros((num_tas, num_of_weeks), dtype=np.int64)
+    np.add.at(week_load, (fixed_ta, problem.shift_week[fixed_shift]), 1)
+    taken           = np.zeros((num_tas, num_shifts), dtype=bool)
+    taken[fixed_ta, fixed_shift] = True
+    shifts_per_week = np.bincount(problem.shift_week, minlength=num_of_weeks)
+
+    # shift -> (TA, week) edges, desired TAs first so the augmenting paths favour them
+    candidate_order = np.argsort(-problem.availability, axis=0, kind="stable")
+    edges: List[tuple[int, int, int]] = []
+    for s in range(num_shifts):
+        network.add_edge(source, shift_node(s), max(0, int(seats_left[s])))
+        week = int(problem.shift_week[s])
+        for t in candidate_order[:, s].tolist():
+            if problem.availability[t, s] == UNAVAILABLE or taken[t, s]:
+                continue
+            edges.append((network.add_edge(shift_node(s), ta_week_node(t, week), 1), s, t))
+
+    for t in range(num_tas):
+        for w in range(num_of_weeks):
+            bound = int(problem.ta_max_per_week[t]) if weekly_bounds else int(shifts_per_week[w])
+            network.add_edge(ta_week_node(t, w), ta_node(t), max(0, bound - int(week_load[t, w])))
+        network.add_edge(ta_node(t), sink, max(0, int(semester_left[t])))
+
+    flow = network.max_flow(source, sink)
+
+    # fill the free slots of every shift with the TAs the flow routed to it
+    slot_ta = fixed_slot_ta.copy()
+    free_slots_by_shift: List[List[int]] = [[] for _ in range(num_shifts)]
+    for slot in np.flatnonzero(~fixed).tolist():
+        free_slots_by_shift[problem.slot_shift[slot]].append(slot)
+    for edge, s, t in edges:
+        if network.flow_on(edge) and free_slots_by_shift[s]:
+            slot_ta[free_slots_by_shift[s].pop(0)] = t
+    return flow, slot_ta
+
+def current_slot_ta(timetable: Timetable) -> np.ndarray:
+    """TA index of every slot of the timetable (-1 if unassigned), following the dense TA indices."""
+    index_by_ta_id = {ta.id: index for index, ta in enumerate(timetable.tas)}
+    return np.array([index_by_ta_id[assignment.assigned_ta.id] if assignment.assigned_ta is not None else -1
+                     for assignment in timetable.shift_assignments], dtype=np.int64)
+
+def check_feasibility(problem: Timetable | CompiledProblem, fixed_slot_ta: Optional[np.ndarray] = None) -> FeasibilityResult:
+    """Decides with a max-flow whether the hard constraints can all be met and builds an assignment that meets them.
+
+    Seats flow from the shifts to TA-week capacity nodes (unavailable edges removed, one seat per TA and shift),
+    then to the TAs, capped by their semester requirement. The flow is first solved with the max_shifts_per_week
+    caps and, if it cannot staff everything, again without them (the weekly bounds are medium constraints).
+    The assignments in `fixed_slot_ta` (by default, the ones already in the timetable) are kept as they are.
+    """
+    if isinstance(problem, Timetable):
+        fixed_slot_ta = current_slot_ta(problem) if fixed_slot_ta is None else fixed_slot_ta
+        problem = CompiledProblem.from_timetable(problem)
+    elif fixed_slot_ta is None:
+        fixed_slot_ta = np.full(problem.num_slots, -1, dtype=np.int64)
+
+    demand          = int(problem.shift_required_tas.sum())
+    num_fixed       = int((fixed_slot_ta >= 0).sum())
+    semester_total  = int(problem.ta_required_per_semester.sum())
+
+    flow, slot_ta = _solve_flow(problem, fixed_slot_ta, weekly_bounds=True)
+    respects_weekly_bounds = flow + num_fixed == demand == semester_total
+    if not respects_weekly_bounds:
+        relaxed_flow, relaxed_slot_ta = _solve_flow(problem, fixed_slot_ta, weekly_bounds=False)
+        if relaxed_flow > flow:
+            flow, slot_ta = relaxed_flow, relaxed_slot_ta
+
+    return FeasibilityResult(is_feasible            = flow + num_fixed == demand == semester_total,
+                             respects_weekly_bounds = respects_weekly_bounds,
+                             demand                 = demand,
+                             max_flow               = flow + num_fixed,
+                             slot_ta                = slot_ta)
+
+def apply_warm_start(timetable: Timetable, result: FeasibilityResult, logger: Optional[logging.Logger] = None) -> int:
+    """Loads the flow assignment into the unassigned ShiftAssignment.assigned_ta; returns the number of slots set.
+
+    The construction heuristic only initializes the slots left unassigned, so a complete assignment makes
+    the local search start from it directly.
+    """
+    assigned = 0
+    for assignment, ta_index in zip(timetable.shift_assignments, result.slot_ta.tolist()):
+        if assignment.assigned_ta is None and ta_index >= 0:
+            assignment.assigned_ta = timetable.tas[ta_index]
+            assigned += 1
+    if logger:
+        logger.info(f"\tWarm start: {assigned} of {len(timetable.shift_assignments)} shift assignments initialized from the max-flow assignment.")
+    return assigned
@@ -0,0 +1,71 @@
+import os
+import re
+import time
+import hashlib
+import logging
+import importlib.metadata
+
+from pathlib    import Path
+from typing     import List, Optional
+
+import jpype
+import timefold.solver
+from _jpyinterpreter import get_default_jvm_path
+
+# On-disk cache of the JVM classes Timefold loads at start-up (the AOT cache of JDK 25+, see JEP 483/514/515).
+#
+# The classes jpyinterpreter generates from the domain and the constraints cannot be cached: they are defined at
+# run time and bound to the live Python objects. What the cache keeps is the JVM's work on the Timefold,
+# jpyinterpreter and ASM jars (loading, linking, method profiles), about 1-2 seconds per process.
+# The first process with a given JVM and Timefold version records the cache when it exits; the next ones load it.
+# Set TA_SCHEDULER_JVM_CACHE=0 to start the JVM without it.
+CACHE_DIR               = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "ta-scheduler"
+MIN_JAVA_VERSION        = 25    # -XX:AOTCacheOutput
+STALE_LOCK_SECONDS      = 600   # a lock older than this was left by a process that could not record the cache
+
+logger = logging.getLogger(__name__)
+
+def java_feature_version(jvm_path: str) -> int:
+    """The feature version (e.g., 25) of the JVM library at `jvm_path`, from the `release` file of its Java home; 0 if unknown."""
+    release_path = Path(jvm_path).parents[2] / "release"    # <java home>/lib/server/libjvm.so
+    if not release_path.exists():
+        return 0
+    match = re.search(r'JAVA_VERSION="(\d+)', release_path.read_text())
+    return int(match.group(1)) if match else 0
+
+def jvm_cache_path(jvm_path: str) -> Path:
+    """The cache of the JVM at `jvm_path` and the Timefold jars on the class path (another JVM, Timefold version or
+    environment gets another file)."""
+    key = f"{jvm_path}:{os.stat(jvm_path).st_mtime_ns}:{Path(timefold.solver.__file__).parent}:{importlib.metadata.version('timefold')}"
+    return CACHE_DIR / f"jvm-{hashlib.sha256(key.encode()).hexdigest()[:16]}.aot"
+
+def jvm_cache_options(cache_path: Path) -> List[str]:
+    """The JVM options that load `cache_path`, or that record it at exit if it does not exist and no other
+    process is recording it."""
+    quiet       = ["-Xlog:aot*=off", "-Xlog:cds*=off"]     # classes the cache cannot hold are logged as warnings
+    lock_path   = cache_path.with_suffix(".lock")
+    if cache_path.exists():
+        lock_path.unlink(missing_ok=True)
+        return quiet + [f"-XX:AOTCache={cache_path}"]
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    if lock_path.exists() and time.time() - lock_path.stat().st_mtime > STALE_LOCK_SECONDS:
+        lock_path.unlink(missing_ok=True)
+    try:
+        os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+    except FileExistsError:
+        return []
+    return quiet + [f"-XX:AOTCacheOutput={cache_path}"]
+
+def start_jvm(jvm_path: Optional[str] = None) -> None:
+    """Starts the JVM with the class cache; does nothing if the JVM is already running."""
+    if jpype.isJVMStarted():
+        return
+    jvm_path = jvm_path or get_default_jvm_path()
+    options  = []
+    if os.environ.get("TA_SCHEDULER_JVM_CACHE") != "0" and java_feature_version(jvm_path) >= MIN_JAVA_VERSION:
+        try:
+            options = jvm_cache_options(jvm_cache_path(jvm_path))
+        except OSError as error:    # e.g., a read-only cache directory
+            logger.warning(f"Starting the JVM without the class cache: {error}")
+    timefold.solver.init(jvm_path, *options)
@@ -0,0 +1,337 @@
+import logging
+import time
+import numpy as np
+
+from copy           import deepcopy
+from dataclasses    import dataclass
+from typing         import List, Optional, Tuple
+
+from timefold.solver.score import HardMediumSoftScore
+
+# Custom Imports
+from hello_world.domain         import Timetable, ConstraintParameters
+from hello_world.problem_ir     import CompiledProblem, DESIRED, UNDESIRED, UNAVAILABLE
+from hello_world.feasibility    import check_feasibility, current_slot_ta
+from hello_world.scoring        import BatchScorer, CONSTRAINT_NAMES_BY_VERSION, format_score
+
+SUPPORTED_CONSTRAINT_VERSIONS = list(CONSTRAINT_NAMES_BY_VERSION)
+
+Score = Tuple[int, int, int]    # (hard, medium, soft), compared lexicographically like HardMediumSoftScore
+
+def _weekly_penalty(count: np.ndarray, min_per_week: np.ndarray, max_per_week: np.ndarray) -> np.ndarray:
+    """Medium penalty of TAs working `count` shifts in a week (weeks without shifts are not penalized)."""
+    return np.where(count > 0, np.maximum(count - max_per_week, 0) + np.maximum(min_per_week - count, 0), 0)
+
+def _series_reward(count: np.ndarray, reward: int) -> np.ndarray:
+    """Soft reward of TAs working `count` shifts of the same series (tabriz edition)."""
+    return np.maximum(count - 1, 0) * reward
+
+class IncrementalScoreCalculator:
+    """Keeps the score of an assignment (one TA index per slot) up to date under change and swap moves.
+
+    The rules are the ones of TimetableConstraintGenBasic ('default') and TimetableConstraintGenTabrizEdition
+    ('tabriz'). The assignment counts per (TA, shift), (TA, week) and (TA, series) make the delta of a move a
+    few array lookups, so the deltas of a whole batch of moves are computed at once. Every slot is expected
+    to be assigned, so the per-shift staffing is constant under the moves.
+    """
+    def __init__(self, problem: CompiledProblem, constraint_parameters: ConstraintParameters, constraint_version: str = "default"):
+        if constraint_version not in SUPPORTED_CONSTRAINT_VERSIONS:
+            raise ValueError(f"Invalid constraint version: {constraint_version}. Available versions: {SUPPORTED_CONSTRAINT_VERSIONS}")
+        self.problem            = problem
+        self.constraint_version = constraint_version
+        self.tabriz             = constraint_version == "tabriz"
+
+        self.slot_shift     = problem.slot_shift.astype(np.int64)
+        self.shift_week     = problem.shift_week.astype(np.int64)
+        self.shift_series   = problem.shift_series.astype(np.int64)
+        self.required       = problem.ta_required_per_semester.astype(np.int64)
+        self.min_per_week   = problem.ta_min_per_week.astype(np.int64)
+        self.max_per_week   = problem.ta_max_per_week.astype(np.int64)
+        self.unavailable    = (problem.availability == UNAVAILABLE).astype(np.int64)
+        self.preference     = (np.where(problem.availability == DESIRED, constraint_parameters.desired_assignment_reward, 0)
+                               - np.where(problem.availability == UNDESIRED, constraint_parameters.undesired_assignment_penalty, 0)).astype(np.int64)
+        self.series_reward  = constraint_parameters.same_sereis_assignment_reward if self.tabriz else 0
+        # conflict[i, j]: shifts i != j overlap in time (tabriz edition)
+        if self.tabriz:
+            start, end      = problem.shift_start, problem.shift_end
+            self.conflict   = ((start[:, None] < end[None, :]) & (start[None, :] < end[:, None])).astype(np.int64)
+            np.fill_diagonal(self.conflict, 0)
+
+        # full (re)computations of the score
+        self.scorer = BatchScorer(problem, constraint_parameters, constraint_version)
+
+        self.slot_ta = np.full(problem.num_slots, -1, dtype=np.int64)
+        self.score: Score = (0, 0, 0)
+
+    def load(self, slot_ta: np.ndarray) -> Score:
+        """Sets the assignment (-1: unassigned) and computes its score from scratch."""
+        problem         = self.problem
+        self.slot_ta    = np.asarray(slot_ta, dtype=np.int64).copy()
+        assigned        = self.slot_ta >= 0
+        tas, shifts     = self.slot_ta[assigned], self.slot_shift[assigned]
+
+        self.ta_shift       = np.zeros((problem.num_tas, problem.num_shifts), dtype=np.int64)
+        self.ta_week        = np.zeros((problem.num_tas, problem.num_of_weeks), dtype=np.int64)
+        self.ta_series      = np.zeros((problem.num_tas, len(problem.series_names)), dtype=np.int64)
+        np.add.at(self.ta_shift, (tas, shifts), 1)
+        np.add.at(self.ta_week, (tas, self.shift_week[shifts]), 1)
+        np.add.at(self.ta_series, (tas, self.shift_series[shifts]), 1)
+        self.ta_total       = self.ta_shift.sum(axis=1)
+        self.ta_excess      = np.maximum(self.ta_shift - 1, 0).sum(axis=1)   # duplicate assignments
+        self.ta_unavailable = (self.ta_shift * self.unavailable).sum(axis=1)
+
+        self.score = self.calculate_score()
+        return self.score
+
+    def calculate_score(self) -> Score:
+        """Score of the loaded assignment, computed from the counts (not incrementally)."""
+        hard, medium, soft = self.scorer.score_counts(self.ta_shift).scores[0].tolist()
+        return (hard, medium, soft)
+
+    # ----------------------------
+    # Move deltas
+    # ----------------------------
+    def _ta_deltas(self, tas: np.ndarray, shift_out: np.ndarray, shift_in: np.ndarray) -> np.ndarray:
+        """Score deltas [n, 3] of each TA dropping a slot of `shift_out` and taking one of `shift_in` (-1: none).
+
+        The arrays broadcast against each other; shift_out and shift_in differ wherever both are set.
+        """
+        tas, shift_out, shift_in = np.broadcast_arrays(tas, shift_out, shift_in)
+        has_out, has_in = (shift_out >= 0).astype(np.int64), (shift_in >= 0).astype(np.int64)
+        s_out, s_in     = np.maximum(shift_out, 0), np.maximum(shift_in, 0)
+        count_out, count_in = self.ta_shift[tas, s_out], self.ta_shift[tas, s_in]
+
+        # hard
+        excess      = self.ta_excess[tas]
+        new_excess  = excess - has_out * (count_out > 1) + has_in * (count_in >= 1)
+        unavailable     = self.ta_unavailable[tas]
+        new_unavailable = unavailable - has_out * self.unavailable[tas, s_out] + has_in * self.unavailable[tas, s_in]
+        total, required = self.ta_total[tas], self.required[tas]
+        new_total       = total - has_out + has_in
+        hard = -((new_excess > 0).astype(np.int64) - (excess > 0)
+                 + new_unavailable ** 2 - unavailable ** 2
+                 + np.abs(new_total - required) - np.abs(total - required))
+
+        # medium
+        min_per_week, max_per_week = self.min_per_week[tas], self.max_per_week[tas]
+        week_out, week_in   = self.shift_week[s_out], self.shift_week[s_in]
+        count_week_out      = self.ta_week[tas, week_out]
+        count_week_in       = self.ta_week[tas, week_in]
+        medium = -(has_out * (_weekly_penalty(count_week_out - 1, min_per_week, max_per_week) - _weekly_penalty(count_week_out, min_per_week, max_per_week))
+                   + has_in * (_weekly_penalty(count_week_in + 1, min_per_week, max_per_week) - _weekly_penalty(count_week_in, min_per_week, max_per_week)))
+        medium = np.where(has_out & has_in & (week_out == week_in), 0, medium)
+
+        # soft
+        soft = has_in * self.preference[tas, s_in] - has_out * self.preference[tas, s_out]
+
+        if self.tabriz:
+            counts  = self.ta_shift[tas]
+            hard   -= (has_in * ((counts * self.conflict[s_in]).sum(axis=1) - has_out * self.conflict[s_in, s_out])
+                       - has_out * (counts * self.conflict[s_out]).sum(axis=1))
+            series_out, series_in   = self.shift_series[s_out], self.shift_series[s_in]
+            count_series_out        = self.ta_series[tas, series_out]
+            count_series_in         = self.ta_series[tas, series_in]
+            series = (has_out * (_series_reward(count_series_out - 1, self.series_reward) - _series_reward(count_series_out, self.series_reward))
+                      + has_in * (_series_reward(count_series_in + 1, self.series_reward) - _series_reward(count_series_in, self.series_reward)))
+            soft += np.where(has_out & has_in & (series_out == series_in), 0, series)
+
+        return np.stack([hard, medium, soft], axis=1)
+
+    def change_deltas(self, slot: int, candidates: np.ndarray) -> np.ndarray:
+        """Score deltas [len(candidates), 3] of assigning `slot` to each candidate TA (all different from its TA)."""
+        shift   = self.slot_shift[slot]
+        deltas  = self._ta_deltas(candidates, -1, shift)
+        if self.slot_ta[slot] >= 0:
+            deltas += self._ta_deltas(np.array([self.slot_ta[slot]]), shift, -1)
+        return deltas
+
+    def swap_deltas(self, slot: int, partners: np.ndarray) -> np.ndarray:
+        """Score deltas [len(partners), 3] of swapping the TAs of `slot` and each partner slot.
+
+        The partners hold another TA than `slot`, on another shift.
+        """
+        shift, partner_shifts = self.slot_shift[slot], self.slot_shift[partners]
+        return (self._ta_deltas(self.slot_ta[slot], shift, partner_shifts)
+                + self._ta_deltas(self.slot_ta[partners], partner_shifts, shift))
+
+    # ----------------------------
+    # Moves
+    # ----------------------------
+    def _update_counts(self, ta: int, slot: int, sign: int) -> None:
+        shift = self.slot_shift[slot]
+        self.ta_excess[ta]      += int(self.ta_shift[ta, shift] >= 1) if sign > 0 else -int(self.ta_shift[ta, shift] > 1)
+        self.ta_shift[ta, shift]                        += sign
+        self.ta_week[ta, self.shift_week[shift]]        += sign
+        self.ta_series[ta, self.shift_series[shift]]    += sign
+        self.ta_total[ta]       += sign
+        self.ta_unavailable[ta] += sign * self.unavailable[ta, shift]
+
+    def change(self, slot: int, ta: int, delta: Score) -> None:
+        """Assigns `slot` to `ta`; `delta` is the move's score delta (from change_deltas)."""
+        if self.slot_ta[slot] >= 0:
+            self._update_counts(self.slot_ta[slot], slot, -1)
+        self._update_counts(ta, slot, +1)
+        self.slot_ta[slot] = ta
+        self.score = tuple(int(score + change) for score, change in zip(self.score, delta))
+
+    def swap(self, slot: int, partner: int, delta: Score) -> None:
+        """Swaps the TAs of `slot` and `partner`; `delta` is the move's score delta (from swap_deltas)."""
+        ta, partner_ta = self.slot_ta[slot], self.slot_ta[partner]
+        for moved_slot, old_ta, new_ta in [(slot, ta, partner_ta), (partner, partner_ta, ta)]:
+            self._update_counts(old_ta, moved_slot, -1)
+            self._update_counts(new_ta, moved_slot, +1)
+            self.slot_ta[moved_slot] = new_ta
+        self.score = tuple(int(score + change) for score, change in zip(self.score, delta))
+
+@dataclass
+class LocalSearchResult:
+    """Statistics of a local search run."""
+    score: Score
+    steps: int
+    accepted_moves: int
+    evaluated_moves: int
+    seconds: float
+
+    @property
+    def moves_per_second(self) -> float:
+        return self.evaluated_moves / self.seconds if self.seconds > 0 else 0.0
+
+    def __str__(self):
+        return (f"{format_score(*self.score)} after {self.steps} steps ({self.accepted_moves} accepted) in {self.seconds:.1f} seconds "
+                f"- {self.moves_per_second:,.0f} moves/s")
+
+class LateAcceptanceLocalSearch:
+    """Late acceptance hill climbing over the slots' TA indices.
+
+    Each step draws a slot and evaluates, in one batch, either its change move to every other TA or its swap
+    move with `swap_batch_size` random slots, and takes the best one. The move is accepted when it is not worse
+    than the current score or than the score `late_acceptance_size` steps ago.
+    """
+    def __init__(self,
+                 calculator: IncrementalScoreCalculator,
+                 movable: np.ndarray,
+                 rng: np.random.Generator,
+                 late_acceptance_size: int = 400,
+                 swap_batch_size: int = 64,
+                 change_probability: float = 0.5):
+        self.calculator             = calculator
+        self.movable_slots          = np.flatnonzero(movable)
+        self.rng                    = rng
+        self.late_acceptance_size   = late_acceptance_size
+        self.swap_batch_size        = swap_batch_size
+        self.change_probability     = change_probability
+
+    def run(self, seconds: float, unimproved_seconds: Optional[float] = None, max_steps: Optional[int] = None) -> Tuple[np.ndarray, LocalSearchResult]:
+        """Runs until a limit is hit and returns the best assignment found with the run statistics."""
+        calculator, rng = self.calculator, self.rng
+        slots           = self.movable_slots
+        all_tas         = np.arange(calculator.problem.num_tas)
+
+        current: Score      = calculator.score
+        best: Score         = current
+        best_slot_ta        = calculator.slot_ta.copy()
+        history: List[Score]= [current] * self.late_acceptance_size
+        steps = accepted = evaluated = 0
+
+        start_time = last_improvement = time.perf_counter()
+        while len(slots) > 0 and len(all_tas) > 1:
+            now = time.perf_counter()
+            if (now - start_time >= seconds
+                or (unimproved_seconds is not None and now - last_improvement >= unimproved_seconds)
+                or (max_steps is not None and steps >= max_steps)):
+                break
+
+            slot        = slots[rng.integers(len(slots))]
+            change_move = rng.random() < self.change_probability
+            if change_move:
+                targets = all_tas[all_tas != calculator.slot_ta[slot]]
+                deltas  = calculator.change_deltas(slot, targets)
+            else:
+                targets = slots[rng.integers(len(slots), size=self.swap_batch_size)]
+                targets = targets[(calculator.slot_ta[targets] != calculator.slot_ta[slot])
+                                  & (calculator.slot_shift[targets] != calculator.slot_shift[slot])]
+                deltas  = calculator.swap_deltas(slot, targets)
+
+            if len(targets):
+                evaluated += len(targets)
+                # best move of the batch (random tie-break)
+                pick        = np.lexsort((rng.random(len(targets)), deltas[:, 2], deltas[:, 1], deltas[:, 0]))[-1]
+                delta       = tuple(int(change) for change in deltas[pick])
+                candidate   = tuple(score + change for score, change in zip(current, delta))
+                if candidate >= current or candidate >= history[steps % self.late_acceptance_size]:
+                    if change_move:
+                        calculator.change(slot, targets[pick], delta)
+                    else:
+                        calculator.swap(slot, targets[pick], delta)
+                    current = candidate
+                    accepted += 1
+                    if current > best:
+                        best, best_slot_ta, last_improvement = current, calculator.slot_ta.copy(), now
+            history[steps % self.late_acceptance_size] = current
+            steps += 1
+
+        result = LocalSearchResult(score=best, steps=steps, accepted_moves=accepted, evaluated_moves=evaluated,
+                                   seconds=time.perf_counter() - start_time)
+        return best_slot_ta, result
+
+def construct_initial_assignment(problem: CompiledProblem, slot_ta: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Assigns every unassigned slot (-1), keeping the assigned ones.
+
+    Uses the max-flow assignment when one meets the hard constraints (see hello_world.feasibility); otherwise
+    each slot greedily gets an available TA not yet on the shift with the most shifts left to reach their
+    semester requirement.
+    """
+    result = check_feasibility(problem, fixed_slot_ta=slot_ta)
+    if result.is_feasible:
+        return result.slot_ta.astype(np.int64)
+
+    slot_ta     = np.asarray(slot_ta, dtype=np.int64).copy()
+    assigned    = slot_ta >= 0
+    remaining   = problem.ta_required_per_semester - np.bincount(slot_ta[assigned], minlength=problem.num_tas)
+    on_shift    = np.zeros((problem.num_tas, problem.num_shifts), dtype=bool)
+    on_shift[slot_ta[assigned], problem.slot_shift[assigned]] = True
+    for slot in np.flatnonzero(~assigned):
+        shift       = problem.slot_shift[slot]
+        priority    = remaining + rng.random(problem.num_tas)   # random tie-break
+        priority[on_shift[:, shift]] -= 2 * problem.num_slots
+        priority[problem.availability[:, shift] == UNAVAILABLE] -= problem.num_slots
+        ta = int(np.argmax(priority))
+        slot_ta[slot] = ta
+        remaining[ta] -= 1
+        on_shift[ta, shift] = True
+    return slot_ta
+
+def solve_with_local_search(problem: Timetable,
+                            constraint_version: str = "default",
+                            seconds: float = 30.0,
+                            unimproved_seconds: Optional[float] = None,
+                            max_steps: Optional[int] = None,
+                            random_seed: Optional[int] = None,
+                            late_acceptance_size: int = 400,
+                            swap_batch_size: int = 64,
+                            logger: Optional[logging.Logger] = None) -> Tuple[Timetable, LocalSearchResult]:
+    """Solves the problem with the late acceptance local search, without the Timefold solver.
+
+    The assignments already in the problem are kept as the starting point and the pinned ones are never moved.
+    Returns a solved copy of the problem (with a HardMediumSoftScore) and the run statistics.
+    """
+    compiled    = CompiledProblem.from_timetable(problem)
+    rng         = np.random.default_rng(random_seed)
+    calculator  = IncrementalScoreCalculator(compiled, problem.constraint_parameters, constraint_version)
+    calculator.load(construct_initial_assignment(compiled, current_slot_ta(problem), rng))
+    if logger:
+        logger.info(f"\tLocal search starting from {format_score(*calculator.score)} ({compiled})")
+
+    movable         = np.array([not assignment.pinned for assignment in problem.shift_assignments], dtype=bool)
+    local_search    = LateAcceptanceLocalSearch(calculator, movable, rng,
+                                                late_acceptance_size=late_acceptance_size,
+                                                swap_batch_size=swap_batch_size)
+    best_slot_ta, result = local_search.run(seconds=seconds, unimproved_seconds=unimproved_seconds, max_steps=max_steps)
+    if logger:
+        logger.info(f"\tLocal search finished: {result}")
+
+    solution = deepcopy(problem)
+    for assignment, ta_index in zip(solution.shift_assignments, best_slot_ta.tolist()):
+        assignment.assigned_ta = solution.tas[ta_index]
+    solution.score = HardMediumSoftScore.of(*result.score)
+    return solution, result
@@ -1,19 +1,47 @@
+from __future__ import annotations
+
 import random
 import argparse
 import logging
 import sys, os
 
-from copy import deepcopy
+from copy   import deepcopy
+from typing import TYPE_CHECKING, List, Optional
+
+from hello_world.daemon_client import DEFAULT_SOCKET_PATH, run_demo_with_daemon
+
+# Importing the domain starts the JVM and translates the planning classes, so the solver modules are imported
+# where they are used: with --daemon, run_demo only forwards the arguments to the solver daemon (hello_world.daemon).
+if TYPE_CHECKING:
+    from hello_world.domain import Timetable
+    from hello_world.solver import TimetableSolverBase
 
-from hello_world.domain      import Timetable, ShiftAssignment, Shift, TA
-from hello_world.demo_data   import generate_demo_data_with_default_params, _generate_demo_data_dict
-from hello_world.utils       import print_ta_availability, initialize_logger, DataConstructor
-from hello_world.solver      import TimetableSolverBlocking, TimetableSolverWithSolverManager
-from hello_world.constraints import constraints_provider_dict
 # Constants for random shift generation
 SEED = 100
 
-def get_args() -> argparse.Namespace:
+def __getattr__(name: str):
+    # kept importable from here (see the imports above)
+    if name == "generate_demo_data_with_default_params":
+        from hello_world.demo_data import generate_demo_data_with_default_params
+        return generate_demo_data_with_default_params
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def add_daemon_arguments(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
+    parser.add_argument('--daemon',
+                        action='store_true',
+                        help='runs the solve in the solver daemon (timefold-solver-daemon) instead of starting a JVM',
+                        default=False)
+
+    parser.add_argument('--daemon_socket',
+                        type=str,
+                        help='the Unix socket of the solver daemon',
+                        default=str(DEFAULT_SOCKET_PATH))
+    return parser
+
+def get_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    from hello_world.constraints import constraints_provider_dict
+    from hello_world.demo_data   import _generate_demo_data_dict
+
     parser = argparse.ArgumentParser(description='Run the TA Rostering Program in Terminal')
 
     parser.add_argument('--ta_csv_path', 
@@ -51,7 +79,7 @@ def get_args() -> argparse.Namespace:
 
     parser.add_argument('--solving_method', 
                         type=str, 
-                        choices=["solver_manager", "blocking", "tqdm"],
+                        choices=["solver_manager", "blocking", "tqdm", "partitioned", "rolling_horizon", "local_search"],
                         help='the solver instantiation method',
                         default='solver_manager')
     
@@ -65,11 +93,61 @@ def get_args() -> argparse.Namespace:
                         help='the relative path to the solver_config.xml file to configure the solver',
                         default=None)
     
-    args = parser.parse_args()
+    parser.add_argument('--warm_start',
+                        action='store_true',
+                        help='starts the solver from a max-flow assignment meeting the hard constraints (when one exists)',
+                        default=False)
+    
+    parser.add_argument('--move_thread_count',
+                        type=str,
+                        help='the number of move threads (e.g., 4 or AUTO; multithreaded solving requires the Timefold enterprise edition)',
+                        default=None)
+
+    parser.add_argument('--profile_constraints',
+                        action='store_true',
+                        help='counts the calls of the constraint-stream callbacks and their time per constraint (slows the solver down)',
+                        default=False)
+
+    parser.add_argument('--weeks_per_partition',
+                        type=int,
+                        help='the number of weeks per partition with --solving_method partitioned',
+                        default=1)
+
+    parser.add_argument('--current_week',
+                        type=int,
+                        help='the first week to re-plan with --solving_method rolling_horizon (the earlier weeks are frozen)',
+                        default=0)
+
+    parser.add_argument('--horizon_weeks',
+                        type=int,
+                        help='the number of weeks to re-plan with --solving_method rolling_horizon',
+                        default=2)
+
+    parser.add_argument('--previous_solution',
+                        type=str,
+                        help='the path to a results pickle (solutions.pkl, baseline.pkl) whose last solution seeds the solve',
+                        default=None)
+
+    parser.add_argument('--pinned_weeks',
+                        type=int,
+                        nargs='*',
+                        help='the weeks of the previous solution to pin (e.g., weeks already worked)',
+                        default=[])
+
+    parser.add_argument('--time_budget',
+                        type=int,
+                        help='the time limit of the solve in seconds (default: 150; it also ends after 10 s without improvement)',
+                        default=None)
+
+    add_daemon_arguments(parser)
+    
+    args = parser.parse_args(argv)
 
     return args
 
 def create_timetable_demo_default(logger: logging.Logger, demo_data_select: str = "demo_data_weekly_scheduling-random", print_initial_timetable: bool = False) -> Timetable:
+    from hello_world.demo_data  import generate_demo_data_with_default_params
+    from hello_world.utils      import print_ta_availability
 
     # Load the problem
     logger.info(f"=== Loading the demo data {demo_data_select} ===")
@@ -83,6 +161,8 @@ def create_timetable_demo_default(logger: logging.Logger, demo_data_select: str
     return problem
 
 def create_timetable_from_data_folder(logger: logging.Logger, ta_csv_path: str, shift_csv_path: str, availability_folder: str) -> Timetable:
+    from hello_world.utils import DataConstructor
+
     try:
         data_constructor = DataConstructor(
                                     ta_csv_path= ta_csv_path,
@@ -124,11 +204,57 @@ def create_the_problem(logger: logging.Logger, args: argparse.Namespace) -> Time
 
     return problem
 
+def create_the_solver(logger: logging.Logger, args: argparse.Namespace) -> TimetableSolverBase:
+    """Creates the solver selected by the command line arguments."""
+    from timefold.solver.config import Duration
+    from hello_world.solver     import (TimetableSolverWithSolverManager, TimetableSolverPartitioned,
+                                        TimetableSolverRollingHorizon, TimetableSolverLocalSearch)
+
+    solver_kwargs = dict(constraint_version=args.constraint_version,
+                         random_seed=SEED,
+                         use_config_xml=args.use_config_xml,
+                         path_to_config_xml=args.path_to_config_xml,
+                         warm_start=args.warm_start,
+                         move_thread_count=args.move_thread_count,
+                         profile_constraints=args.profile_constraints,
+                         logger=logger)
+    if args.solving_method == "partitioned":
+        solver = TimetableSolverPartitioned(weeks_per_partition=args.weeks_per_partition, **solver_kwargs)
+    elif args.solving_method == "rolling_horizon":
+        solver = TimetableSolverRollingHorizon(current_week=args.current_week, horizon_weeks=args.horizon_weeks, **solver_kwargs)
+    elif args.solving_method == "local_search":
+        solver = TimetableSolverLocalSearch(**solver_kwargs)
+    else:
+        solver = TimetableSolverWithSolverManager(**solver_kwargs)
+    if args.time_budget is not None:
+        solver.default_term_time_budget = Duration(seconds=args.time_budget)
+    return solver
+
+def solve_the_problem(logger: logging.Logger, args: argparse.Namespace, solver: TimetableSolverBase, problem: Timetable) -> Timetable:
+    """Solves the problem (seeded from --previous_solution, if any) and logs the score analysis."""
+    from hello_world.warm_start import load_previous_solution
+
+    previous_solution = load_previous_solution(args.previous_solution) if args.previous_solution else None
+    solution = solver.solve_problem(problem=problem, previous_solution=previous_solution, pinned_weeks=args.pinned_weeks)
+
+    solver.post_process_solution(solution=solution)
+
+    # Explain the solution (analysis) TODO
+    return solution
+
 def run_demo():
+    # Hand the run over to the solver daemon (no JVM start-up in this process)
+    argv = sys.argv[1:]
+    client_args, _ = add_daemon_arguments(argparse.ArgumentParser(add_help=False)).parse_known_args(argv)
+    if client_args.daemon:
+        sys.exit(run_demo_with_daemon(argv, socket_path=client_args.daemon_socket))
+
+    from hello_world.utils import initialize_logger
+
     # standard library
     random.seed(SEED)
     # Parse command line arguments
-    args = get_args()
+    args = get_args(argv)
     # Initialize the logger
     logger = initialize_logger(args)
     logger.info(f"Running the TA Rostering Program with seed: {SEED}")
@@ -137,17 +263,8 @@ def run_demo():
     problem = create_the_problem(logger=logger, args=args)
     
     # Solve the problem
-    solver = TimetableSolverWithSolverManager(constraint_version=args.constraint_version,
-                                                random_seed=SEED,
-                                                use_config_xml=args.use_config_xml,
-                                                path_to_config_xml=args.path_to_config_xml,
-                                                logger=logger)
-    
-    solution = solver.solve_problem(problem=problem)
-
-    solver.post_process_solution(solution=solution)
-
-    # Explain the solution (analysis) TODO
+    solver = create_the_solver(logger=logger, args=args)
+    solve_the_problem(logger=logger, args=args, solver=solver, problem=problem)
 
 if __name__ == '__main__':
     try:
@@ -0,0 +1,479 @@
+import re
+import numpy as np
+import random
+import logging
+import argparse
+import json
+import sys
+import os
+import time
+import tracemalloc
+
+from contextlib import contextmanager
+from copy       import deepcopy
+from dataclasses import fields, make_dataclass
+from typing     import List, Dict, Any, Optional, Tuple, Iterator
+
+from timefold.solver        import SolverFactory, SolverManager, SolutionManager
+from timefold.solver.config import (SolverConfig, ScoreDirectorFactoryConfig,
+                                    TerminationConfig, Duration, MoveThreadCount,
+                                    SolverManagerConfig, RequiresEnterpriseError)
+
+from hello_world.domain      import Timetable, ShiftAssignment, Shift, TA
+from hello_world.demo_data   import demo_data_semeseter_scheduling_random, ProblemRandomizationParameters
+from hello_world.constraints import constraints_provider_dict
+from hello_world.problem_ir  import CompiledProblem, DESIRED, NEUTRAL, UNDESIRED, UNAVAILABLE
+from hello_world.capacity    import analyze_capacity
+from hello_world.feasibility import check_feasibility
+from hello_world.scoring     import BatchScorer
+
+SEED = 100
+
+class ScoreCalculationSpeedProbe(logging.Handler):
+    """Captures the score calculation (move evaluation) speed that Timefold logs when solving ends."""
+    SPEED_PATTERN = re.compile(r"Solving ended:.*(?:score calculation|move evaluation) speed \((\d+)/sec\)")
+
+    def __init__(self):
+        super().__init__(level=logging.INFO)
+        self.speeds: List[int] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        match = self.SPEED_PATTERN.search(record.getMessage())
+        if match:
+            self.speeds.append(int(match.group(1)))
+
+    @property
+    def last_speed(self) -> Optional[int]:
+        return self.speeds[-1] if self.speeds else None
+
+
+@contextmanager
+def probe_score_calculation_speed() -> Iterator[ScoreCalculationSpeedProbe]:
+    """Attaches a ScoreCalculationSpeedProbe to the Timefold logger for the duration of the block."""
+    timefold_logger = logging.getLogger("timefold.solver")
+    probe           = ScoreCalculationSpeedProbe()
+    previous_level  = timefold_logger.level
+    timefold_logger.addHandler(probe)
+    timefold_logger.setLevel(logging.INFO)
+    try:
+        yield probe
+    finally:
+        timefold_logger.removeHandler(probe)
+        timefold_logger.setLevel(previous_level)
+
+def _solver_config(constraint_version: str, seconds: int, random_seed: int, move_thread_count: int | MoveThreadCount = MoveThreadCount.NONE) -> SolverConfig:
+    return SolverConfig(
+        random_seed=random_seed,
+        solution_class=Timetable,
+        entity_class_list=[ShiftAssignment],
+        score_director_factory_config=ScoreDirectorFactoryConfig(
+            constraint_provider_function=constraints_provider_dict[constraint_version]
+        ),
+        move_thread_count=move_thread_count,
+        termination_config=TerminationConfig(spent_limit=Duration(seconds=seconds))
+    )
+
+def measure_score_calculation_speed(problem: Timetable, constraint_version: str = "default", seconds: int = 10, random_seed: int = SEED,
+                                    move_thread_count: int | MoveThreadCount = MoveThreadCount.NONE) -> Dict[str, Any]:
+    """Solves `problem` for a fixed time budget and returns the score calculation speed reported by Timefold."""
+    with probe_score_calculation_speed() as probe:
+        solver_factory = SolverFactory.create(_solver_config(constraint_version, seconds, random_seed, move_thread_count))
+        solution = solver_factory.build_solver().solve(problem)
+
+    return {
+        "score_calculation_speed"   : probe.last_speed,
+        "best_score"                : str(solution.score),
+        "seconds"                   : seconds,
+    }
+
+def measure_parallel_solving(problems: List[Timetable], constraint_version: str = "default", seconds: int = 10, random_seed: int = SEED) -> Dict[str, Any]:
+    """Solves the problems concurrently (one SolverManager job per problem) for a fixed time budget.
+
+    Unlike move threads, parallel solver jobs are available in the community edition; if the translated
+    constraint callbacks serialized on the GIL, the aggregate speed would stay flat as jobs are added.
+    """
+    with probe_score_calculation_speed() as probe:
+        solver_manager = SolverManager.create(SolverFactory.create(_solver_config(constraint_version, seconds, random_seed)),
+                                              SolverManagerConfig(parallel_solver_count=len(problems)))
+        try:
+            jobs        = [solver_manager.solve(f"parallel-{index}", problem) for index, problem in enumerate(problems)]
+            solutions   = [job.get_final_best_solution() for job in jobs]
+        finally:
+            solver_manager.close()
+
+    return {
+        "score_calculation_speed"   : sum(probe.speeds),
+        "speed_per_solver"          : probe.speeds,
+        "best_scores"               : [str(solution.score) for solution in solutions],
+        "seconds"                   : seconds,
+    }
+
+def benchmark_availability_index(logger: logging.Logger, num_of_weeks: int = 12, seconds: int = 10, constraint_version: str = "default") -> Dict[str, Any]:
+    """Compares the score calculation speed with and without the precomputed TA availability index."""
+    random.seed(SEED)
+    indexed_problem = demo_data_semeseter_scheduling_random(name="microbenchmark", logger=logger, num_of_weeks=num_of_weeks)
+    indexed_problem.build_availability_index()
+
+    # Same problem, but with the TA lookups falling back to list scans
+    list_scan_problem = deepcopy(indexed_problem)
+    for ta in list_scan_problem.tas:
+        ta.is_indexed = False
+
+    logger.info(f"Warming up the JVM...")
+    measure_score_calculation_speed(deepcopy(indexed_problem), constraint_version=constraint_version, seconds=2)
+
+    logger.info(f"Measuring score calculation speed on {indexed_problem} for {seconds}s per run...")
+    list_scan   = measure_score_calculation_speed(list_scan_problem, constraint_version=constraint_version, seconds=seconds)
+    indexed     = measure_score_calculation_speed(indexed_problem,   constraint_version=constraint_version, seconds=seconds)
+
+    speedup = None
+    if list_scan["score_calculation_speed"] and indexed["score_calculation_speed"]:
+        speedup = round(indexed["score_calculation_speed"] / list_scan["score_calculation_speed"], 2)
+
+    results = {
+        "problem"       : str(indexed_problem),
+        "num_of_weeks"  : num_of_weeks,
+        "list_scan"     : list_scan,
+        "indexed"       : indexed,
+        "speedup"       : speedup,
+    }
+    logger.info(f"\tlist scan : {list_scan['score_calculation_speed']}/sec")
+    logger.info(f"\tindexed   : {indexed['score_calculation_speed']}/sec")
+    logger.info(f"\tspeed-up  : x{speedup}")
+    return results
+
+def _mirror_class(cls: type, **dataclass_kwargs) -> type:
+    """Builds a plain dataclass with the same fields as `cls` (no solver annotations) to compare layouts."""
+    return make_dataclass(f"{cls.__name__}Mirror", [(f.name, f.type) for f in fields(cls)], **dataclass_kwargs)
+
+def _measure_allocation(build) -> Tuple[Any, int]:
+    tracemalloc.start()
+    try:
+        objects = build()
+        allocated, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return objects, allocated
+
+def benchmark_domain_footprint(logger: logging.Logger, num_of_weeks: int = 12, seconds: int = 10, constraint_version: str = "default", num_of_tas: int = 1000) -> Dict[str, Any]:
+    """Compares the memory footprint and the Python-side throughput of the domain object layouts on a large problem.
+
+    Three layouts are compared for Shift, TA and ShiftAssignment: the id-hashed domain classes, value-equality
+    dataclasses (the previous layout) and slotted dataclasses. The slotted layout is reported for reference only:
+    the solver reads slotted objects through slow attribute proxies, which more than offsets the memory saving.
+    """
+    random.seed(SEED)
+    quiet_logger = logging.getLogger(f"{logger.name}.generator")
+    quiet_logger.setLevel(logging.WARNING)
+    problem = demo_data_semeseter_scheduling_random(name="footprint",
+                                                    logger=quiet_logger,
+                                                    ta_names=[f"TA {i:04d}" for i in range(num_of_tas)],
+                                                    num_of_weeks=num_of_weeks,
+                                                    randomization_params=ProblemRandomizationParameters(MIN_NUM_SHIFTS_PER_WEEK=40, MAX_NUM_SHIFTS_PER_WEEK=60))
+    for i, shift_assignment in enumerate(problem.shift_assignments):
+        shift_assignment.assigned_ta = problem.tas[i % len(problem.tas)]
+    domain_objects = [*problem.shifts, *problem.tas, *problem.shift_assignments]
+    logger.info(f"Measuring the domain footprint on {problem}...")
+
+    def copy_as(layout: Dict[type, type]) -> List[Any]:
+        return [layout[type(obj)](**{f.name: getattr(obj, f.name) for f in fields(obj)}) for obj in domain_objects]
+
+    layouts = {
+        "id_hashed"     : {cls: cls for cls in (Shift, TA, ShiftAssignment)},
+        "value_eq"      : {cls: _mirror_class(cls) for cls in (Shift, TA, ShiftAssignment)},
+        "slotted"       : {cls: _mirror_class(cls, slots=True, eq=False) for cls in (Shift, TA, ShiftAssignment)},
+    }
+    results: Dict[str, Any] = {"problem": str(problem), "num_of_objects": len(domain_objects)}
+    for name, layout in layouts.items():
+        copies, allocated = _measure_allocation(lambda: copy_as(layout))
+        assignments = [obj for obj in copies if type(obj) is layout[ShiftAssignment]]
+        hashable    = layout[TA].__hash__ is not None
+
+        # Throughput of grouping assignments by TA (what the per-TA constraints do); needs hashable objects
+        group_by_rate = None
+        if hashable:
+            start = time.perf_counter()
+            for _ in range(100):
+                count_by_ta: Dict[Any, int] = {}
+                for assignment in assignments:
+                    count_by_ta[assignment.assigned_ta] = count_by_ta.get(assignment.assigned_ta, 0) + 1
+                    count_by_ta[assignment] = 1
+            group_by_rate = round(100 * len(assignments) / (time.perf_counter() - start))
+
+        results[name] = {
+            "allocated_bytes"           : allocated,
+            "bytes_per_object"          : round(allocated / len(copies), 1),
+            "hashable"                  : hashable,
+            "group_by_per_sec"          : group_by_rate,
+        }
+        logger.info(f"\t{name:<10}: {allocated / 2**20:.2f} MiB ({results[name]['bytes_per_object']} B/object), group-by: {group_by_rate}/sec")
+
+    # Solver throughput on the domain classes (the slotted layout cannot be planned efficiently, see domain.PlanningIdObject)
+    if seconds > 0:
+        for shift_assignment in problem.shift_assignments:
+            shift_assignment.assigned_ta = None
+        problem.build_availability_index()
+        results["solver"] = measure_score_calculation_speed(problem, constraint_version=constraint_version, seconds=seconds)
+        logger.info(f"\tsolver    : {results['solver']['score_calculation_speed']}/sec")
+    return results
+
+def random_compiled_problem(num_of_tas: int, num_of_weeks: int, shifts_per_week: int = 60, seed: int = SEED) -> CompiledProblem:
+    """Draws a CompiledProblem directly (no object graph), to benchmark the array-based engines on large problems."""
+    rng         = np.random.default_rng(seed)
+    num_shifts  = shifts_per_week * num_of_weeks
+    week        = np.repeat(np.arange(num_of_weeks, dtype=np.int32), shifts_per_week)
+    series      = np.tile(np.arange(shifts_per_week, dtype=np.int32), num_of_weeks)
+    day         = (series % 5).astype(np.int8)
+    start       = week * 7 * 24 * 60 + day * 24 * 60 + np.where(series % 2 == 0, 14 * 60 + 30, 18 * 60 + 30)
+    required    = rng.integers(2, 4, size=num_shifts, dtype=np.int32)
+    per_week    = np.full(num_of_tas, max(1, int(np.ceil(required.sum() / num_of_weeks / num_of_tas))), dtype=np.int32)
+    return CompiledProblem(
+        name                    = f"random_{num_of_tas}x{num_of_weeks}",
+        shift_ids               = np.arange(num_shifts).astype(str),
+        shift_aliases           = np.full(num_shifts, "Lab"),
+        shift_series            = series,
+        shift_day               = day,
+        shift_week              = week,
+        shift_date              = np.datetime64("2024-01-08") + (start // (24 * 60)).astype("timedelta64[D]"),
+        shift_start             = start.astype(np.int32),
+        shift_end               = (start + 180).astype(np.int32),
+        shift_required_tas      = required,
+        series_names            = np.array([f"L{i + 1:02d}" for i in range(shifts_per_week)]),
+        ta_ids                  = np.arange(num_of_tas).astype(str),
+        ta_names                = np.array([f"TA {i:04d}" for i in range(num_of_tas)]),
+        ta_required_per_semester= per_week * num_of_weeks,
+        ta_min_per_week         = np.zeros(num_of_tas, dtype=np.int32),
+        ta_max_per_week         = per_week,
+        ta_skill_level          = np.ones(num_of_tas, dtype=np.int32),
+        ta_is_grad              = np.ones(num_of_tas, dtype=bool),
+        availability            = rng.choice(np.array([DESIRED, NEUTRAL, UNDESIRED, UNAVAILABLE], dtype=np.int8),
+                                             p=[0.3, 0.4, 0.2, 0.1], size=(num_of_tas, num_shifts)),
+        slot_ids                = np.arange(int(required.sum())).astype(str),
+        slot_shift              = np.repeat(np.arange(num_shifts, dtype=np.int32), required),
+    )
+
+def benchmark_capacity_report(logger: logging.Logger, num_of_weeks: int = 52, seconds: int = 10, constraint_version: str = "default", num_of_tas: int = 500) -> Dict[str, Any]:
+    """Times the vectorized capacity analysis on a large array-only problem (`seconds` bounds the number of repetitions)."""
+    problem = random_compiled_problem(num_of_tas=num_of_tas, num_of_weeks=num_of_weeks)
+    analyze_capacity(problem)   # warm-up
+
+    timings = []
+    deadline = time.perf_counter() + seconds
+    while len(timings) < 20 and (not timings or time.perf_counter() < deadline):
+        start = time.perf_counter()
+        report = analyze_capacity(problem)
+        timings.append(time.perf_counter() - start)
+
+    results = {
+        "problem"           : str(problem),
+        "repetitions"       : len(timings),
+        "best_ms"           : round(1000 * min(timings), 2),
+        "median_ms"         : round(1000 * float(np.median(timings)), 2),
+        "num_of_issues"     : len(report.issues),
+        "is_feasible"       : report.is_feasible,
+    }
+    logger.info(f"\tcapacity report on {problem}: {results['median_ms']} ms (median of {len(timings)})")
+    return results
+
+def benchmark_max_flow(logger: logging.Logger, num_of_weeks: int = 13, seconds: int = 10, constraint_version: str = "default", num_of_tas: int = 100) -> Dict[str, Any]:
+    """Times the max-flow feasibility check / warm start on a large array-only problem with a balanced workload."""
+    problem = random_compiled_problem(num_of_tas=num_of_tas, num_of_weeks=num_of_weeks)
+    # spread the demand over the TAs so the semester requirements can be met exactly
+    demand  = int(problem.shift_required_tas.sum())
+    problem.ta_required_per_semester = np.bincount(np.arange(demand) % num_of_tas, minlength=num_of_tas).astype(np.int32)
+
+    timings = []
+    deadline = time.perf_counter() + seconds
+    while len(timings) < 5 and (not timings or time.perf_counter() < deadline):
+        start = time.perf_counter()
+        result = check_feasibility(problem)
+        timings.append(time.perf_counter() - start)
+
+    results = {
+        "problem"               : str(problem),
+        "repetitions"           : len(timings),
+        "best_ms"               : round(1000 * min(timings), 2),
+        "median_ms"             : round(1000 * float(np.median(timings)), 2),
+        "demand"                : result.demand,
+        "max_flow"              : result.max_flow,
+        "is_feasible"           : result.is_feasible,
+        "respects_weekly_bounds": result.respects_weekly_bounds,
+    }
+    logger.info(f"\tmax-flow check on {problem}: {result} in {results['median_ms']} ms (median of {len(timings)})")
+    return results
+
+def benchmark_thread_scaling(logger: logging.Logger, num_of_weeks: int = 12, seconds: int = 10, constraint_version: str = "default",
+                             thread_counts: Tuple[int, ...] = (1, 2, 4, 8), num_of_problems: int = 2) -> Dict[str, Any]:
+    """Runs the same problem corpus at 1/2/4/8 threads and reports the score calculation speed and best score at a fixed time.
+
+    Two ways of using the threads are measured: move threads (multithreaded incremental solving of one problem,
+    which requires the Timefold enterprise edition and is reported as an error otherwise) and parallel solver jobs
+    (as many independent solves of the corpus problems as threads).
+    """
+    quiet_logger = logging.getLogger(f"{logger.name}.generator")
+    quiet_logger.setLevel(logging.WARNING)
+    corpus: List[Timetable] = []
+    for index in range(num_of_problems):
+        random.seed(SEED + index)
+        problem = demo_data_semeseter_scheduling_random(name=f"thread_scaling_{index}", logger=quiet_logger, num_of_weeks=num_of_weeks)
+        problem.build_availability_index()
+        corpus.append(problem)
+
+    logger.info(f"Warming up the JVM...")
+    measure_score_calculation_speed(deepcopy(corpus[0]), constraint_version=constraint_version, seconds=2)
+
+    move_threads: Dict[int, Dict[str, Any]] = {}
+    parallel_solvers: Dict[int, Dict[str, Any]] = {}
+    for thread_count in thread_counts:
+        move_thread_count = MoveThreadCount.NONE if thread_count == 1 else thread_count
+        try:
+            runs = [measure_score_calculation_speed(deepcopy(problem), constraint_version=constraint_version, seconds=seconds, move_thread_count=move_thread_count)
+                    for problem in corpus]
+            move_threads[thread_count] = {
+                "score_calculation_speed"   : int(np.mean([run["score_calculation_speed"] or 0 for run in runs])),
+                "best_scores"               : [run["best_score"] for run in runs],
+            }
+        except RequiresEnterpriseError as error:
+            move_threads[thread_count] = {"error": str(error)}
+
+        parallel_solvers[thread_count] = measure_parallel_solving([deepcopy(corpus[index % num_of_problems]) for index in range(thread_count)],
+                                                                  constraint_version=constraint_version, seconds=seconds)
+        logger.info(f"	{thread_count} thread(s): move threads {move_threads[thread_count].get('score_calculation_speed', 'n/a')}/sec, "
+                    f"parallel solvers {parallel_solvers[thread_count]['score_calculation_speed']}/sec")
+
+    def scaling(results: Dict[int, Dict[str, Any]]) -> Dict[int, Optional[float]]:
+        baseline = results[thread_counts[0]].get("score_calculation_speed")
+        return {thread_count: round(result["score_calculation_speed"] / baseline, 2) if baseline and result.get("score_calculation_speed") else None
+                for thread_count, result in results.items()}
+
+    return {
+        "problems"          : [str(problem) for problem in corpus],
+        "cpu_count"         : os.cpu_count(),
+        "seconds"           : seconds,
+        "move_threads"      : move_threads,
+        "parallel_solvers"  : parallel_solvers,
+        "speedup"           : {"move_threads": scaling(move_threads), "parallel_solvers": scaling(parallel_solvers)},
+    }
+
+def benchmark_batch_scoring(logger: logging.Logger, num_of_weeks: int = 12, seconds: int = 10, constraint_version: str = "default",
+                            num_of_tas: int = 20, num_of_solutions: int = 2000) -> Dict[str, Any]:
+    """Compares scoring stored solutions with the batched NumPy scorer against SolutionManager.analyze one at a time."""
+    problem     = random_compiled_problem(num_of_tas=num_of_tas, num_of_weeks=num_of_weeks)
+    rng         = np.random.default_rng(SEED)
+    slot_ta     = rng.integers(num_of_tas, size=(num_of_solutions, problem.num_slots))
+    scorer      = BatchScorer(problem, constraint_version=constraint_version)
+
+    start       = time.perf_counter()
+    batch       = scorer.score_slot_ta(slot_ta)
+    batch_time  = time.perf_counter() - start
+
+    # SolutionManager.analyze on as many of the same solutions as fit in the time budget
+    timetable           = problem.to_timetable()
+    solution_manager    = SolutionManager.create(SolverFactory.create(_solver_config(constraint_version, seconds, SEED)))
+    analyze_times: List[float] = []
+    deadline = time.perf_counter() + seconds
+    while len(analyze_times) < num_of_solutions and (not analyze_times or time.perf_counter() < deadline):
+        row = slot_ta[len(analyze_times)]
+        for assignment, ta_index in zip(timetable.shift_assignments, row.tolist()):
+            assignment.assigned_ta = timetable.tas[ta_index]
+        start = time.perf_counter()
+        score_analysis = solution_manager.analyze(timetable)
+        analyze_times.append(time.perf_counter() - start)
+        if str(score_analysis.score) != batch.score_str(len(analyze_times) - 1):
+            raise RuntimeError(f"The batched scorer disagrees with Timefold: {batch.score_str(len(analyze_times) - 1)} != {score_analysis.score}")
+
+    results = {
+        "problem"                   : str(problem),
+        "num_of_solutions"          : num_of_solutions,
+        "batch_seconds"             : round(batch_time, 3),
+        "batch_solutions_per_second": round(num_of_solutions / batch_time, 1),
+        "analyze_solutions"         : len(analyze_times),
+        "analyze_median_ms"         : round(1000 * float(np.median(analyze_times)), 2),
+        "analyze_solutions_per_second": round(1 / float(np.median(analyze_times)), 1),
+    }
+    results["speedup"] = round(results["batch_solutions_per_second"] / results["analyze_solutions_per_second"], 1)
+    logger.info(f"\tscored {num_of_solutions} solutions of {problem} in {batch_time:.2f} s "
+                f"({results['speedup']}x SolutionManager.analyze, checked on {len(analyze_times)} solutions)")
+    return results
+
+def benchmark_fast_constraints(logger: logging.Logger, num_of_weeks: int = 12, seconds: int = 10, constraint_version: str = "default") -> Dict[str, Any]:
+    """Compares the score calculation speed of `constraint_version` with the 'fast' constraints (same scores, see TimetableConstraintGenFast)."""
+    random.seed(SEED)
+    problem = demo_data_semeseter_scheduling_random(name="microbenchmark", logger=logger, num_of_weeks=num_of_weeks)
+    problem.build_availability_index()
+
+    logger.info(f"Warming up the JVM...")
+    measure_score_calculation_speed(deepcopy(problem), constraint_version=constraint_version, seconds=2)
+    measure_score_calculation_speed(deepcopy(problem), constraint_version="fast", seconds=2)
+
+    logger.info(f"Measuring score calculation speed on {problem} for {seconds}s per run...")
+    baseline    = measure_score_calculation_speed(deepcopy(problem), constraint_version=constraint_version, seconds=seconds)
+    fast        = measure_score_calculation_speed(deepcopy(problem), constraint_version="fast", seconds=seconds)
+
+    speedup = None
+    if baseline["score_calculation_speed"] and fast["score_calculation_speed"]:
+        speedup = round(fast["score_calculation_speed"] / baseline["score_calculation_speed"], 2)
+
+    results = {
+        "problem"       : str(problem),
+        "num_of_weeks"  : num_of_weeks,
+        "baseline"      : {"constraint_version": constraint_version, **baseline},
+        "fast"          : fast,
+        "speedup"       : speedup,
+    }
+    logger.info(f"\t{constraint_version:<9}: {baseline['score_calculation_speed']}/sec")
+    logger.info(f"\tfast     : {fast['score_calculation_speed']}/sec")
+    logger.info(f"\tspeed-up : x{speedup}")
+    return results
+
+_microbenchmark_dict = {
+    "availability_index" : benchmark_availability_index,
+    "domain_footprint"   : benchmark_domain_footprint,
+    "capacity_report"    : benchmark_capacity_report,
+    "max_flow"           : benchmark_max_flow,
+    "thread_scaling"     : benchmark_thread_scaling,
+    "batch_scoring"      : benchmark_batch_scoring,
+    "fast_constraints"   : benchmark_fast_constraints,
+}
+
+def get_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Run micro-benchmarks of the solver hot path')
+
+    parser.add_argument('--select',
+                        type=str,
+                        choices=list(_microbenchmark_dict.keys()),
+                        help='Select the micro-benchmark to run',
+                        default='availability_index')
+
+    parser.add_argument('--constraint_version',
+                        type=str,
+                        choices=list(constraints_provider_dict.keys()),
+                        help='Choose the constraint version to use',
+                        default='default')
+
+    parser.add_argument('--num_of_weeks',
+                        type=int,
+                        help='Number of weeks of the generated problem',
+                        default=12)
+
+    parser.add_argument('--seconds',
+                        type=int,
+                        help='Time budget (seconds) of each measured solve',
+                        default=10)
+
+    return parser.parse_args()
+
+def run_microbenchmark() -> None:
+    args = get_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logger = logging.getLogger('app')
+
+    results = _microbenchmark_dict[args.select](logger=logger,
+                                                num_of_weeks=args.num_of_weeks,
+                                                seconds=args.seconds,
+                                                constraint_version=args.constraint_version)
+    print(json.dumps(results, indent=4))
+
+if __name__ == "__main__":
+    run_microbenchmark()
+    sys.exit(0)
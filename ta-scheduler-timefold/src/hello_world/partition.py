@@ -0,0 +1,161 @@
+import logging
+import multiprocessing
+import numpy as np
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses        import dataclass, replace
+from typing             import Collection, Dict, List, Optional
+
+from timefold.solver.config import SolverConfig, ScoreDirectorFactoryConfig, TerminationConfig, Duration
+
+# Custom Imports
+from hello_world.domain         import Timetable, ShiftAssignment
+from hello_world.constraints    import constraints_provider_dict
+from hello_world.problem_ir     import CompiledProblem, UNAVAILABLE
+from hello_world.capacity       import _sum_by_week
+from hello_world.feasibility    import check_feasibility, current_slot_ta, FeasibilityResult
+from hello_world.solver_cache   import solver_cache_key, get_cached_solver_factory
+
+@dataclass
+class WeekPartition:
+    """A block of consecutive weeks solved on its own, with each TA's share of their semester requirement."""
+    index: int
+    week_ids: List[int]
+    ta_budget: np.ndarray   # [num_tas] shifts each TA takes in this block
+
+def partition_weeks(problem: Timetable, weeks_per_partition: int = 1) -> List[List[int]]:
+    """Groups the week ids of the problem into blocks of `weeks_per_partition` consecutive weeks."""
+    week_ids = sorted({shift.week_id for shift in problem.shifts})
+    return [week_ids[start:start + weeks_per_partition] for start in range(0, len(week_ids), weeks_per_partition)]
+
+def allocate_semester_budget(problem: Timetable, blocks: List[List[int]], feasibility: Optional[FeasibilityResult] = None,
+                             fixed_blocks: Collection[int] = ()) -> np.ndarray:
+    """Splits every TA's required_shifts_per_semester over the week blocks; returns a [num_tas, num_blocks] array.
+
+    When the max-flow pre-check (`feasibility`, computed if not given) finds a feasible assignment, its
+    per-block counts are used: they staff every shift and meet every semester requirement at once.
+    Otherwise the assignments already in the timetable count toward their blocks, and the rest of the
+    requirement is spread over the blocks that can still change (not in `fixed_blocks`, e.g. the frozen
+    past, and with unassigned slots) in proportion to what the TA can still take in each (availability
+    capped by max_shifts_per_week), by largest remainder.
+    """
+    block_of_week   = {week_id: block for block, week_ids in enumerate(blocks) for week_id in week_ids}
+    slot_block      = np.array([block_of_week[assignment.shift.week_id] for assignment in problem.shift_assignments], dtype=np.int64)
+    budget          = np.zeros((len(problem.tas), len(blocks)), dtype=np.int64)
+
+    result = feasibility if feasibility is not None else check_feasibility(problem)
+    if result.is_feasible:
+        np.add.at(budget, (result.slot_ta, slot_block), 1)
+        return budget
+
+    fixed_slot_ta   = current_slot_ta(problem)
+    fixed           = fixed_slot_ta >= 0
+    np.add.at(budget, (fixed_slot_ta[fixed], slot_block[fixed]), 1)
+
+    compiled    = CompiledProblem.from_timetable(problem)
+    week_cap    = np.minimum(compiled.ta_max_per_week[:, None],
+                             _sum_by_week(compiled.availability != UNAVAILABLE, compiled.shift_week, compiled.num_of_weeks))
+    block_cap   = np.zeros_like(budget)
+    for week_id, block in block_of_week.items():
+        block_cap[:, block] += week_cap[:, week_id]
+    block_cap   = np.maximum(block_cap - budget, 0)
+    open_blocks = np.bincount(slot_block[~fixed], minlength=len(blocks)) > 0
+    open_blocks[list(fixed_blocks)] = False
+    block_cap[:, ~open_blocks] = 0
+    # a TA who can take nothing more anywhere still gets their requirement, spread evenly over the open blocks
+    block_cap   = np.where(block_cap.any(axis=1, keepdims=True), block_cap, open_blocks)
+
+    required    = np.array([ta.required_shifts_per_semester for ta in problem.tas], dtype=np.int64)
+    required    = np.maximum(required - budget.sum(axis=1), 0)
+    share       = required[:, None] * block_cap / np.maximum(block_cap.sum(axis=1, keepdims=True), 1)
+    spread      = np.floor(share).astype(np.int64)
+    for t in range(len(problem.tas)):
+        remainder = int(required[t] - spread[t].sum())
+        for block in np.argsort(spread[t] - share[t], kind="stable")[:max(0, remainder)]:
+            spread[t, block] += 1
+    return budget + spread
+
+def build_partition_problem(problem: Timetable, partition: WeekPartition) -> Timetable:
+    """Copies the shifts and shift assignments of the partition's weeks into a standalone Timetable.
+
+    The TAs keep their availability for these weeks only, and their semester requirement is replaced by the
+    partition's budget, so the semester constraint of the partition enforces the allocation.
+    """
+    week_ids    = set(partition.week_ids)
+    shifts      = [replace(shift) for shift in problem.shifts if shift.week_id in week_ids]
+    shift_by_id = {shift.id: shift for shift in shifts}
+    tas = [replace(ta,
+                   required_shifts_per_semester = int(partition.ta_budget[index]),
+                   desired                      = [shift_by_id[shift.id] for shift in ta.desired if shift.id in shift_by_id],
+                   undesired                    = [shift_by_id[shift.id] for shift in ta.undesired if shift.id in shift_by_id],
+                   unavailable                  = [shift_by_id[shift.id] for shift in ta.unavailable if shift.id in shift_by_id],
+                   is_indexed                   = False)
+           for index, ta in enumerate(problem.tas)]
+    ta_by_id = {ta.id: ta for ta in tas}
+    # pinned assignments stay pinned in the partition
+    shift_assignments = [ShiftAssignment(id          = assignment.id,
+                                         shift       = shift_by_id[assignment.shift.id],
+                                         assigned_ta = ta_by_id[assignment.assigned_ta.id] if assignment.pinned else None,
+                                         pinned      = assignment.pinned)
+                         for assignment in problem.shift_assignments if assignment.shift.id in shift_by_id]
+
+    partition_problem = Timetable(id                    = f"{problem.id}-part_{partition.index}",
+                                  shifts                = shifts,
+                                  tas                   = tas,
+                                  constraint_parameters = problem.constraint_parameters,
+                                  shift_assignments     = shift_assignments)
+    partition_problem.build_availability_index()
+    return partition_problem
+
+def solve_partition(problem: Timetable, constraint_version: str, seconds: float, random_seed: Optional[int] = None) -> Dict[str, Optional[str]]:
+    """Solves one partition (in a worker process) and returns the assigned TA id of every shift assignment."""
+    # a worker solves several partitions with the same configuration, so it builds the factory once
+    cached_factory = get_cached_solver_factory(solver_cache_key(constraint_version, spent_limit=seconds, random_seed=random_seed), lambda: SolverConfig(
+        random_seed=random_seed,
+        solution_class=Timetable,
+        entity_class_list=[ShiftAssignment],
+        score_director_factory_config=ScoreDirectorFactoryConfig(
+            constraint_provider_function=constraints_provider_dict[constraint_version]
+        ),
+        termination_config=TerminationConfig(spent_limit=Duration(milliseconds=round(seconds * 1000)))
+    ))
+    solution = cached_factory.solver_factory.build_solver().solve(problem)
+    return {assignment.id: assignment.get_ta_id() for assignment in solution.shift_assignments}
+
+def solve_partitions(partition_problems: List[Timetable], constraint_version: str, seconds: float,
+                     random_seed: Optional[int] = None, max_workers: Optional[int] = None) -> Dict[str, Optional[str]]:
+    """Solves the partitions in parallel processes (each starts its own JVM), or in this process with max_workers=1."""
+    ta_id_by_assignment_id: Dict[str, Optional[str]] = {}
+    if max_workers == 1:
+        for partition_problem in partition_problems:
+            ta_id_by_assignment_id.update(solve_partition(partition_problem, constraint_version, seconds, random_seed))
+        return ta_id_by_assignment_id
+
+    # spawn: a forked child would inherit the parent's JVM, which cannot be used from another process
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        futures = [executor.submit(solve_partition, partition_problem, constraint_version, seconds, random_seed)
+                   for partition_problem in partition_problems]
+        for future in futures:
+            ta_id_by_assignment_id.update(future.result())
+    return ta_id_by_assignment_id
+
+def merge_partition_solutions(problem: Timetable, ta_id_by_assignment_id: Dict[str, Optional[str]]) -> int:
+    """Loads the partition solutions into the (unpinned) shift assignments of the full problem; returns the number set."""
+    ta_by_id = {ta.id: ta for ta in problem.tas}
+    merged = 0
+    for assignment in problem.shift_assignments:
+        ta_id = ta_id_by_assignment_id.get(assignment.id)
+        if assignment.pinned or ta_id is None:
+            continue
+        assignment.assigned_ta = ta_by_id[ta_id]
+        merged += 1
+    return merged
+
+def create_partitions(problem: Timetable, weeks_per_partition: int = 1, logger: Optional[logging.Logger] = None) -> List[WeekPartition]:
+    """Splits the problem into blocks of `weeks_per_partition` weeks and allocates each TA's semester requirement over them."""
+    blocks = partition_weeks(problem, weeks_per_partition)
+    budget = allocate_semester_budget(problem, blocks)
+    partitions = [WeekPartition(index=index, week_ids=week_ids, ta_budget=budget[:, index]) for index, week_ids in enumerate(blocks)]
+    if logger:
+        logger.info(f"\tSplit {problem} into {len(partitions)} partition(s) of {weeks_per_partition} week(s).")
+    return partitions
@@ -0,0 +1,311 @@
+import numpy    as np
+import pandas   as pd
+import openpyxl
+
+from dataclasses    import dataclass
+from datetime       import time, timedelta
+from pathlib        import Path
+from typing         import Dict, List, Any, Tuple
+
+# Custom Imports
+from hello_world.domain import (Shift, TA, ShiftAssignment, Timetable, ConstraintParameters,
+                                DAYS_OF_WEEK, MINUTES_PER_DAY, MINUTES_PER_WEEK)
+
+# ============================
+# Availability codes (int8 entries of CompiledProblem.availability)
+# ============================
+DESIRED:        int = 1
+NEUTRAL:        int = 0
+UNDESIRED:      int = -1
+UNAVAILABLE:    int = -2
+
+# Values found in the 'Availability' column of the availability forms
+AVAILABILITY_CODE_BY_STATUS: Dict[str, int] = {
+    "Desired"       : DESIRED,
+    "Available"     : DESIRED,
+    "Neutral"       : NEUTRAL,
+    "Undesired"     : UNDESIRED,
+    "Unavailable"   : UNAVAILABLE,
+}
+
+@dataclass
+class CompiledProblem:
+    """Integer-indexed, columnar representation of a scheduling problem shared by the solver backends.
+
+    Shifts, TAs and assignment slots are identified by their position (the same dense indices as
+    Shift.index, TA.index and ShiftAssignment.index once converted to a Timetable). Times are absolute
+    [start, end) minutes from Monday 00:00 of week 0 (see Shift.get_absolute_interval).
+    """
+    name: str
+    # shifts
+    shift_ids:              np.ndarray  # str
+    shift_aliases:          np.ndarray  # str
+    shift_series:           np.ndarray  # int32, index into series_names
+    shift_day:              np.ndarray  # int8, index into DAYS_OF_WEEK
+    shift_week:             np.ndarray  # int32
+    shift_date:             np.ndarray  # datetime64[D]
+    shift_start:            np.ndarray  # int32, absolute minutes
+    shift_end:              np.ndarray  # int32, absolute minutes
+    shift_required_tas:     np.ndarray  # int32
+    series_names:           np.ndarray  # str
+    # TAs
+    ta_ids:                 np.ndarray  # str
+    ta_names:               np.ndarray  # str
+    ta_required_per_semester: np.ndarray  # int32
+    ta_min_per_week:        np.ndarray  # int32
+    ta_max_per_week:        np.ndarray  # int32
+    ta_skill_level:         np.ndarray  # int32
+    ta_is_grad:             np.ndarray  # bool
+    # TA x shift availability (DESIRED, NEUTRAL, UNDESIRED, UNAVAILABLE)
+    availability:           np.ndarray  # int8 [num_tas, num_shifts]
+    # planning entities: one slot per required TA of each shift
+    slot_ids:               np.ndarray  # str
+    slot_shift:             np.ndarray  # int32, index into the shifts
+
+    def __str__(self):
+        return f"compiled_{self.name} - {self.num_shifts} shifts - {self.num_tas} TAs - [{self.num_slots} slots]"
+
+    @property
+    def num_shifts(self) -> int:
+        return len(self.shift_ids)
+
+    @property
+    def num_tas(self) -> int:
+        return len(self.ta_ids)
+
+    @property
+    def num_slots(self) -> int:
+        return len(self.slot_ids)
+
+    @property
+    def num_of_weeks(self) -> int:
+        # the span of the week ids (max + 1), for the arrays indexed by week id; the weeks with shifts are np.unique(shift_week)
+        return int(self.shift_week.max()) + 1 if self.num_shifts else 0
+
+    # ============================
+    # Compilers
+    # ============================
+    @classmethod
+    def from_files(cls, ta_csv_path: str, shift_csv_path: str, availability_folder: str, name: str = "0") -> 'CompiledProblem':
+        """Compiles the TA/shift CSV files and the folder of availability forms (xlsx)."""
+        return cls.from_dataframes(ta_dataframe=pd.read_csv(ta_csv_path, encoding="utf-8-sig"),
+                                   shift_dataframe=pd.read_csv(shift_csv_path, encoding="utf-8-sig"),
+                                   availability_by_ta=read_availability_folder(availability_folder),
+                                   name=name)
+
+    @classmethod
+    def from_dataframes(cls,
+                        ta_dataframe: pd.DataFrame,
+                        shift_dataframe: pd.DataFrame,
+                        availability_by_ta: Dict[str, Dict[str, str]],
+                        name: str = "0") -> 'CompiledProblem':
+        """Compiles the TA list, the shift list and the availability forms ({macid: {series: status}}) in one vectorized pass.
+
+        Weeks run from Monday to Sunday, week 0 being the week of the earliest shift date; a TA's weekly requirement applies to every week
+        (min = max = req_shift_per_week), unless the optional columns override it.
+        """
+        # ----- shifts -----
+        dates = pd.to_datetime(shift_dataframe["date"], format="%Y-%m-%d").to_numpy().astype("datetime64[D]")
+        first_monday = dates.min() - np.timedelta64(pd.Timestamp(dates.min()).weekday(), "D")
+        week  = ((dates - first_monday).astype(np.int64) // 7).astype(np.int32)
+        day   = shift_dataframe["day_of_week"].astype(str).str[:3].str.title().map({day: i for i, day in enumerate(DAYS_OF_WEEK)})
+        if day.isna().any():
+            raise ValueError(f"Unknown day of the week: {sorted(set(shift_dataframe['day_of_week'][day.isna()]))}")
+        start_of_day = pd.to_timedelta(shift_dataframe["start_time"].astype(str) + ":00").dt.total_seconds().to_numpy() // 60
+        duration     = np.rint(shift_dataframe["duration"].to_numpy(dtype=float) * 60)
+        start        = week.astype(np.int64) * MINUTES_PER_WEEK + day.to_numpy(dtype=np.int64) * MINUTES_PER_DAY + start_of_day
+        series_names, shift_series = np.unique(shift_dataframe["series"].astype(str).to_numpy(), return_inverse=True)
+        shift_ids = (shift_dataframe["id"] if "id" in shift_dataframe else pd.Series(shift_dataframe.index)).astype(str).to_numpy()
+        aliases   = (shift_dataframe["name"] if "name" in shift_dataframe else shift_dataframe["series"]).astype(str).to_numpy()
+        required_tas = shift_dataframe["req_ta_per_shift"].to_numpy(dtype=np.int32)
+        num_of_weeks = len(np.unique(week))     # the weeks with shifts (a break week has none)
+
+        # ----- TAs -----
+        def optional_column(column: str, default: np.ndarray) -> np.ndarray:
+            return ta_dataframe[column].to_numpy(dtype=np.int32) if column in ta_dataframe else default
+
+        per_week = ta_dataframe["req_shift_per_week"].to_numpy(dtype=np.int32)
+        ta_ids   = ta_dataframe["macid"].astype(str).to_numpy()
+
+        # ----- availability: (TA x series) form answers gathered onto the shifts -----
+        records = [(macid, series, status) for macid, answers in availability_by_ta.items() for series, status in answers.items()]
+        availability_by_series = np.full((len(ta_ids), len(series_names)), NEUTRAL, dtype=np.int8)
+        if records:
+            form = pd.DataFrame(records, columns=["macid", "series", "status"])
+            ta_position     = pd.Index(ta_ids).get_indexer(form["macid"].astype(str))
+            series_position = pd.Index(series_names).get_indexer(form["series"].astype(str))
+            code            = form["status"].map(AVAILABILITY_CODE_BY_STATUS)
+            known = (ta_position >= 0) & (series_position >= 0) & code.notna().to_numpy()
+            availability_by_series[ta_position[known], series_position[known]] = code.to_numpy()[known].astype(np.int8)
+
+        return cls(
+            name                    = name,
+            shift_ids               = shift_ids,
+            shift_aliases           = aliases,
+            shift_series            = shift_series.astype(np.int32),
+            shift_day               = day.to_numpy(dtype=np.int8),
+            shift_week              = week,
+            shift_date              = dates,
+            shift_start             = start.astype(np.int32),
+            shift_end               = (start + duration).astype(np.int32),
+            shift_required_tas      = required_tas,
+            series_names            = series_names,
+            ta_ids                  = ta_ids,
+            ta_names                = ta_dataframe["name"].astype(str).to_numpy(),
+            ta_required_per_semester= optional_column("required_shifts_per_semester", per_week * num_of_weeks),
+            ta_min_per_week         = optional_column("min_shifts_per_week", per_week),
+            ta_max_per_week         = optional_column("max_shifts_per_week", per_week),
+            ta_skill_level          = optional_column("skill_level", np.ones(len(ta_ids), dtype=np.int32)),
+            ta_is_grad              = (ta_dataframe["type"] == "Grad").to_numpy() if "type" in ta_dataframe else np.zeros(len(ta_ids), dtype=bool),
+            availability            = availability_by_series[:, shift_series],
+            slot_ids                = np.arange(int(required_tas.sum())).astype(str),
+            slot_shift              = np.repeat(np.arange(len(shift_ids), dtype=np.int32), required_tas),
+        )
+
+    @classmethod
+    def from_timetable(cls, timetable: Timetable) -> 'CompiledProblem':
+        """Compiles an existing Timetable (e.g., generated demo data); the dense indices follow the Timetable lists."""
+        shifts, tas = timetable.shifts, timetable.tas
+        index_by_shift_id   = {shift.id: index for index, shift in enumerate(shifts)}
+        intervals           = np.array([shift.get_absolute_interval() for shift in shifts], dtype=np.int32).reshape(-1, 2)
+        series_names, shift_series = np.unique(np.array([shift.series for shift in shifts], dtype=str), return_inverse=True)
+
+        availability = np.full((len(tas), len(shifts)), NEUTRAL, dtype=np.int8)
+        # later statuses win, matching TA.get_status_for_shift (desired > undesired > unavailable)
+        for code, attribute in [(UNAVAILABLE, "unavailable"), (UNDESIRED, "undesired"), (DESIRED, "desired")]:
+            for row, ta in enumerate(tas):
+                columns = [index_by_shift_id[shift.id] for shift in getattr(ta, attribute) if shift.id in index_by_shift_id]
+                availability[row, columns] = code
+
+        return cls(
+            name                    = str(timetable.id),
+            shift_ids               = np.array([shift.id for shift in shifts], dtype=str),
+            shift_aliases           = np.array([shift.alias for shift in shifts], dtype=str),
+            shift_series            = shift_series.astype(np.int32),
+            shift_day               = np.array([DAYS_OF_WEEK.index(shift.day_of_week[:3].title()) for shift in shifts], dtype=np.int8),
+            shift_week              = np.array([shift.week_id for shift in shifts], dtype=np.int32),
+            shift_date              = np.array([shift.shift_date for shift in shifts], dtype="datetime64[D]"),
+            shift_start             = intervals[:, 0],
+            shift_end               = intervals[:, 1],
+            shift_required_tas      = np.array([shift.required_tas for shift in shifts], dtype=np.int32),
+            series_names            = series_names,
+            ta_ids                  = np.array([ta.id for ta in tas], dtype=str),
+            ta_names                = np.array([ta.name for ta in tas], dtype=str),
+            ta_required_per_semester= np.array([ta.required_shifts_per_semester for ta in tas], dtype=np.int32),
+            ta_min_per_week         = np.array([ta.min_shifts_per_week for ta in tas], dtype=np.int32),
+            ta_max_per_week         = np.array([ta.max_shifts_per_week for ta in tas], dtype=np.int32),
+            ta_skill_level          = np.array([ta.skill_level for ta in tas], dtype=np.int32),
+            ta_is_grad              = np.array([ta.is_grad_student for ta in tas], dtype=bool),
+            availability            = availability,
+            slot_ids                = np.array([assignment.id for assignment in timetable.shift_assignments], dtype=str),
+            slot_shift              = np.array([index_by_shift_id[assignment.shift.id] for assignment in timetable.shift_assignments], dtype=np.int32),
+        )
+
+    # ============================
+    # Adapters
+    # ============================
+    def to_timetable(self, constraint_parameters: ConstraintParameters | None = None) -> Timetable:
+        """Builds the Timefold planning problem (with the availability and conflict indices already built)."""
+        start_of_day = self.shift_start % MINUTES_PER_DAY
+        end_of_day   = self.shift_end % MINUTES_PER_DAY
+        shifts = [
+            Shift(id            = str(self.shift_ids[i]),
+                  alias         = str(self.shift_aliases[i]),
+                  series        = str(self.series_names[self.shift_series[i]]),
+                  day_of_week   = DAYS_OF_WEEK[self.shift_day[i]],
+                  week_id       = int(self.shift_week[i]),
+                  shift_date    = self.shift_date[i].item(),
+                  start_time    = time(int(start_of_day[i]) // 60, int(start_of_day[i]) % 60),
+                  end_time      = time(int(end_of_day[i]) // 60, int(end_of_day[i]) % 60),
+                  required_tas  = int(self.shift_required_tas[i]))
+            for i in range(self.num_shifts)
+        ]
+
+        def shifts_with(row: np.ndarray, code: int) -> List[Shift]:
+            return [shifts[i] for i in np.flatnonzero(row == code)]
+
+        tas = [
+            TA(id                           = str(self.ta_ids[i]),
+               name                         = str(self.ta_names[i]),
+               required_shifts_per_semester = int(self.ta_required_per_semester[i]),
+               skill_level                  = int(self.ta_skill_level[i]),
+               is_grad_student              = bool(self.ta_is_grad[i]),
+               min_shifts_per_week          = int(self.ta_min_per_week[i]),
+               max_shifts_per_week          = int(self.ta_max_per_week[i]),
+               desired                      = shifts_with(self.availability[i], DESIRED),
+               undesired                    = shifts_with(self.availability[i], UNDESIRED),
+               unavailable                  = shifts_with(self.availability[i], UNAVAILABLE))
+            for i in range(self.num_tas)
+        ]
+        shift_assignments = [ShiftAssignment(id=str(slot_id), shift=shifts[shift_index], assigned_ta=None)
+                             for slot_id, shift_index in zip(self.slot_ids, self.slot_shift)]
+
+        timetable = Timetable(id=self.name,
+                              shifts=shifts,
+                              tas=tas,
+                              shift_assignments=shift_assignments,
+                              constraint_parameters=constraint_parameters if constraint_parameters else ConstraintParameters())
+        timetable.build_availability_index()
+        return timetable
+
+    def to_ortools_schedule(self) -> Any:
+        """Builds the OR-tools `Schedule` (requires the `ortools_scheduler` package).
+
+        TA and shift ids are the dense indices, as the OR-tools model indexes `availability_as_array_int` by shift id.
+        Neutral shifts map to None, like a series missing from an availability form.
+        """
+        try:
+            from ortools_scheduler.domain import TA as OrToolsTA, Shift as OrToolsShift, Schedule, AvailabilityStatus
+        except ImportError as error:
+            raise ImportError("to_ortools_schedule requires the 'ortools_scheduler' package (ta-scheduler-ortools)") from error
+
+        int_by_code = {DESIRED: AvailabilityStatus.DESIRED, UNDESIRED: AvailabilityStatus.UNDESIRED,
+                       UNAVAILABLE: AvailabilityStatus.UNAVAILABLE, NEUTRAL: None}
+        status_by_code = {DESIRED: "Desired", UNDESIRED: "Undesired", UNAVAILABLE: "Unavailable"}
+        start_of_day = self.shift_start % MINUTES_PER_DAY
+
+        schedule = Schedule()
+        for i in range(self.num_shifts):
+            schedule.shifts.append(OrToolsShift(
+                id                  = i,
+                name                = str(self.shift_aliases[i]),
+                req_ta_per_shift    = int(self.shift_required_tas[i]),
+                series              = str(self.series_names[self.shift_series[i]]),
+                day_of_week         = DAYS_OF_WEEK[self.shift_day[i]],
+                date                = self.shift_date[i].item(),
+                start_time          = time(int(start_of_day[i]) // 60, int(start_of_day[i]) % 60),
+                duration            = timedelta(minutes=int(self.shift_end[i] - self.shift_start[i])),
+            ))
+        for i in range(self.num_tas):
+            row = self.availability[i]
+            schedule.tas.append(OrToolsTA(
+                id                          = i,
+                macid                       = str(self.ta_ids[i]),
+                name                        = str(self.ta_names[i]),
+                req_shift_per_week          = int(self.ta_max_per_week[i]),
+                availability_as_dict        = {str(self.series_names[self.shift_series[j]]): status_by_code[code]
+                                               for j, code in enumerate(row.tolist()) if code in status_by_code},
+                availability_as_array_int   = [int_by_code[code] for code in row.tolist()],
+            ))
+        return schedule
+
+# ============================
+# Availability forms
+# ============================
+def read_availability_form(file_path: str, availability_tbl_name: str = "availability_tbl") -> Tuple[str, Dict[str, str]]:
+    """Reads one availability form (sheet 'availability', macid in B1) and returns (macid, {series: status})."""
+    worksheet = openpyxl.load_workbook(file_path)["availability"]
+    if availability_tbl_name not in worksheet.tables:
+        raise ValueError(f"Table '{availability_tbl_name}' not found in {file_path}")
+
+    rows    = [[cell.value for cell in row] for row in worksheet[worksheet.tables[availability_tbl_name].ref]]
+    headers = rows[0]
+    series_column, status_column = headers.index("Shift Series"), headers.index("Availability")
+    return worksheet["B1"].value, {row[series_column]: row[status_column] for row in rows[1:] if row[series_column] is not None}
+
+def find_availability_forms(directory: str) -> List[str]:
+    return sorted(str(file) for file in Path(directory).glob("*.xlsx") if not file.name.startswith("~$"))  # Exclude lock files, no recursive search
+
+def read_availability_folder(directory: str) -> Dict[str, Dict[str, str]]:
+    """Reads every availability form of the folder: {macid: {series: status}}."""
+    return dict(read_availability_form(file_path) for file_path in find_availability_forms(directory))
@@ -0,0 +1,93 @@
+import logging
+
+from dataclasses    import dataclass
+from typing         import List, Optional
+
+# Custom Imports
+from hello_world.domain         import Timetable
+from hello_world.feasibility    import check_feasibility, FeasibilityResult
+from hello_world.partition      import WeekPartition, allocate_semester_budget
+
+@dataclass
+class HorizonPlan:
+    """Split of the semester for one re-plan: frozen past weeks, the planning window and the coarsely planned future."""
+    past_weeks: List[int]
+    window_weeks: List[int]
+    future_weeks: List[int]
+    window: WeekPartition               # the window with each TA's share of the remaining semester requirement
+    feasibility: FeasibilityResult      # max-flow assignment of the whole semester (past weeks fixed)
+
+    def __str__(self):
+        return f"{len(self.past_weeks)} past week(s), window {self.window_weeks}, {len(self.future_weeks)} future week(s)"
+
+def freeze_past_weeks(problem: Timetable, current_week: int) -> int:
+    """Pins the assignments of the weeks before `current_week` and clears the unpinned ones from then on.
+
+    The past assignments become facts that still count toward the semester totals; the later ones are
+    re-planned. Returns the number of frozen assignments.
+    """
+    frozen = 0
+    for assignment in problem.shift_assignments:
+        if assignment.shift.week_id < current_week:
+            if assignment.assigned_ta is not None:
+                assignment.pinned = True
+                frozen += 1
+        elif not assignment.pinned:
+            assignment.assigned_ta = None
+    return frozen
+
+def plan_horizon(problem: Timetable, current_week: int, horizon_weeks: int, logger: Optional[logging.Logger] = None) -> HorizonPlan:
+    """Allocates the remaining semester requirements between the window [current_week, current_week + horizon_weeks) and the later weeks.
+
+    Expects the past weeks to be frozen (see freeze_past_weeks): the max-flow check keeps the assignments
+    already in the timetable, so the window budgets account for the shifts the TAs have already worked.
+    """
+    week_ids        = sorted({shift.week_id for shift in problem.shifts})
+    past_weeks      = [week_id for week_id in week_ids if week_id < current_week]
+    window_weeks    = [week_id for week_id in week_ids if current_week <= week_id < current_week + horizon_weeks]
+    future_weeks    = [week_id for week_id in week_ids if week_id >= current_week + horizon_weeks]
+    if not window_weeks:
+        raise ValueError(f"No weeks to plan from week {current_week} (the problem has weeks {week_ids[0]}-{week_ids[-1]})")
+
+    feasibility = check_feasibility(problem)
+    # the past weeks keep what was worked in them, even where a slot was left unassigned
+    budget      = allocate_semester_budget(problem, [past_weeks, window_weeks, future_weeks], feasibility=feasibility, fixed_blocks=[0])
+    plan = HorizonPlan(past_weeks   = past_weeks,
+                       window_weeks = window_weeks,
+                       future_weeks = future_weeks,
+                       window       = WeekPartition(index=current_week, week_ids=window_weeks, ta_budget=budget[:, 1]),
+                       feasibility  = feasibility)
+    if logger:
+        logger.info(f"\tRolling horizon from week {current_week}: {plan}.")
+    return plan
+
+def seed_window(window_problem: Timetable, problem: Timetable, plan: HorizonPlan) -> int:
+    """Starts the window problem from the max-flow assignment, so the solver starts feasible and only improves
+    the preferences; returns the number of slots set."""
+    if not plan.feasibility.is_feasible:
+        return 0
+    ta_id_by_assignment_id  = {assignment.id: problem.tas[ta_index].id
+                               for assignment, ta_index in zip(problem.shift_assignments, plan.feasibility.slot_ta.tolist())}
+    ta_by_id                = {ta.id: ta for ta in window_problem.tas}
+    seeded = 0
+    for assignment in window_problem.shift_assignments:
+        if assignment.assigned_ta is None:
+            assignment.assigned_ta = ta_by_id[ta_id_by_assignment_id[assignment.id]]
+            seeded += 1
+    return seeded
+
+def apply_coarse_plan(problem: Timetable, plan: HorizonPlan) -> int:
+    """Fills the unassigned slots of the future weeks from the max-flow assignment; returns the number of slots set.
+
+    The future weeks are only planned coarsely: the assignment meets the hard constraints but ignores the
+    preferences, and is re-planned once the weeks enter the window.
+    """
+    if not plan.feasibility.is_feasible:
+        return 0
+    future_weeks = set(plan.future_weeks)
+    filled = 0
+    for assignment, ta_index in zip(problem.shift_assignments, plan.feasibility.slot_ta.tolist()):
+        if assignment.assigned_ta is None and assignment.shift.week_id in future_weeks:
+            assignment.assigned_ta = problem.tas[ta_index]
+            filled += 1
+    return filled
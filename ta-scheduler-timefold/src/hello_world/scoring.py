@@ -0,0 +1,209 @@
+import numpy as np
+
+from dataclasses    import dataclass
+from typing         import Any, Dict, Iterable, List, Optional
+
+# Custom Imports
+from hello_world.domain         import Timetable, ConstraintParameters
+from hello_world.problem_ir     import CompiledProblem, DESIRED, UNDESIRED, UNAVAILABLE
+
+HARD, MEDIUM, SOFT = 0, 1, 2
+
+# Constraint names (as_constraint) of TimetableConstraintGenBasic and TimetableConstraintGenTabrizEdition, in order
+CONSTRAINT_NAMES_BY_VERSION: Dict[str, List[str]] = {
+    "default": [
+        "Shift does not meet required TAs exactly",
+        "TA duplicate shift assignment",
+        "TA assigned to unavailable shift",
+        "TA MUST work EXACTLY their required shifts over the SEMESTER",
+        "TA works MORE than the required shifts per week",
+        "TA works LESS than the required shifts per week",
+        "TA assigned to >>undesired<< shift",
+        "TA assigned to *desired* shift",
+    ],
+}
+CONSTRAINT_NAMES_BY_VERSION["tabriz"] = CONSTRAINT_NAMES_BY_VERSION["default"] + [
+    "Overlapping shifts in time",
+    "reward_assignment_to_consecutive_shifts",
+]
+CONSTRAINT_PACKAGE = Timetable.__module__     # ConstraintRef.package_name of the constraints (the solution class' module)
+
+def format_score(hard: int, medium: int, soft: int) -> str:
+    """Formats a score like str(HardMediumSoftScore)."""
+    return f"{hard}hard/{medium}medium/{soft}soft"
+
+@dataclass
+class BatchScoreAnalysis:
+    """Per-constraint scores and match counts of a batch of assignments (one row per assignment).
+
+    Matches ScoreAnalysis: constraint_ids are the ConstraintRef.constraint_id, the match counts the
+    ConstraintAnalysis.match_count, and init_scores count the unassigned slots like the init score.
+    """
+    constraint_names:   List[str]
+    constraint_levels:  np.ndarray      # [num_constraints] HARD, MEDIUM or SOFT
+    constraint_scores:  np.ndarray      # int64 [batch, num_constraints]
+    match_counts:       np.ndarray      # int64 [batch, num_constraints]
+    init_scores:        np.ndarray      # int64 [batch]
+
+    def __len__(self) -> int:
+        return len(self.constraint_scores)
+
+    @property
+    def constraint_ids(self) -> List[str]:
+        return [f"{CONSTRAINT_PACKAGE}/{name}" for name in self.constraint_names]
+
+    @property
+    def scores(self) -> np.ndarray:
+        """Total (hard, medium, soft) scores [batch, 3]."""
+        return np.stack([self.constraint_scores[:, self.constraint_levels == level].sum(axis=1) for level in (HARD, MEDIUM, SOFT)], axis=1)
+
+    def score_str(self, index: int) -> str:
+        hard, medium, soft = self.scores[index].tolist()
+        score = format_score(hard, medium, soft)
+        return f"{self.init_scores[index]}init/{score}" if self.init_scores[index] else score
+
+    def constraint_map(self, index: int) -> Dict[str, Dict[str, Any]]:
+        """Breakdown of one row in the format of the benchmark results ({constraint_id: {"score", "match_count"}})."""
+        breakdown = {}
+        for column, (constraint_id, level) in enumerate(zip(self.constraint_ids, self.constraint_levels.tolist())):
+            score = [0, 0, 0]
+            score[level] = int(self.constraint_scores[index, column])
+            breakdown[constraint_id] = {"score": format_score(*score), "match_count": int(self.match_counts[index, column])}
+        return breakdown
+
+class BatchScorer:
+    """Scores many assignments of one problem at once with the constraints of a constraint version.
+
+    Every constraint is computed from the assignment counts per (TA, shift) of each row, so a batch is a few
+    array reductions; rows are processed in chunks of `chunk_size` to bound the memory of the counts.
+    """
+    def __init__(self, problem: CompiledProblem, constraint_parameters: Optional[ConstraintParameters] = None,
+                 constraint_version: str = "default", chunk_size: int = 256):
+        if constraint_version not in CONSTRAINT_NAMES_BY_VERSION:
+            raise ValueError(f"Invalid constraint version: {constraint_version}. Available versions: {list(CONSTRAINT_NAMES_BY_VERSION)}")
+        parameters              = constraint_parameters if constraint_parameters else ConstraintParameters()
+        self.problem            = problem
+        self.constraint_version = constraint_version
+        self.constraint_names   = CONSTRAINT_NAMES_BY_VERSION[constraint_version]
+        self.chunk_size         = chunk_size
+
+        self.undesired          = (problem.availability == UNDESIRED).astype(np.int64)
+        self.desired            = (problem.availability == DESIRED).astype(np.int64)
+        self.unavailable        = (problem.availability == UNAVAILABLE).astype(np.int64)
+        self.undesired_penalty  = parameters.undesired_assignment_penalty
+        self.desired_reward     = parameters.desired_assignment_reward
+        self.series_reward      = parameters.same_sereis_assignment_reward
+        # shift -> week / series one-hot matrices, to count per (TA, week) and (TA, series) with a matmul
+        self.week_one_hot       = np.eye(problem.num_of_weeks, dtype=np.int64)[problem.shift_week]
+        self.series_one_hot     = np.eye(len(problem.series_names), dtype=np.int64)[problem.shift_series]
+        start, end              = problem.shift_start, problem.shift_end
+        self.conflict           = ((start[:, None] < end[None, :]) & (start[None, :] < end[:, None])).astype(np.int64)
+        np.fill_diagonal(self.conflict, 0)
+        self.levels = np.array([HARD, HARD, HARD, HARD, MEDIUM, MEDIUM, SOFT, SOFT, HARD, SOFT][:len(self.constraint_names)])
+
+    @classmethod
+    def from_timetable(cls, timetable: Timetable, constraint_version: str = "default", **kwargs) -> 'BatchScorer':
+        return cls(CompiledProblem.from_timetable(timetable), timetable.constraint_parameters, constraint_version, **kwargs)
+
+    # ----------------------------
+    # Inputs
+    # ----------------------------
+    def counts_from_slot_ta(self, slot_ta: np.ndarray) -> np.ndarray:
+        """Assignment counts [batch, num_tas, num_shifts] of TA indices per slot [batch, num_slots] (-1: unassigned)."""
+        problem     = self.problem
+        slot_ta     = np.asarray(slot_ta, dtype=np.int64).reshape(-1, problem.num_slots)
+        rows, slots = np.nonzero(slot_ta >= 0)
+        flat_index  = (rows * problem.num_tas + slot_ta[rows, slots]) * problem.num_shifts + problem.slot_shift[slots]
+        counts      = np.bincount(flat_index, minlength=len(slot_ta) * problem.num_tas * problem.num_shifts)
+        return counts.reshape(len(slot_ta), problem.num_tas, problem.num_shifts)
+
+    def slot_ta_from_timetables(self, timetables: Iterable[Timetable]) -> np.ndarray:
+        """TA indices per slot [batch, num_slots] of solutions of this problem, matched by assignment and TA ids."""
+        slot_by_id  = {slot_id: slot for slot, slot_id in enumerate(self.problem.slot_ids.tolist())}
+        ta_by_id    = {ta_id: index for index, ta_id in enumerate(self.problem.ta_ids.tolist())}
+        rows = []
+        for timetable in timetables:
+            row = np.full(self.problem.num_slots, -1, dtype=np.int64)
+            for assignment in timetable.shift_assignments:
+                if assignment.assigned_ta is not None:
+                    row[slot_by_id[assignment.id]] = ta_by_id[assignment.assigned_ta.id]
+            rows.append(row)
+        return np.array(rows, dtype=np.int64).reshape(-1, self.problem.num_slots)
+
+    # ----------------------------
+    # Scoring
+    # ----------------------------
+    def score_slot_ta(self, slot_ta: np.ndarray) -> BatchScoreAnalysis:
+        """Scores TA indices per slot [batch, num_slots] (-1: unassigned)."""
+        slot_ta = np.asarray(slot_ta, dtype=np.int64).reshape(-1, self.problem.num_slots)
+        analyses = [self.score_counts(self.counts_from_slot_ta(chunk), unassigned=(chunk < 0).sum(axis=1))
+                    for chunk in np.split(slot_ta, range(self.chunk_size, len(slot_ta), self.chunk_size))]
+        return BatchScoreAnalysis(constraint_names  = self.constraint_names,
+                                  constraint_levels = self.levels,
+                                  constraint_scores = np.concatenate([analysis.constraint_scores for analysis in analyses]),
+                                  match_counts      = np.concatenate([analysis.match_counts for analysis in analyses]),
+                                  init_scores       = np.concatenate([analysis.init_scores for analysis in analyses]))
+
+    def score_timetables(self, timetables: Iterable[Timetable]) -> BatchScoreAnalysis:
+        """Scores solutions of this problem (e.g., pickled solutions or converted OR-tools schedules)."""
+        return self.score_slot_ta(self.slot_ta_from_timetables(timetables))
+
+    def score_counts(self, counts: np.ndarray, unassigned: Optional[np.ndarray] = None) -> BatchScoreAnalysis:
+        """Scores assignment counts [batch, num_tas, num_shifts] (e.g., 0/1 assignment matrices of another solver)."""
+        problem = self.problem
+        counts  = np.asarray(counts, dtype=np.int64).reshape(-1, problem.num_tas, problem.num_shifts)
+        scores, matches = [], []
+
+        def add(score: np.ndarray, match_count: np.ndarray) -> None:
+            scores.append(score)
+            matches.append(match_count)
+
+        # Hard: staffing of the shifts with at least one assignment
+        shift_count = counts.sum(axis=1)
+        deviation   = np.abs(problem.shift_required_tas[None, :] - shift_count) * (shift_count > 0)
+        add(-deviation.sum(axis=1), (deviation > 0).sum(axis=1))
+        # Hard: TAs assigned twice to a shift (once per TA)
+        duplicate = (counts > 1).any(axis=2)
+        add(-duplicate.sum(axis=1), duplicate.sum(axis=1))
+        # Hard: assignments to unavailable shifts (squared per TA)
+        unavailable = (counts * self.unavailable).sum(axis=2)
+        add(-(unavailable ** 2).sum(axis=1), (unavailable > 0).sum(axis=1))
+        # Hard: semester requirement (all TAs, including the ones without assignments)
+        deviation = np.abs(counts.sum(axis=2) - problem.ta_required_per_semester[None, :])
+        add(-deviation.sum(axis=1), (deviation > 0).sum(axis=1))
+        # Medium: weekly bounds of the (TA, week) pairs with at least one assignment
+        week_count  = counts @ self.week_one_hot
+        over        = np.maximum(week_count - problem.ta_max_per_week[None, :, None], 0)
+        under       = np.maximum(problem.ta_min_per_week[None, :, None] - week_count, 0) * (week_count > 0)
+        add(-over.sum(axis=(1, 2)), (over > 0).sum(axis=(1, 2)))
+        add(-under.sum(axis=(1, 2)), (under > 0).sum(axis=(1, 2)))
+        # Soft: preferences (one match per assignment)
+        undesired   = (counts * self.undesired).sum(axis=(1, 2))
+        desired     = (counts * self.desired).sum(axis=(1, 2))
+        add(-undesired * self.undesired_penalty, undesired)
+        add(desired * self.desired_reward, desired)
+
+        if self.constraint_version == "tabriz":
+            # Hard: pairs of assignments of a TA to overlapping shifts
+            overlapping = ((counts @ self.conflict) * counts).sum(axis=(1, 2)) // 2
+            add(-overlapping, overlapping)
+            # Soft: assignments of a TA to the same series beyond the first
+            series_count = counts @ self.series_one_hot
+            add((np.maximum(series_count - 1, 0) * self.series_reward).sum(axis=(1, 2)), (series_count > 1).sum(axis=(1, 2)))
+
+        return BatchScoreAnalysis(constraint_names  = self.constraint_names,
+                                  constraint_levels = self.levels,
+                                  constraint_scores = np.stack(scores, axis=1).astype(np.int64),
+                                  match_counts      = np.stack(matches, axis=1).astype(np.int64),
+                                  init_scores       = -(np.zeros(len(counts), dtype=np.int64) if unassigned is None else np.asarray(unassigned, dtype=np.int64)))
+
+def analyze_solutions(solutions: Iterable[Timetable], constraint_version: str = "default") -> List[Dict[str, Any]]:
+    """Re-scores solutions of possibly different problems (e.g., the solutions of a baseline.pkl) without Timefold.
+
+    Returns, per solution, its score and constraint breakdown in the format of the benchmark results.
+    """
+    results = []
+    for solution in solutions:
+        analysis = BatchScorer.from_timetable(solution, constraint_version).score_timetables([solution])
+        results.append({"score": analysis.score_str(0), "constraint_map": analysis.constraint_map(0)})
+    return results
@@ -0,0 +1,127 @@
+import time
+import threading
+
+from array          import array
+from collections    import deque
+from dataclasses    import dataclass
+from datetime       import datetime
+from typing         import Any, Deque, Dict, List, Optional, Tuple
+
+from timefold.solver.score import HardMediumSoftScore
+
+from hello_world.domain           import Timetable
+from hello_world.solution_events  import BestSolutionEvent, read_assignments
+
+DEFAULT_HISTORY_SIZE = 256     # best solutions kept per job; a 2.5 min solve of a semester finds a few hundred
+
+@dataclass(frozen=True)
+class SolutionRecord:
+    """One best solution of a job: when it was found, its score and its assignment vector.
+
+    `assignment[i]` is the index in SolutionHistory.ta_ids of the TA of the i-th shift assignment (-1 if unassigned),
+    so a record of a semester (a few thousand assignments) takes a few kilobytes instead of a Timetable clone.
+    """
+    index           : int           # position among all the best solutions of the job (records may have been dropped)
+    elapsed_seconds : float         # since the job was submitted
+    timestamp       : datetime
+    score           : HardMediumSoftScore
+    assignment      : array
+
+    @property
+    def is_feasible(self) -> bool:
+        return self.score.is_feasible
+
+class SolutionHistory:
+    """Bounded history of the best solutions of a solver job (see TimetableSolverWithSolverManager).
+
+    Keeps the last `max_records` SolutionRecords, the latest full solution (None after an event without one, see
+    hello_world.solution_events) and the first feasible record (even once it has been dropped from the ring), so
+    time-to-feasible and the score over time are available after the job.
+    Solutions are added from the solver's consumer thread and read from any thread.
+    """
+    def __init__(self, max_records: int = DEFAULT_HISTORY_SIZE):
+        self.max_records                        = max_records
+        self.started_at                         = time.perf_counter()
+        self.latest_solution : Optional[Timetable]      = None
+        self.first_feasible  : Optional[SolutionRecord] = None
+        self.shift_assignment_ids : List[str]   = []    # from the first solution: the order of the assignment vectors
+        self.ta_ids          : List[str]        = []    # in the order they were first assigned
+        self._ta_indices     : Dict[str, int]   = {}
+        self._records        : Deque[SolutionRecord] = deque(maxlen=max_records)
+        self._count          : int              = 0
+        self._lock                              = threading.Lock()
+
+    def add(self, solution: Timetable) -> SolutionRecord:
+        """Records a new best solution; it replaces the previous one as the latest solution."""
+        return self.add_assignments(solution.score, read_assignments(solution), solution=solution)
+
+    def add_event(self, event: BestSolutionEvent) -> SolutionRecord:
+        """Records the solution of an event (see hello_world.solution_events); a final solution that the last
+        record already holds only becomes the latest solution."""
+        latest = self.latest
+        if event.is_final and latest is not None and not event.changed and latest.score == event.score:
+            self.latest_solution = event.solution
+            return latest
+        return self.add_assignments(event.score, event.assignments, solution=event.solution)
+
+    def add_assignments(self, score: HardMediumSoftScore, assignments: Dict[str, Optional[str]],
+                        solution: Optional[Timetable] = None) -> SolutionRecord:
+        """Records a new best solution from its score and {shift assignment id: TA id}."""
+        elapsed = time.perf_counter() - self.started_at
+        with self._lock:
+            if not self.shift_assignment_ids:
+                self.shift_assignment_ids = list(assignments)
+            ta_indices = self._ta_indices
+            for ta_id in assignments.values():
+                if ta_id is not None and ta_id not in ta_indices:
+                    ta_indices[ta_id] = len(self.ta_ids)
+                    self.ta_ids.append(ta_id)
+            assignment  = array("i", (-1 if (ta_id := assignments.get(assignment_id)) is None else ta_indices[ta_id]
+                                      for assignment_id in self.shift_assignment_ids))
+            record      = SolutionRecord(index=self._count, elapsed_seconds=elapsed, timestamp=datetime.now(),
+                                         score=score, assignment=assignment)
+            self._records.append(record)
+            self._count += 1
+            self.latest_solution = solution
+            if self.first_feasible is None and record.is_feasible:
+                self.first_feasible = record
+            return record
+
+    def records(self) -> List[SolutionRecord]:
+        """The kept records, oldest first."""
+        with self._lock:
+            return list(self._records)
+
+    @property
+    def latest(self) -> Optional[SolutionRecord]:
+        with self._lock:
+            return self._records[-1] if self._records else None
+
+    @property
+    def total_count(self) -> int:
+        """Number of best solutions added, including the dropped ones."""
+        return self._count
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def time_to_feasible(self) -> Optional[float]:
+        """Seconds from the submission of the job to its first feasible solution; None if none was found."""
+        return self.first_feasible.elapsed_seconds if self.first_feasible is not None else None
+
+    def score_trajectory(self) -> List[Tuple[float, HardMediumSoftScore]]:
+        """(elapsed seconds, score) of the kept records."""
+        return [(record.elapsed_seconds, record.score) for record in self.records()]
+
+    def assignments(self, record: SolutionRecord) -> Dict[str, Optional[str]]:
+        """{shift assignment id: TA id} of a record."""
+        return {assignment_id: self.ta_ids[ta_index] if ta_index >= 0 else None
+                for assignment_id, ta_index in zip(self.shift_assignment_ids, record.assignment)}
+
+    def summary(self) -> Dict[str, Any]:
+        """JSON-friendly summary for the benchmark results: counts, time-to-feasible and the score trajectory."""
+        return {
+            "best_solution_count"   : self.total_count,
+            "time_to_feasible"      : self.time_to_feasible(),
+            "score_trajectory"      : [[round(elapsed, 3), str(score)] for elapsed, score in self.score_trajectory()],
+        }
@@ -3,9 +3,10 @@ import logging
 import sys, os
 import uuid
 import time
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta
 
-from typing     import List, Dict, Callable, Any, Tuple, Optional
+from typing     import List, Dict, Callable, Any, Tuple, Optional, Iterable
 from pathlib    import Path
 from tqdm       import tqdm
 from abc        import ABC, abstractmethod
@@ -13,16 +14,50 @@ from functools import partial
 
 
 from timefold.solver.config import (SolverConfig, ScoreDirectorFactoryConfig,
-                                    TerminationConfig, Duration)
-from timefold.solver        import SolverFactory, SolutionManager, Solver, SolverManager, SolverStatus, SolverJob
+                                    TerminationConfig, Duration, MoveThreadCount, SolverConfigOverride)
+from timefold.solver        import SolverFactory, SolutionManager, Solver, SolverManager, SolverStatus, SolverJob, SolverJobBuilder
 from timefold.solver.score  import ScoreAnalysis
 
 from hello_world.domain      import Timetable, ShiftAssignment, Shift, TA
 from hello_world.constraints import constraints_provider_dict               # a dictionary mapping constraint versions to their provider functions
 from hello_world.utils       import print_timetable
-
-LOOP_WAIT_SECONDS           = 5     # seconds to wait between checking the solver job status
-SUPPORTED_SOLVING_METHODS   = ["solver_manager", "blocking", "tqdm"]
+from hello_world.capacity    import analyze_capacity, CapacityReport
+from hello_world.feasibility import check_feasibility, apply_warm_start, FeasibilityResult
+from hello_world.warm_start  import seed_from_solution, SeedResult
+from hello_world.partition   import create_partitions, build_partition_problem, solve_partitions, merge_partition_solutions
+from hello_world.local_search import solve_with_local_search, LocalSearchResult
+from hello_world.rolling_horizon import freeze_past_weeks, plan_horizon, seed_window, apply_coarse_plan, HorizonPlan
+from hello_world.constraint_profiling import ConstraintProfiler, format_constraint_profile
+from hello_world.solver_cache import CachedSolverFactory, solver_cache_key, get_cached_solver_factory
+from hello_world.async_jobs   import AsyncSolverJob
+from hello_world.solution_history import SolutionHistory, DEFAULT_HISTORY_SIZE
+from hello_world.solution_events  import BestSolutionEvent, BestSolutionThrottle
+
+LOOP_WAIT_SECONDS           = 5     # seconds between two status logs while waiting for a solver job
+SUPPORTED_SOLVING_METHODS   = ["solver_manager", "blocking", "tqdm", "partitioned", "rolling_horizon", "local_search"]
+
+def parse_move_thread_count(move_thread_count: int | str | MoveThreadCount | None) -> int | MoveThreadCount:
+    """Maps a move thread count from the config JSON or the CLI ("AUTO", "NONE", a number or None) to SolverConfig.move_thread_count.
+
+    Multithreaded incremental solving requires the Timefold enterprise edition; SolverFactory.create raises a
+    RequiresEnterpriseError otherwise.
+    """
+    if move_thread_count is None:
+        return MoveThreadCount.NONE
+    if isinstance(move_thread_count, MoveThreadCount):
+        return move_thread_count
+    if isinstance(move_thread_count, str) and not move_thread_count.isdigit():
+        if move_thread_count.upper() not in MoveThreadCount.__members__:
+            raise ValueError(f"Invalid move thread count: {move_thread_count}. Use a number or one of {list(MoveThreadCount.__members__)}")
+        return MoveThreadCount[move_thread_count.upper()]
+    if int(move_thread_count) < 1:
+        raise ValueError(f"Invalid move thread count: {move_thread_count}. It must be at least 1.")
+    return int(move_thread_count)
+
+def duration_to_seconds(duration: Duration) -> float:
+    """Total seconds of a timefold Duration (without going through java.time)."""
+    return (duration.milliseconds / 1000 + duration.seconds + 60 * duration.minutes
+            + 3600 * duration.hours + 86400 * duration.days)
 
 class TimetableSolverBase(ABC):
     def __init__(self, 
@@ -30,7 +65,11 @@ class TimetableSolverBase(ABC):
                  logger: logging.Logger, 
                  random_seed: int | None = None,
                  path_to_config_xml: Path | str | None = None,
-                 use_config_xml: bool = False):
+                 use_config_xml: bool = False,
+                 warm_start: bool = False,
+                 move_thread_count: int | str | None = None,
+                 profile_constraints: bool = False,
+                 use_solver_cache: bool = True):
         """ Initializes the TimetableSolver with the given parameters."""
         # Store the parameters
         self.constraint_version = constraint_version
@@ -38,6 +77,10 @@ class TimetableSolverBase(ABC):
         self.logger             = logger
         self.path_to_config_xml = Path(path_to_config_xml) if path_to_config_xml else None
         self.use_config_xml     = use_config_xml
+        self.warm_start         = warm_start    # start the solver from the max-flow assignment (see hello_world.feasibility)
+        self.move_thread_count  = parse_move_thread_count(move_thread_count)    # NONE: single-threaded solving
+        self.profile_constraints = profile_constraints  # count and time the constraint-stream callbacks (see hello_world.constraint_profiling)
+        self.use_solver_cache   = use_solver_cache      # share the SolverFactory of the configuration across the process (see hello_world.solver_cache)
 
         # class constants
         self.default_term_time_budget           : Duration =  Duration(minutes=2, seconds=30)
@@ -46,6 +89,19 @@ class TimetableSolverBase(ABC):
         # attributes to hold the solver configuration and factory
         self.solver_config     : Optional[SolverConfig]  = None
         self.solver_factory    : Optional[SolverFactory] = None
+        # the factory with its SolverManager/SolutionManager, shared with the solvers of the same configuration
+        self.cached_factory    : Optional[CachedSolverFactory] = None
+        # result of the last sanity check (see hello_world.capacity)
+        self.capacity_report   : Optional[CapacityReport] = None
+        # result of the last max-flow feasibility check (only computed with warm_start)
+        self.feasibility_result: Optional[FeasibilityResult] = None
+        # result of seeding the last problem from a previous solution
+        self.seed_result       : Optional[SeedResult] = None
+        # wall-clock time of the last solve (see get_solving_duration)
+        self.solve_duration    : Optional[timedelta] = None
+        # callback counters of the constraints (only with profile_constraints) and their report for the last solve
+        self.constraint_profiler: Optional[ConstraintProfiler] = None
+        self.constraint_profile : Optional[Dict[str, Dict[str, Any]]] = None
 
         # Validate the inputs
         self._validate_inputs()
@@ -54,22 +110,30 @@ class TimetableSolverBase(ABC):
     def set_random_seed(self, seed: int):
         """Sets the random seed for the solver."""
         self.random_seed = seed
-        if self.solver_config is not None:
-            self.solver_config.random_seed = seed
+        if self.solver_config is not None:     # the factory was built with the previous seed (and may be shared)
+            self.solver_config = self.solver_factory = self.cached_factory = None
         
 
-    def solve_problem(self, problem: Timetable, log_solution: bool = True) -> Timetable:
-        """Wrapper for the solve methods"""
-        self._validate_inputs()
-        logger = self.logger
+    def solve_problem(self, problem: Timetable, log_solution: bool = True,
+                      previous_solution: Optional[Timetable] = None, pinned_weeks: Iterable[int] = ()) -> Timetable:
+        """Wrapper for the solve methods
 
-        logger.info("\n🚀 === Starting to Solve the Problem ===")
-        logger.info(f"\tRunning a sanity check on the problem...")
-        self.sanity_check(problem=problem)
+        With a `previous_solution` (e.g., loaded with hello_world.warm_start.load_previous_solution), the solve
+        starts from its assignments, and the ones in `pinned_weeks` are pinned so only the rest is searched.
+        """
+        logger = self.logger
+        self._prepare_problem(problem, previous_solution=previous_solution, pinned_weeks=pinned_weeks)
 
         # Solve the problem based on the solving method (extended in child classes)
+        if self.constraint_profiler is not None:
+            self.constraint_profiler.reset()
+        start_time = time.perf_counter()
         solution = self._solve_problem_body(problem=problem)
+        self.solve_duration = timedelta(seconds=time.perf_counter() - start_time)
         logger.info("✅ === Solver Finished Successfully ===")
+        if self.constraint_profiler is not None:
+            self.constraint_profile = self.constraint_profiler.report()
+            logger.info(f"\n⏱️ === Constraint Profile ===\n{format_constraint_profile(self.constraint_profile)}")
 
         # Visualize the final solution
         if log_solution:
@@ -79,12 +143,33 @@ class TimetableSolverBase(ABC):
                 
         return solution
     
+    def _prepare_problem(self, problem: Timetable, previous_solution: Optional[Timetable] = None, pinned_weeks: Iterable[int] = ()) -> None:
+        """Indexes, seeds and checks the problem before a solve."""
+        self._validate_inputs()
+        logger = self.logger
+
+        logger.info("\n🚀 === Starting to Solve the Problem ===")
+        logger.info(f"\tBuilding the availability index...")
+        problem.build_availability_index()
+        if previous_solution is not None:
+            self.seed_result = seed_from_solution(problem, previous_solution, pinned_weeks=pinned_weeks, logger=logger)
+        logger.info(f"\tRunning a sanity check on the problem...")
+        self.sanity_check(problem=problem)
+        if self.warm_start:
+            self.initialize_from_max_flow(problem=problem)
+
+    def get_solving_duration(self) -> timedelta:
+        """Solving time of the last solve (overridden where the solver reports its own)."""
+        if self.solve_duration is None:
+            raise ValueError("no problem was solved with this solver")
+        return self.solve_duration
+
     # Post-processing Methods
     def post_process_solution(self, solution: Timetable, log_analysis: bool = True) -> ScoreAnalysis:
         # Post-process (justification, analysis, etc.)
         logger = self.logger
         logger.info("\n📊 === Post-processing the Solution ===")
-        solution_manager = SolutionManager.create(solver_factory=self.solver_factory)
+        solution_manager = self.get_solution_manager()
 
         # logger.info("=======================================================")
         # logger.info("calling solver.explain to explain the constraints")
@@ -104,7 +189,7 @@ class TimetableSolverBase(ABC):
         return score_analysis
 
     def visualize_hot_planning_vars(self, solution: Timetable):
-        solution_manager = SolutionManager.create(self.solver_factory)
+        solution_manager = self.get_solution_manager()
         score_explanation = solution_manager.explain(solution)
         indictment_map = score_explanation.indictment_map
         for assignment in solution.shift_assignments:
@@ -123,7 +208,7 @@ class TimetableSolverBase(ABC):
         """ Create the solver configuration based on the constraint version """
         
         # Get the appropriate constraints provider function
-        constraints_provider_function = constraints_provider_dict[self.constraint_version]
+        constraints_provider_function = self._get_constraints_provider_function()
         
         # Create the solver configuration
         self.solver_config =  SolverConfig(
@@ -133,6 +218,7 @@ class TimetableSolverBase(ABC):
             score_director_factory_config=ScoreDirectorFactoryConfig(
                 constraint_provider_function=constraints_provider_function
             ),
+            move_thread_count=self.move_thread_count,
             termination_config=TerminationConfig(
                 # The solver runs only for 5 seconds on this small dataset.
                 # It's recommended to run for at least 5 minutes ("5m") otherwise.
@@ -150,7 +236,7 @@ class TimetableSolverBase(ABC):
         else:
             raise ValueError("Path to solver config XML must be provided.")
         # Get the appropriate constraints provider function
-        constraints_provider_function = constraints_provider_dict[self.constraint_version]
+        constraints_provider_function = self._get_constraints_provider_function()
         # Create the solver configuration
         solver_config = SolverConfig.create_from_xml_resource(path=self.path_to_solver_config)
         # specify the domain's classes/functions
@@ -161,11 +247,21 @@ class TimetableSolverBase(ABC):
             )
         if self.random_seed is not None:
             solver_config.random_seed = self.random_seed
+        if self.move_thread_count is not MoveThreadCount.NONE:
+            solver_config.move_thread_count = self.move_thread_count
 
         # update local attributes
         self.solver_config = solver_config
         return self.solver_config
     
+    def _get_constraints_provider_function(self) -> Callable:
+        """The provider function of the constraint version, profiled with profile_constraints."""
+        if not self.profile_constraints:
+            return constraints_provider_dict[self.constraint_version]
+        if self.constraint_profiler is None or self.constraint_profiler.constraint_version != self.constraint_version:
+            self.constraint_profiler = ConstraintProfiler(self.constraint_version)
+        return self.constraint_profiler.constraint_provider()
+
     # Abstract Methods
     @abstractmethod
     def _solve_problem_body(self, problem: Timetable) -> Timetable:
@@ -194,8 +290,9 @@ class TimetableSolverBase(ABC):
         # (1) Call the domain's sanity check method
         # ------------------------------------------------------
         self.logger.info("\t(1) Domain-specific sanity checks...")
-        tmp, _ = problem.sanity_check(logger=self.logger)
-        sanity = sanity and tmp
+        self.capacity_report = analyze_capacity(problem)
+        self.capacity_report.log(self.logger)
+        sanity = sanity and self.capacity_report.is_sane
         self.logger.info(f"\t(1) {PASS if sanity else FAIL} Domain-specific sanity checks completed.")
 
         # (2) Check that the number of shift assignments matches the required number
@@ -211,21 +308,65 @@ class TimetableSolverBase(ABC):
 
         return sanity
 
+    def initialize_from_max_flow(self, problem: Timetable) -> FeasibilityResult:
+        """ Checks hard feasibility with a max-flow and loads its assignment into the unassigned shift assignments. """
+        self.logger.info("\t⚡ Computing a max-flow assignment to warm start the solver...")
+        start_time = time.perf_counter()
+        self.feasibility_result = check_feasibility(problem)
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        if self.feasibility_result.is_feasible:
+            self.logger.info(f"\t✅ Max-flow check: {self.feasibility_result} in {elapsed_ms:.1f} ms.")
+        else:
+            self.logger.warning(f"\t❌ Max-flow check: {self.feasibility_result} in {elapsed_ms:.1f} ms; the hard constraints cannot all be met.")
+        apply_warm_start(problem, self.feasibility_result, logger=self.logger)
+        return self.feasibility_result
+
+    def _create_solver_config(self) -> SolverConfig:
+        if self.use_config_xml:
+            return self._create_solver_conffig_from_xml(path_to_solver_config=self.path_to_config_xml)
+        return self._create_solver_config_default()
+
+    def _solver_cache_key(self) -> Tuple:
+        """The configuration of the solver factory, as a key of the process-wide cache."""
+        return solver_cache_key(self.constraint_version,
+                                path_to_config_xml      = self.path_to_config_xml if self.use_config_xml else None,
+                                spent_limit             = duration_to_seconds(self.default_term_time_budget),
+                                unimproved_spent_limit  = duration_to_seconds(self.default_term_unimproved_early_term),
+                                random_seed             = self.random_seed,
+                                move_thread_count       = self.move_thread_count)
+
     def create_solver(self):
         """ Create the solver configuration based on the constraint version """
         self._validate_inputs()
 
-        # Build SolverConfig and SolverFactory
+        # Build SolverConfig and SolverFactory (or reuse the ones of the same configuration)
         self.logger.info("\t⚙️  Creating SolverConfig and SolverFactory...")
-        if self.use_config_xml:
-            self.solver_config =  self._create_solver_conffig_from_xml(path_to_solver_config=self.path_to_config_xml)
+        if self.use_solver_cache and not self.profile_constraints:     # a profiled factory counts the calls of this solver only
+            self.cached_factory = get_cached_solver_factory(self._solver_cache_key(), self._create_solver_config)
         else:
-            self.solver_config =  self._create_solver_config_default()
-
-        self.solver_factory = SolverFactory.create(self.solver_config)
+            solver_config       = self._create_solver_config()
+            self.cached_factory = CachedSolverFactory(solver_config=solver_config, solver_factory=SolverFactory.create(solver_config))
+        self.solver_config  = self.cached_factory.solver_config
+        self.solver_factory = self.cached_factory.solver_factory
 
         self.logger.info("✅ === SolverConfig and SolverFactory Created Successfully ===")
 
+    def get_solution_manager(self) -> SolutionManager:
+        """The SolutionManager of the solver's factory (created with it on first use)."""
+        if self.cached_factory is None:
+            self.create_solver()
+        return self.cached_factory.solution_manager()
+
+    def warm_up(self, seconds: float = 2) -> None:
+        """Creates the solver and solves a small random problem for `seconds`, so the first real solve doesn't pay
+        for the constraint translation nor the JIT compilation; a factory from the cache is only warmed up once."""
+        if self.cached_factory is None:
+            self.create_solver()
+        if seconds > 0 and not self.cached_factory.warmed_up:
+            start_time = time.perf_counter()
+            self.cached_factory.warm_up(seconds=seconds, logger=self.logger)
+            self.logger.info(f"\t🔥 Warmed up the '{self.constraint_version}' solver in {time.perf_counter() - start_time:.1f} seconds.")
+
 class TimetableSolverBlocking(TimetableSolverBase):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -249,13 +390,61 @@ class TimetableSolverBlocking(TimetableSolverBase):
         solution    = solver.solve(problem=problem)
         return solution
 
+class TimetableSolverLocalSearch(TimetableSolverBase):
+    """Solves with the NumPy late acceptance local search (see hello_world.local_search) instead of Timefold.
+
+    Solving needs no SolverFactory, so there is no solver start-up nor Python/Java callback per constraint
+    match; the time budgets are the default termination ones. post_process_solution still analyzes the
+    solution with Timefold, so both backends are scored by the same constraints.
+    """
+    def __init__(self, late_acceptance_size: int = 400, swap_batch_size: int = 64, **kwargs):
+        super().__init__(**kwargs)
+        # Members only relevant for this subclass
+        self.late_acceptance_size   = late_acceptance_size
+        self.swap_batch_size        = swap_batch_size
+        self.local_search_result    : Optional[LocalSearchResult] = None
+
+    # ----------------------------
+    # Abstract methods
+    # ----------------------------
+    def create_solver(self):
+        """Creates the SolverFactory, which is only used to analyze the solutions."""
+        super().create_solver()
+
+    def _solve_problem_body(self, problem: Timetable) -> Timetable:
+        self.logger.info("Solving with the local search...")
+        solution, self.local_search_result = solve_with_local_search(problem,
+                                                                     constraint_version     = self.constraint_version,
+                                                                     seconds                = duration_to_seconds(self.default_term_time_budget),
+                                                                     unimproved_seconds     = duration_to_seconds(self.default_term_unimproved_early_term),
+                                                                     random_seed            = self.random_seed,
+                                                                     late_acceptance_size   = self.late_acceptance_size,
+                                                                     swap_batch_size        = self.swap_batch_size,
+                                                                     logger                 = self.logger)
+        self.logger.info(f"Solver finished: score={solution.score}")
+        return solution
+
+    def post_process_solution(self, solution: Timetable, log_analysis: bool = True) -> ScoreAnalysis:
+        if self.solver_factory is None:
+            self.create_solver()
+        return super().post_process_solution(solution=solution, log_analysis=log_analysis)
+
 class TimetableSolverWithSolverManager(TimetableSolverBase):
-    def __init__(self, **kwargs):
+    def __init__(self, solution_history_size: int = DEFAULT_HISTORY_SIZE, best_solution_interval_seconds: float = 0.0,
+                 best_solution_diffs: bool = False, **kwargs):
         super().__init__(**kwargs)
         # Members only relevant for this subclass
         self._solver_manager    : SolverManager
         self._job_id_list       : List[SolverJob]  = []
-        self.latest_solutions_by_job_id_dict   : Dict[str, List[Timetable]] = {}
+        # the best solutions of each job: the last `solution_history_size` scores and assignments, and the latest solution
+        self.solution_history_size  = solution_history_size
+        self.solution_history_by_job_id : Dict[str, SolutionHistory] = {}
+        # best solution events (see hello_world.solution_events): at most one per `best_solution_interval_seconds`
+        # (0: every improvement) and the final one; with `best_solution_diffs`, the improvements are not converted to Timetables
+        self.best_solution_interval_seconds = best_solution_interval_seconds
+        self.best_solution_diffs            = best_solution_diffs
+        # called with (problem_id, event) on every best solution event (e.g., to stream it, see hello_world.daemon)
+        self.best_solution_listeners: List[Callable[[str, BestSolutionEvent], None]] = []
 
     # ----------------------------
     # Abstract methods
@@ -265,39 +454,28 @@ class TimetableSolverWithSolverManager(TimetableSolverBase):
         super().create_solver()
         # 1) Create the solver manager
         self.logger.info("=== Creating the SolverManager ===")
-        self._solver_manager = SolverManager.create(self.solver_factory)
+        self._solver_manager = self.cached_factory.solver_manager()
 
     def _solve_problem_body(self, problem: Timetable) -> Timetable:
         logger = self.logger
 
-        if self.solver_config is None or self.solver_factory is None or self._solver_manager is None:
-            self.logger.info("calling create_solver() method")
-            self.create_solver()
-
-        # 1) Create a unique problem ID
-        problem_id = str(uuid.uuid4())
-        
-        # 2) Run the solver asynchronously and retrieve the best solution
-        callback = partial(self._on_best_solution_changed, problem_id)      # this converts _on_best_solution_changed(self, problem_id: str, sol: Timetable) -> callback(sol: Timetable), pre-filling some fields in the original method
+        # 1) Run the solver asynchronously; the final solution and exception consumers signal the end of the job
+        finished = threading.Event()
         logger.info("Requesting the SolverManager to create a SolverJob...")
-        solver_job = self._solver_manager.solve_builder() \
-            .with_problem_id(problem_id) \
-            .with_problem(problem) \
-            .with_best_solution_consumer(callback) \
+        solver_job = self._solve_builder(problem, on_final=lambda solution: finished.set()) \
+            .with_exception_handler(lambda problem_id, error: finished.set()) \
             .run()   # <- Run is required here!
             # more optional setting:
             # .with_first_initialized_solution_consumer(on_first_solution_changed) \
-            # .with_final_best_solution_consumer(on_final_solution_changed) \
-            # .with_exception_handler(on_exception_handler) \
             # .with_config_override(config_override) \
         logger.info(f"\t✅ SolverJob created {solver_job.get_problem_id()} id\n")
         
         self._job_id_list.append(solver_job)
 
-        # while solver_job.get_solver_status != SolverStatus.<name-of-status>
-        self.blocking_show_job_status(job=solver_job)
+        # 2) Wait for the end of the job, logging its status every LOOP_WAIT_SECONDS
+        self.blocking_show_job_status(job=solver_job, finished=finished)
         
-        # 3) Retrieve the final solution (blocks only if it isn't done yet)
+        # 3) Retrieve the final solution (raises the solver's error, if any)
         logger.info("Retrieving the final solution...")
         solution: Timetable = solver_job.get_final_best_solution()
         logger.info(f"Solver finished: status={solver_job.get_solver_status().name}, score={solution.score}")
@@ -307,47 +485,93 @@ class TimetableSolverWithSolverManager(TimetableSolverBase):
     # ----------------------------
     # New Children Methods
     # ----------------------------
-    def blocking_show_job_status(self, job: SolverJob):
-        """Blocks until the job with the given ID is finished and shows its status."""
+    def _solve_builder(self, problem: Timetable, problem_id: Optional[str] = None,
+                       on_best_solution: Optional[Callable[[BestSolutionEvent], None]] = None,
+                       on_final: Optional[Callable[[Timetable], None]] = None) -> SolverJobBuilder:
+        """A solve builder for `problem` whose (throttled) best solution events are recorded and passed to
+        `on_best_solution`; `on_final` gets the final best solution."""
+        if self.solver_config is None or self.solver_factory is None or self._solver_manager is None:
+            self.logger.info("calling create_solver() method")
+            self.create_solver()
+        problem_id = problem_id or str(uuid.uuid4())
+        self.solution_history_by_job_id[problem_id] = SolutionHistory(max_records=self.solution_history_size)
+        callback = partial(self._on_best_solution_changed, problem_id)      # this converts _on_best_solution_changed(self, problem_id: str, event) -> callback(event), pre-filling some fields in the original method
+        if on_best_solution is not None:
+            record   = callback
+            callback = lambda event: (record(event), on_best_solution(event))
+        throttle = BestSolutionThrottle(listener=callback, min_interval_seconds=self.best_solution_interval_seconds,
+                                        diffs_only=self.best_solution_diffs)
+        builder  = self._solver_manager.solve_builder() \
+            .with_problem_id(problem_id) \
+            .with_problem(problem)
+        return throttle.attach(builder, on_final=on_final)
+
+    def submit_async(self, problem: Timetable, problem_id: Optional[str] = None) -> AsyncSolverJob:
+        """Starts solving the (prepared) `problem` and returns its job without waiting; call it from a coroutine.
+
+        Several jobs can run at once: the SolverManager runs them on its solver threads (see solve_async).
+        """
+        return self._submit_async(problem, problem_id)
+
+    def _submit_async(self, problem: Timetable, problem_id: Optional[str] = None,
+                      finish: Optional[Callable[[Timetable], Timetable]] = None) -> AsyncSolverJob:
+        """submit_async, with the `finish` of the AsyncSolverJob."""
+        problem_id  = problem_id or str(uuid.uuid4())
+        job         = AsyncSolverJob(problem_id, finish=finish)
+        job.start(self._solve_builder(problem, problem_id, on_best_solution=job.on_best_solution, on_final=job.on_final_best_solution))
+        self._job_id_list.append(job.solver_job)
+        self.logger.info(f"\t✅ SolverJob created {problem_id} id\n")
+        return job
+
+    async def solve_async(self, problem: Timetable, timeout: Optional[float] = None,
+                          previous_solution: Optional[Timetable] = None, pinned_weeks: Iterable[int] = ()) -> Timetable:
+        """solve_problem for asyncio code: awaits the final best solution instead of blocking the event loop.
+
+        After `timeout` seconds the solver is terminated early and its best solution so far is returned;
+        cancelling the awaiting task terminates the solver. Use submit_async for the job itself
+        (e.g., `async for event in job` to follow the improving solutions).
+        """
+        self._prepare_problem(problem, previous_solution=previous_solution, pinned_weeks=pinned_weeks)
+        job      = self.submit_async(problem)
+        solution = await job.result(timeout=timeout)
+        self.solve_duration = job.solver_job.get_solving_duration()
+        self.logger.info(f"Solver finished: status={job.get_solver_status().name}, score={solution.score}")
+        return solution
 
+    def blocking_show_job_status(self, job: SolverJob, finished: threading.Event):
+        """Blocks until `finished` is set (by the consumers of the job) and logs the job status every LOOP_WAIT_SECONDS."""
         self.logger.info("\n==========================================")
         self.logger.info("🛑 Starting blocking: waiting for solver job to finish")
         self.logger.info("-------------------------------------------")
         self.logger.info(f"Job ID: {job.get_problem_id()}")
         start_time = time.time()
 
-        while True:
-            time.sleep(LOOP_WAIT_SECONDS)
+        while not finished.wait(LOOP_WAIT_SECONDS):
             status  = job.get_solver_status()
-            sol     = self.latest_solutions_by_job_id_dict[job.get_problem_id()][-1] if self.latest_solutions_by_job_id_dict[job.get_problem_id()] else None
-            score   = sol.score if sol is not None else "–"
+            record  = self.solution_history_by_job_id[job.get_problem_id()].latest
+            score   = record.score if record is not None else "–"
             elapsed = time.time() - start_time
 
             now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-
-
-            # Break once the solver is no longer running
-            if not (status in [SolverStatus.SOLVING_ACTIVE, SolverStatus.SOLVING_SCHEDULED]):
-                self.logger.info(f"⏱️ {now_str} - job has finished... Elapsed time: {elapsed:.1f} seconds")
-                break
-            
             self.logger.info(f"⏱️ {now_str} - Elapsed time: {elapsed:.1f} seconds")
             self.logger.info(f"\t⏳ Job status: {status.name} | Best score: {score}\n")
 
+        status  = job.get_solver_status()
+        self.logger.info(f"⏱️ {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - job has finished... Elapsed time: {time.time() - start_time:.1f} seconds")
         self.logger.info(f"\n✅ Blocking finished. Final job status: {status.name} - total time spent: {job.get_solving_duration()}")
         self.logger.info("==========================================")
 
-    def _on_best_solution_changed(self, problem_id: str, sol: Timetable):
-        """Callback triggered when a new best solution is found."""
+    def _on_best_solution_changed(self, problem_id: str, event: BestSolutionEvent):
+        """Callback triggered when a new best solution is found (and for the final one)."""
         logger = self.logger
-        # Create an empty list for the best solutions
-        self.latest_solutions_by_job_id_dict[problem_id] = []
-        # This is invoked on every new best solution
-        self.latest_solutions_by_job_id_dict[problem_id].append(sol)
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"\n💡 New best solution found! {timestamp} 🧠")
-        logger.info(f"\t📈 Updated score: {sol.score}\n")
+        # This is invoked on every best solution event
+        self.solution_history_by_job_id[problem_id].add_event(event)
+        if not event.is_final:
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            logger.info(f"\n💡 New best solution found! {timestamp} 🧠")
+            logger.info(f"\t📈 Updated score: {event.score} ({len(event.changed)} assignments changed)\n")
+        for listener in list(self.best_solution_listeners):
+            listener(problem_id, event)
 
     def get_solver_job(self, index: int = -1) -> SolverJob:
         if len(self._job_id_list) == 0:
@@ -355,4 +579,115 @@ class TimetableSolverWithSolverManager(TimetableSolverBase):
         
         return self._job_id_list[index]
 
-        
+    def get_solution_history(self, index: int = -1) -> SolutionHistory:
+        """The best-solution history of a job (by default the last one), also after the job has finished."""
+        return self.solution_history_by_job_id[self.get_solver_job(index=index).get_problem_id()]
+
+    def get_solving_duration(self) -> timedelta:
+        """Solving time of the last job as reported by Timefold."""
+        return self.get_solver_job(index=-1).get_solving_duration()
+
+class TimetableSolverRollingHorizon(TimetableSolverWithSolverManager):
+    """Re-plans only the next `horizon_weeks` weeks from `current_week` (continuous planning).
+
+    The weeks before `current_week` are frozen (pinned) and only count toward the semester totals; the
+    window is solved on its own with each TA's share of the remaining semester requirement, and the later
+    weeks get a coarse max-flow plan (see hello_world.rolling_horizon). A re-plan therefore costs about
+    the same as solving `horizon_weeks` weeks, however long the semester and its history are.
+    """
+    def __init__(self, current_week: int = 0, horizon_weeks: int = 2, **kwargs):
+        super().__init__(**kwargs)
+        # Members only relevant for this subclass
+        self.current_week   = current_week
+        self.horizon_weeks  = horizon_weeks
+        # the allocation of the last re-plan
+        self.horizon_plan   : Optional[HorizonPlan] = None
+
+    def _solve_problem_body(self, problem: Timetable) -> Timetable:
+        if self.solver_config is None or self.solver_factory is None:
+            self.logger.info("calling create_solver() method")
+            self.create_solver()
+        window_problem  = self._plan_window(problem)
+        window_solution = super()._solve_problem_body(window_problem)
+        return self._merge_window(problem, window_solution)
+
+    def submit_async(self, problem: Timetable, problem_id: Optional[str] = None) -> AsyncSolverJob:
+        """Starts the re-plan of the (prepared) `problem` and returns its job without waiting; call it from a coroutine.
+
+        The job solves the window, so its best solution events are the window's; its result is `problem`, with
+        the final window solution merged into it and the rest of the semester planned as in solve_problem.
+        """
+        window_problem = self._plan_window(problem)
+        return self._submit_async(window_problem, problem_id, finish=lambda window_solution: self._merge_window(problem, window_solution))
+
+    def _plan_window(self, problem: Timetable) -> Timetable:
+        """Freezes the past, allocates the remaining requirements and returns the window problem, seeded."""
+        frozen = freeze_past_weeks(problem, self.current_week)
+        self.logger.info(f"\tFroze {frozen} shift assignments before week {self.current_week}.")
+        self.horizon_plan = plan_horizon(problem, self.current_week, self.horizon_weeks, logger=self.logger)
+
+        # the window starts from the max-flow assignment
+        window_problem = build_partition_problem(problem, self.horizon_plan.window)
+        seed_window(window_problem, problem, self.horizon_plan)
+        return window_problem
+
+    def _merge_window(self, problem: Timetable, window_solution: Timetable) -> Timetable:
+        """Copies the window solution into `problem`, plans the rest of the semester coarsely and scores it."""
+        merge_partition_solutions(problem, {assignment.id: assignment.get_ta_id() for assignment in window_solution.shift_assignments})
+        filled = apply_coarse_plan(problem, self.horizon_plan)
+        self.logger.info(f"\tPlanned {filled} shift assignments after the window coarsely.")
+        self.get_solution_manager().update(problem)
+        self.logger.info(f"Semester score: {problem.score}")
+        return problem
+
+class TimetableSolverPartitioned(TimetableSolverBase):
+    """Solves semester-scale problems week block by week block in parallel processes, then repairs the whole semester.
+
+    Each TA's semester requirement is first allocated over the blocks (see hello_world.partition), so the
+    blocks can be solved independently; the repair phase then runs the full solver from the merged solution
+    for `repair_time_budget` to fix what the split cannot see (e.g., conflicts across block boundaries).
+    """
+    def __init__(self,
+                 weeks_per_partition: int = 1,
+                 max_workers: int | None = None,
+                 partition_time_budget: Duration = Duration(seconds=30),
+                 repair_time_budget: Duration = Duration(seconds=10),
+                 **kwargs):
+        super().__init__(**kwargs)
+        # Members only relevant for this subclass
+        self.weeks_per_partition    = weeks_per_partition
+        self.max_workers            = max_workers       # None: one process per CPU, 1: solve the partitions in this process
+        self.partition_time_budget  = partition_time_budget
+        self.repair_time_budget     = repair_time_budget
+
+    # ----------------------------
+    # Abstract methods
+    # ----------------------------
+    def create_solver(self):
+        super().create_solver()
+
+    def _solve_problem_body(self, problem: Timetable) -> Timetable:
+        logger = self.logger
+        if self.solver_config is None or self.solver_factory is None:
+            self.logger.info("calling create_solver() method")
+            self.create_solver()
+
+        # 1) Split the problem and solve the partitions in parallel
+        partitions          = create_partitions(problem, weeks_per_partition=self.weeks_per_partition, logger=logger)
+        partition_problems  = [build_partition_problem(problem, partition) for partition in partitions]
+        logger.info(f"Solving {len(partition_problems)} partitions ({duration_to_seconds(self.partition_time_budget)} seconds each)...")
+        start_time = time.time()
+        ta_id_by_assignment_id = solve_partitions(partition_problems,
+                                                  constraint_version    = self.constraint_version,
+                                                  seconds               = duration_to_seconds(self.partition_time_budget),
+                                                  random_seed           = self.random_seed,
+                                                  max_workers           = self.max_workers)
+        merged = merge_partition_solutions(problem, ta_id_by_assignment_id)
+        logger.info(f"\tMerged {merged} shift assignments from the partitions in {time.time() - start_time:.1f} seconds.")
+
+        # 2) Repair the merged solution globally
+        logger.info(f"Repairing the merged solution ({duration_to_seconds(self.repair_time_budget)} seconds)...")
+        solver = self.solver_factory.build_solver(SolverConfigOverride(termination_config=TerminationConfig(spent_limit=self.repair_time_budget)))
+        solution = solver.solve(problem)
+        logger.info(f"Solver finished: score={solution.score}")
+        return solution
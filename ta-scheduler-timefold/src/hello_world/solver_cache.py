@@ -0,0 +1,85 @@
+import logging
+import random
+import threading
+
+from dataclasses    import dataclass, field
+from pathlib        import Path
+from typing         import Callable, Dict, Hashable, Optional, Tuple
+
+from timefold.solver        import SolverFactory, SolverManager, SolutionManager
+from timefold.solver.config import SolverConfig, SolverConfigOverride, TerminationConfig, Duration
+
+from hello_world.demo_data  import demo_data_random
+
+# Process-wide cache of the Timefold objects of a solver configuration. SolverFactory.create translates the
+# domain and the constraints to Java and compiles the constraint network (about 12 seconds for the first factory
+# of the process), so solvers that share a configuration share one factory, one SolverManager and one SolutionManager.
+SolverCacheKey = Tuple[Hashable, ...]
+
+@dataclass
+class CachedSolverFactory:
+    """The SolverFactory of a configuration and the managers built on it (on first use)."""
+    solver_config   : SolverConfig
+    solver_factory  : SolverFactory
+    warmed_up       : bool = False
+    _solver_manager     : Optional[SolverManager]   = field(default=None, repr=False)
+    _solution_manager   : Optional[SolutionManager] = field(default=None, repr=False)
+    _lock               : threading.Lock            = field(default_factory=threading.Lock, repr=False)
+
+    def solver_manager(self) -> SolverManager:
+        with self._lock:
+            if self._solver_manager is None:
+                self._solver_manager = SolverManager.create(self.solver_factory)
+            return self._solver_manager
+
+    def solution_manager(self) -> SolutionManager:
+        with self._lock:
+            if self._solution_manager is None:
+                self._solution_manager = SolutionManager.create(self.solver_factory)
+            return self._solution_manager
+
+    def warm_up(self, seconds: float = 2, logger: Optional[logging.Logger] = None) -> None:
+        """Solves a one-week random problem for `seconds`, so the first real solve starts with JIT-compiled constraints."""
+        state   = random.getstate()     # the demo data generator draws from the global random generator
+        problem = demo_data_random(name="warm_up", logger=logger or logging.getLogger(__name__), num_of_weeks=1)
+        random.setstate(state)
+        problem.build_availability_index()
+        termination = TerminationConfig(spent_limit=Duration(milliseconds=int(seconds * 1000)))
+        self.solver_factory.build_solver(SolverConfigOverride(termination_config=termination)).solve(problem)
+        self.warmed_up = True
+
+_cache      : Dict[SolverCacheKey, CachedSolverFactory] = {}
+_cache_lock = threading.Lock()
+_stats      = {"hits": 0, "misses": 0}
+
+def solver_cache_key(constraint_version: str, path_to_config_xml: Path | str | None = None, **settings: Hashable) -> SolverCacheKey:
+    """The cache key of a configuration: its constraint version, XML config and `settings` (termination limits
+    in seconds, random seed, move thread count, ...). An edited XML config gets a new key."""
+    config_xml = None
+    if path_to_config_xml is not None:
+        path        = Path(path_to_config_xml).resolve()
+        config_xml  = (str(path), path.stat().st_mtime_ns)
+    return (constraint_version, config_xml, tuple(sorted(settings.items())))
+
+def get_cached_solver_factory(key: SolverCacheKey, create_config: Callable[[], SolverConfig]) -> CachedSolverFactory:
+    """The cached factory of `key`, created from `create_config()` on the first call."""
+    with _cache_lock:     # held while creating, so concurrent first requests build the factory once
+        cached = _cache.get(key)
+        if cached is not None:
+            _stats["hits"] += 1
+            return cached
+        _stats["misses"] += 1
+        solver_config   = create_config()
+        cached          = _cache[key] = CachedSolverFactory(solver_config=solver_config, solver_factory=SolverFactory.create(solver_config))
+        return cached
+
+def solver_cache_info() -> Dict[str, int]:
+    """Number of cached configurations and the hits/misses of get_cached_solver_factory."""
+    with _cache_lock:
+        return {"entries": len(_cache), **_stats}
+
+def clear_solver_cache() -> None:
+    """Drops the cached factories (e.g., after editing a constraint provider in a notebook)."""
+    with _cache_lock:
+        _cache.clear()
+        _stats.update(hits=0, misses=0)
@@ -16,10 +16,11 @@ from argparse import Namespace
 
 # Custom Imports 
 from .domain import ShiftAssignment, Shift, TA, Timetable
+from .problem_ir import CompiledProblem, read_availability_folder
 
 # """Provides utilities for data extraction and reporting."""
 class DataConstructor:
-    """utilities for creating the timetable from the data folder."""
+    """utilities for creating the timetable from the data folder (compiled once into a CompiledProblem)."""
     def __init__(self, ta_csv_path, shift_csv_path, availability_folder, load=True):
         self.ta_csv_path: str = ta_csv_path
         self.shift_csv_path: str = shift_csv_path
@@ -27,6 +28,7 @@ class DataConstructor:
         # Data holders
         self.ta_dataframe: pd.DataFrame   = None  # Placeholder for TA data    (pandas frame)
         self.shift_dataframe: pd.DataFrame = None  # Placeholder for Shift data (pandas frame)
+        self.compiled_problem: CompiledProblem = None
         self.timetable: Timetable  = None
         # intermediate data holders
         self.avialability_matrix: Dict[str, Dict[str, str]] = {}  # {macid: {shift_series: availability}}
@@ -35,169 +37,49 @@ class DataConstructor:
 
     def create(self):
         # Construction routine
-        self.timetable = Timetable(id=0, tas=[], shifts=[], shift_assignments=[])
         self.load_data()
-        self.create_ta_objects()
-        self.create_shift_objects()
-        self.create_shift_assignments()
         self.extract_availabilities()
         if (self.validate_ta_availability()):
-            self.update_ta_availability()
             print(f"Data succussfully extracted :)")
         else: 
             print("\n========================================")
+        self.compiled_problem = CompiledProblem.from_dataframes(ta_dataframe=self.ta_dataframe,
+                                                                shift_dataframe=self.shift_dataframe,
+                                                                availability_by_ta=self.avialability_matrix)
+        self.timetable = self.compiled_problem.to_timetable()
         return self.timetable
     
     def load_data(self):
-        self.ta_dataframe    = pd.read_csv(self.ta_csv_path)
-        self.shift_dataframe = pd.read_csv(self.shift_csv_path)
-
-    def create_ta_objects(self):
-        for index, row in self.ta_dataframe.iterrows():
-            ta = TA(
-                id=row['macid'],
-                name=row['name'],
-                required_shifts_per_week= row['req_shift_per_week'],
-                is_grad_student= row['type'] == 'Grad',
-                desired=[],
-                undesired=[],
-                unavailable=[]
-            )
-            self.timetable.tas.append(ta)
-
-    def create_shift_objects(self):
-        for index, row in self.shift_dataframe.iterrows():
-            shift = Shift(
-                id = str(index),
-                alias = row['name'],
-                series = row['series'],
-                day_of_week = row['day_of_week'],
-                shift_date = dt.datetime.strptime(row['date'], '%Y-%m-%d').date(),
-                start_time = dt.datetime.strptime(row['start_time'], '%H:%M').time(),
-                end_time = (dt.datetime.strptime(row['start_time'], '%H:%M') + timedelta(hours=row["duration"])).time() ,
-                required_tas = row['req_ta_per_shift']
-            )
-            self.timetable.shifts.append(shift)
-
-    def create_shift_assignments(self):
-        for shift in self.timetable.shifts:
-            for i in range(shift.required_tas):
-                shift_assignment = ShiftAssignment(
-                    id = f"{shift.series}_{i}",
-                    shift = shift,
-                    assigned_ta = None
-                )
-                self.timetable.shift_assignments.append(shift_assignment)  
-  
+        self.ta_dataframe    = pd.read_csv(self.ta_csv_path, encoding="utf-8-sig")
+        self.shift_dataframe = pd.read_csv(self.shift_csv_path, encoding="utf-8-sig")
+
     def extract_availabilities(self):
         print(self.availability_folder)
-        filenames = self._find_xlsx_files(self.availability_folder)
-
-        for file in filenames:
-            mac_id, availability = self._extract_availability_from_xlsx(file)
-            self.avialability_matrix[mac_id] = availability
-        
+        self.avialability_matrix = read_availability_folder(self.availability_folder)
         return self.avialability_matrix
-    
-    def _extract_availability_from_xlsx(self, file_path: str, availability_tbl_name: str = "availability_tbl"):
-        # Load the workbook and select the sheet
-        wb = openpyxl.load_workbook(file_path)
-        ws = wb['availability']
-        
-        # Extracting TA details from the top of the sheet
-        mac_id = ws['B1'].value
-        ta_name = ws['B2'].value
-        ta_id   = ws['B3'].value
-
-        # # Print table names in the sheet
-        # print("Tables in the sheet:", ws.tables.keys())
-
-        # Check if availability_tbl_name exists
-        if availability_tbl_name not in ws.tables:
-            print("Table 'availability_tbl' not found.")
-
-        tbl = ws.tables[availability_tbl_name]
-        
-        # Extract the table range
-        table_range = tbl.ref  # e.g., "A5:C10"
-        # print(f"Table '{availability_tbl_name}' range: {table_range}")
-
-        # Extract the rows from the table range
-        rows = ws[table_range]
-
-        # Convert rows into a list of lists
-        data = [[cell.value for cell in row] for row in rows]
-
-        # Convert the data into a pandas DataFrame
-        headers = data[0]       # First row contains headers
-        table_df = pd.DataFrame(data[1:], columns=headers)  # Remaining rows are data
-        
-        availability = {}
-        for index, row in table_df.iterrows():
-            shift_series = row['Shift Series']
-            shift_series_availability = row['Availability']
-            availability[shift_series] = shift_series_availability   
-
-        # print(availability)
-        return mac_id, availability
 
     def validate_ta_availability(self, log_error=True):
         missing_ta = 0
-        for ta in self.timetable.tas:
-            if self.avialability_matrix.get(ta.id) is None:
-                missing_ta += 1
+        macids     = self.ta_dataframe["macid"].astype(str)
+        missing    = ~macids.isin(list(self.avialability_matrix.keys()))
+        for name, macid in zip(self.ta_dataframe["name"][missing], macids[missing]):
+            missing_ta += 1
+            if log_error:
+                print("========================================")
+                print(f"Found no record for TA: {name}")
+                print(f"MacID = {macid}")
+                print(f"missing {missing_ta}/{len(macids)} forms so far")
+                print("========================================")
+
+        for macid, required_shifts_per_week in zip(macids[~missing], self.ta_dataframe["req_shift_per_week"][~missing]):
+            count_available = sum(1 for availability in self.avialability_matrix[macid].values() if availability != "Unavailable")
+            if count_available < required_shifts_per_week:
                 if log_error:
-                    print("========================================")
-                    print(f"Found no record for TA: {ta.name}")
-                    print(f"MacID = {ta.id}")
-                    print(f"missing {missing_ta}/{len(self.timetable.tas)} forms so far")
-                    print("========================================")
-            else:
-                count_available = sum(1 for availability in self.avialability_matrix[ta.id] if availability != "Unavailable")
-                if count_available < ta.required_shifts_per_week:
-                    if log_error:
-                        print(f"TA {ta.id} has insufficient availability.")
-                        print(f"Available shifts: {count_available}")
-                        print(f"Required shifts: {ta.required_shifts_per_week}")
-
-                    return False
+                    print(f"TA {macid} has insufficient availability.")
+                    print(f"Available shifts: {count_available}")
+                    print(f"Required shifts: {required_shifts_per_week}")
+                return False
         return not missing_ta
-    
-    def update_ta_availability(self):
-        
-        if (self.validate_ta_availability(log_error=False)):
-            for ta in self.timetable.tas:
-                availability_as_dict = self.avialability_matrix.get(ta.id)
-
-                if availability_as_dict is None:
-                    print(f"TA {ta.id} {ta.name}has no availability data. Assumes all shifts are available.")
-                    continue
-
-                print(f"TA {ta.id} {ta.name} has availability data.")
-                for shift_group, availability_status in availability_as_dict.items():
-                    shift = next((shift for shift in self.timetable.shifts if shift.series == shift_group), None) # Find the shift group
-                    if shift is None:
-                        print(f"Shift group {shift_group} not found.")
-                        continue
-
-                    if availability_status == "Available":
-                        ta.desired.append(shift)
-                    elif availability_status == "Unavailable":
-                        ta.unavailable.append(shift)
-                    elif availability_status == "Undesired":
-                        ta.undesired.append(shift)
-                    else:
-                        print(f"Unknown availability status: {availability_status}")      
-            return True
-        return False
-
-    def _find_csv_files(self, directory):
-        path = Path(directory)
-        return [str(file) for file in path.glob("*.csv") if not file.name.startswith('~$')]  # Exclude files starting with ~$ and no recursive search
-
-    def _find_xlsx_files(self, directory):
-        path = Path(directory)
-        return [str(file) for file in path.glob("*.xlsx") if not file.name.startswith('~$')]  # Exclude files starting with ~$ and no recursive search
 
 # class Schedule_Utils:
 # """Provides utilities for data extraction and reporting."""
@@ -531,7 +413,7 @@ def print_ta_availability(time_table: Timetable, logger: logging.Logger) -> None
     ids = id_generator()
     for ta in tas:
         for shift in shift_groups:
-            if (shift in ta.desired) or (shift in ta.undesired) or (shift in ta.unavailable): # do not add "neutral" shifts
+            if ta.get_status_for_shift(shift) != 'Neutral': # do not add "neutral" shifts
                 shift_assignments_new.append(ShiftAssignment(id=next(ids), shift=shift, assigned_ta=ta))
 
     time_table_in.shift_assignments = shift_assignments_new
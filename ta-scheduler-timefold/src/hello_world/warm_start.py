@@ -0,0 +1,90 @@
+import logging
+import pickle
+
+from collections    import defaultdict, deque
+from dataclasses    import dataclass
+from pathlib        import Path
+from typing         import Dict, Iterable, List, Optional
+
+# Custom Imports
+from hello_world.domain import Timetable, ShiftAssignment
+
+@dataclass
+class SeedResult:
+    """Outcome of seeding a problem with a previous solution (see seed_from_solution)."""
+    seeded: int     # assignments initialized from the previous solution
+    pinned: int     # ... of which are pinned
+    dropped: int    # previous assignments no longer valid (TA removed or now unavailable, shift removed)
+
+    def __str__(self):
+        return f"{self.seeded} seeded ({self.pinned} pinned), {self.dropped} dropped"
+
+def load_previous_solution(path: Path | str, index: int = -1) -> Timetable:
+    """Loads a solution from a results pickle.
+
+    Accepts the files written by the benchmark runners (`solutions.pkl`: a list of solutions,
+    `baseline.pkl`: a dict with a "solutions" list) as well as a single pickled Timetable.
+    """
+    with open(path, "rb") as f:
+        content = pickle.load(f)
+    if isinstance(content, Timetable):
+        return content
+    solutions: List[Timetable] = content["solutions"] if isinstance(content, dict) else content
+    if not solutions:
+        raise ValueError(f"No solutions in {path}")
+    return solutions[index]
+
+def seed_from_solution(problem: Timetable, previous_solution: Timetable, pinned_weeks: Iterable[int] = (),
+                       logger: Optional[logging.Logger] = None) -> SeedResult:
+    """Copies the TAs of a previous solution onto the problem's shift assignments and pins the chosen weeks.
+
+    Assignments are matched by id, falling back to any slot of the same shift, and TAs by id, so the
+    previous solution may come from a pickle or another job. A previous assignment is dropped when its
+    shift or TA no longer exists, when the TA is now unavailable for the shift, or when it would staff
+    the TA twice on the same shift; the solver then only searches over the unpinned and dropped slots.
+    Every slot of the problem is reset first, so a problem that is itself an earlier solution (a rolling-horizon
+    re-plan) keeps none of its own TAs or pins; the previous solution may be the problem itself.
+    """
+    # (id, shift id, TA id) of the previous assignments, read before the reset in case they are the problem's
+    previous_assignments = [(assignment.id, assignment.shift.id, assignment.get_ta_id()) for assignment in previous_solution.shift_assignments]
+    for assignment in problem.shift_assignments:
+        assignment.assigned_ta  = None
+        assignment.pinned       = False
+    pinned_weeks    = set(pinned_weeks)
+    ta_by_id        = {ta.id: ta for ta in problem.tas}
+    previous_by_id  = {previous[0]: previous for previous in previous_assignments}
+    free_by_shift: Dict[str, deque] = defaultdict(deque)     # unmatched previous assignments by shift id
+    for previous in previous_assignments:
+        free_by_shift[previous[1]].append(previous)
+
+    matches: List[tuple[ShiftAssignment, tuple[str, str, Optional[str]]]] = []
+    unmatched: List[ShiftAssignment] = []
+    for assignment in problem.shift_assignments:
+        previous = previous_by_id.get(assignment.id)
+        if previous is not None and previous[1] == assignment.shift.id:
+            free_by_shift[previous[1]].remove(previous)
+            matches.append((assignment, previous))
+        else:
+            unmatched.append(assignment)
+    for assignment in unmatched:
+        if free_by_shift[assignment.shift.id]:
+            matches.append((assignment, free_by_shift[assignment.shift.id].popleft()))
+
+    seeded = pinned = 0
+    staffed = set()
+    for assignment, (_, _, ta_id) in matches:
+        ta = ta_by_id.get(ta_id)
+        if ta is None or not ta.is_available_for_shift(assignment.shift) or (ta.id, assignment.shift.id) in staffed:
+            continue
+        staffed.add((ta.id, assignment.shift.id))
+        assignment.assigned_ta  = ta
+        assignment.pinned       = assignment.shift.week_id in pinned_weeks
+        seeded += 1
+        pinned += assignment.pinned
+
+    result = SeedResult(seeded  = seeded,
+                        pinned  = pinned,
+                        dropped = sum(1 for _, _, ta_id in previous_assignments if ta_id is not None) - seeded)
+    if logger:
+        logger.info(f"\tSeeded the problem from the previous solution: {result} (of {len(problem.shift_assignments)} shift assignments).")
+    return result
@@ -0,0 +1,61 @@
+import random
+import logging
+import functools
+
+import pytest
+
+LOGGER = logging.getLogger("test")
+
+# hello_world is imported by the factories, not here: importing it starts the JVM, and a JVM started while the
+# conftest loads (before pytest enables faulthandler) has its SIGSEGV handler replaced and crashes.
+
+def create_problem(num_of_weeks: int = 1, seed: int = 0, name: str = "test", **kwargs):
+    # a random demo problem with its availability index, the same for the same seed; kwargs go to demo_data_random
+    from hello_world.demo_data import demo_data_random
+    random.seed(seed)
+    return demo_data_random(name=name, logger=LOGGER, num_of_weeks=num_of_weeks, **kwargs)
+
+@functools.cache
+def create_solution_manager(constraint_version: str = "default"):
+    # one per constraint version: building the score director factory is the slow part
+    from timefold.solver        import SolverFactory, SolutionManager
+    from timefold.solver.config import SolverConfig, ScoreDirectorFactoryConfig
+
+    from hello_world.domain         import Timetable, ShiftAssignment
+    from hello_world.constraints    import constraints_provider_dict
+    return SolutionManager.create(SolverFactory.create(SolverConfig(
+        solution_class=Timetable,
+        entity_class_list=[ShiftAssignment],
+        score_director_factory_config=ScoreDirectorFactoryConfig(constraint_provider_function=constraints_provider_dict[constraint_version]))))
+
+# The fixtures below are overridden by parametrizing their names, e.g.
+#   @pytest.mark.parametrize("constraint_version", ["default", "tabriz"])
+#   @pytest.mark.parametrize("num_of_weeks", [4])
+
+@pytest.fixture
+def constraint_version() -> str:
+    return "default"
+
+@pytest.fixture
+def num_of_weeks() -> int:
+    return 1
+
+@pytest.fixture
+def seed() -> int:
+    return 0
+
+@pytest.fixture(name="create_problem")
+def create_problem_fixture():
+    return create_problem
+
+@pytest.fixture(name="create_solution_manager")
+def create_solution_manager_fixture():
+    return create_solution_manager
+
+@pytest.fixture
+def problem(num_of_weeks, seed, request):
+    return create_problem(num_of_weeks=num_of_weeks, seed=seed, name=request.node.module.__name__.removeprefix("test_"))
+
+@pytest.fixture
+def solution_manager(constraint_version):
+    return create_solution_manager(constraint_version)
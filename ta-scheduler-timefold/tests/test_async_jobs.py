@@ -0,0 +1,51 @@
+import time
+import asyncio
+import logging
+
+import pytest
+
+from timefold.solver.config import Duration
+
+from hello_world.solver     import TimetableSolverWithSolverManager
+
+LOGGER = logging.getLogger("test")
+
+def create_solver(time_budget_seconds: int) -> TimetableSolverWithSolverManager:
+    solver = TimetableSolverWithSolverManager(constraint_version="default", logger=LOGGER, random_seed=1)
+    solver.default_term_time_budget = Duration(seconds=time_budget_seconds)
+    return solver
+
+def test_concurrent_solves_and_improving_solutions(create_problem):
+    solver = create_solver(time_budget_seconds=2)
+
+    async def follow(job):
+        return [solution async for solution in job]
+
+    async def main():
+        job = solver.submit_async(create_problem(name="first"))
+        second, solutions = await asyncio.gather(solver.solve_async(create_problem(name="second")), follow(job))
+        return await job.result(), second, solutions
+
+    final, second, events = asyncio.run(main())
+    assert final.score.hard_score == 0 and second.score.hard_score == 0
+    assert events and events[-1].is_final and events[-1].solution is final
+    assert all(later.score >= earlier.score for earlier, later in zip(events, events[1:]))
+
+def test_timeout_terminates_early_and_cancel_stops_the_job(create_problem):
+    solver = create_solver(time_budget_seconds=60)
+
+    async def main():
+        start    = time.perf_counter()
+        solution = await solver.solve_async(create_problem(name="timeout"), timeout=2)
+        elapsed  = time.perf_counter() - start
+
+        job = solver.submit_async(create_problem(name="cancel"))
+        await asyncio.sleep(1)
+        await job.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await job.result()
+        return solution, elapsed, job
+
+    solution, elapsed, job = asyncio.run(main())
+    assert solution.score is not None and elapsed < 30
+    assert job.get_solver_status().name == "NOT_SOLVING"
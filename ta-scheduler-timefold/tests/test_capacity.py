@@ -0,0 +1,51 @@
+from hello_world.capacity   import analyze_capacity, ERROR
+
+def test_capacity_report_matches_python_counts(create_problem):
+    timetable   = create_problem(num_of_weeks=3, seed=5, name="capacity")
+    report      = analyze_capacity(timetable)
+
+    for shift, available, desired in zip(timetable.shifts, report.shift_available_tas, report.shift_desired_tas):
+        assert available == sum(1 for ta in timetable.tas if ta.is_available_for_shift(shift))
+        assert desired   == sum(1 for ta in timetable.tas if ta.get_status_for_shift(shift) == '** Desired **')
+
+    for week_id in range(3):
+        assert report.weekly_demand[week_id] == sum(shift.required_tas for shift in timetable.shifts if shift.week_id == week_id)
+        supply = 0
+        for ta in timetable.tas:
+            available = sum(1 for shift in timetable.shifts if shift.week_id == week_id and ta.is_available_for_shift(shift))
+            supply   += min(ta.max_shifts_per_week, available)
+        assert report.weekly_supply_max[week_id] == supply
+
+def test_capacity_report_flags_unstaffable_shift(create_problem):
+    timetable   = create_problem(num_of_weeks=3, seed=5, name="capacity")
+    shift       = timetable.shifts[0]
+    for ta in timetable.tas:
+        ta.desired      = [other for other in ta.desired if other.id != shift.id]
+        ta.undesired    = [other for other in ta.undesired if other.id != shift.id]
+        ta.unavailable.append(shift)
+        ta.is_indexed = False
+
+    report = analyze_capacity(timetable)
+    assert not report.is_feasible and not report.is_sane
+    assert any(issue.code == "TMTBL.shifts.unavailable" and issue.severity == ERROR and issue.shift_id == shift.id for issue in report.issues)
+    assert report.to_dict()["is_feasible"] is False
+
+def test_capacity_report_counts_only_the_weeks_with_shifts(create_problem):
+    # the weekly demo has all its shifts in week 1: no empty week 0 with its minimum loads and supply
+    timetable   = create_problem(num_of_weeks=1, seed=5, name="capacity")
+    baseline    = analyze_capacity(timetable)
+    for shift in timetable.shifts:
+        shift.week_id = 1
+    report      = analyze_capacity(timetable)
+
+    assert (report.num_of_weeks, report.week_ids) == (1, [1])
+    assert report.weekly_demand == baseline.weekly_demand and report.weekly_supply_min == baseline.weekly_supply_min
+    assert [(issue.code, issue.message) for issue in report.issues] == \
+           [(issue.code, issue.message.replace("week '0'", "week '1'").replace("Week '0'", "Week '1'")) for issue in baseline.issues]
+    assert all(issue.week_id in (None, 1) for issue in report.issues)
+
+if __name__ == "__main__":
+    from conftest import create_problem
+    test_capacity_report_matches_python_counts(create_problem)
+    test_capacity_report_flags_unstaffable_shift(create_problem)
+    test_capacity_report_counts_only_the_weeks_with_shifts(create_problem)
@@ -0,0 +1,41 @@
+import random
+import logging
+import pytest
+
+from timefold.solver        import SolverFactory, SolutionManager
+from timefold.solver.config import SolverConfig, ScoreDirectorFactoryConfig, Duration
+
+from hello_world.domain         import Timetable, ShiftAssignment
+from hello_world.demo_data      import demo_data_random
+from hello_world.constraints    import constraints_provider_dict
+from hello_world.scoring        import CONSTRAINT_NAMES_BY_VERSION, CONSTRAINT_PACKAGE
+from hello_world.solver         import TimetableSolverBlocking
+
+LOGGER = logging.getLogger("test")
+
+@pytest.mark.parametrize("constraint_version", ["default", "tabriz"])
+def test_profiled_solve_counts_every_constraint_and_keeps_the_score(constraint_version):
+    random.seed(0)
+    problem = demo_data_random(name="profiling", logger=LOGGER, num_of_weeks=2)
+    solver  = TimetableSolverBlocking(constraint_version=constraint_version, logger=LOGGER, random_seed=1, profile_constraints=True)
+    solver.default_term_time_budget = Duration(seconds=3)
+    solution = solver.solve_problem(problem, log_solution=False)
+
+    profile = solver.constraint_profile
+    assert set(profile) == {f"{CONSTRAINT_PACKAGE}/{name}" for name in CONSTRAINT_NAMES_BY_VERSION[constraint_version]}
+    assert all(entry["calls"] > 0 and entry["seconds"] > 0 for entry in profile.values())
+    assert all(entry["calls"] == sum(callback["calls"] for callback in entry["callbacks"].values()) for entry in profile.values())
+    seconds = [entry["seconds"] for entry in profile.values()]
+    assert seconds == sorted(seconds, reverse=True)
+
+    # the profiled callbacks compute the same score as the plain ones
+    solution_manager = SolutionManager.create(SolverFactory.create(SolverConfig(
+        solution_class=Timetable,
+        entity_class_list=[ShiftAssignment],
+        score_director_factory_config=ScoreDirectorFactoryConfig(constraint_provider_function=constraints_provider_dict[constraint_version]))))
+    score = solution.score
+    assert solution_manager.update(solution) == score
+
+    # the next solve starts from zero
+    solver.constraint_profiler.reset()
+    assert all(entry["calls"] == 0 for entry in solver.constraint_profiler.report().values())
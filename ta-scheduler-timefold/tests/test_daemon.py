@@ -0,0 +1,65 @@
+import os
+import sys
+import logging
+import threading
+import subprocess
+import time
+
+from hello_world.daemon         import SolverDaemon
+from hello_world.daemon_client  import connect, request, daemon_is_running, stop_daemon
+from hello_world.solver_cache   import solver_cache_info
+
+LOGGER = logging.getLogger("test")
+
+def start_daemon(socket_path):
+    daemon = SolverDaemon(socket_path=socket_path, logger=LOGGER)
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    while not daemon_is_running(socket_path):
+        thread.join(timeout=0.1)
+    return daemon, thread
+
+def test_daemon_streams_best_solutions_and_reuses_the_solver(tmp_path):
+    socket_path     = tmp_path / "daemon.sock"
+    daemon, thread  = start_daemon(socket_path)
+
+    misses = []
+    for _ in range(2):
+        replies = list(request({"type": "run_demo", "argv": ["--time_budget", "2"], "cwd": str(tmp_path)}, socket_path))
+        result  = replies[-1]
+        best    = [reply for reply in replies if reply["type"] == "best_solution"]
+        assert result["type"] == "result"
+        assert any(reply["type"] == "log" for reply in replies)
+        assert best and best[-1]["score"] == result["score"] and best[-1]["assignments"] == result["assignments"]
+        misses.append(solver_cache_info()["misses"])
+    assert misses[0] == misses[1] and daemon.request_count == 2     # the second request reuses the SolverFactory
+
+    error = list(request({"type": "run_demo", "argv": ["--solving_method", "unknown"], "cwd": str(tmp_path)}, socket_path))
+    assert error[-1]["type"] == "error"
+
+    stop_daemon(socket_path)
+    thread.join(timeout=10)
+    assert not thread.is_alive() and not socket_path.exists()
+
+def test_a_client_disconnecting_mid_solve_terminates_its_solve(tmp_path):
+    socket_path     = tmp_path / "daemon.sock"
+    daemon, thread  = start_daemon(socket_path)
+
+    with connect(socket_path) as connection:
+        connection.send({"type": "run_demo", "argv": ["--time_budget", "120"], "cwd": str(tmp_path)})
+        while connection.recv()["type"] != "best_solution":
+            pass
+    start = time.perf_counter()
+
+    # requests run one at a time: the daemon answers once the abandoned solve is over
+    assert [reply["type"] for reply in request({"type": "ping"}, socket_path)] == ["pong"]
+    assert time.perf_counter() - start < 30 and daemon.request_count == 1
+
+    stop_daemon(socket_path)
+    thread.join(timeout=10)
+    assert not thread.is_alive()
+
+def test_client_does_not_start_the_jvm():
+    code = "import sys, hello_world.main; print('hello_world.domain' in sys.modules, 'jpype' in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=os.environ, check=True).stdout
+    assert output.split() == ["False", "False"]
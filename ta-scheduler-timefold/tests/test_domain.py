@@ -0,0 +1,75 @@
+import logging
+import pickle
+from copy import copy
+
+from hello_world.domain     import Timetable
+from hello_world.demo_data  import demo_data_weekly_scheduling
+
+LOGGER = logging.getLogger("test")
+
+def assert_index_matches_lists(timetable: Timetable):
+    for ta in timetable.tas:
+        assert ta.is_indexed
+        for shift in timetable.shifts:
+            assert ta.is_desired_shift(shift)       == (shift in ta.desired)
+            assert ta.is_undesired_shift(shift)     == (shift in ta.undesired)
+            assert ta.is_unavailable_shift(shift)   == (shift in ta.unavailable)
+
+def test_availability_index_matches_list_scans(create_problem):
+    for allow_different_weekly_availability in [True, False]:
+        timetable = create_problem(num_of_weeks=6, seed=7, name="index",
+                                   allow_different_weekly_availability=allow_different_weekly_availability)
+        assert_index_matches_lists(timetable)
+
+def test_availability_index_uses_series_for_weekly_constant_availability(create_problem):
+    timetable = create_problem(num_of_weeks=6, seed=7, name="index", allow_different_weekly_availability=False)
+    for ta in timetable.tas:
+        # every status is the same for all the weeks -> nothing is left at the shift level
+        assert ta.desired_indices == ta.undesired_indices == ta.unavailable_indices == frozenset()
+        assert ta.unavailable_series == frozenset(shift.series for shift in ta.unavailable)
+
+def test_shift_indices_are_dense():
+    timetable = demo_data_weekly_scheduling(name="index", logger=LOGGER)
+    assert [shift.index for shift in timetable.shifts] == list(range(len(timetable.shifts)))
+    assert_index_matches_lists(timetable)
+
+def test_domain_objects_are_hashed_by_planning_id():
+    timetable = demo_data_weekly_scheduling(name="index", logger=LOGGER)
+    ta, other_ta = timetable.tas[0], timetable.tas[1]
+    ta_copy = copy(ta)
+    ta_copy.desired = []    # only the PlanningId matters
+    assert ta_copy == ta and hash(ta_copy) == hash(ta)
+    assert ta != other_ta
+    assert len({*timetable.shift_assignments, *timetable.shift_assignments}) == len(timetable.shift_assignments)
+    assert [ta.index for ta in timetable.tas] == list(range(len(timetable.tas)))
+    assert [sa.index for sa in timetable.shift_assignments] == list(range(len(timetable.shift_assignments)))
+
+def test_unpickling_fills_missing_fields_with_defaults():
+    timetable = demo_data_weekly_scheduling(name="index", logger=LOGGER)
+    ta = timetable.tas[0]
+    state = dict(ta.__dict__)
+    for name in ["index", "is_indexed", "desired_series", "desired_indices"]:  # fields added after older pickles were written
+        del state[name]
+    legacy_ta = type(ta).__new__(type(ta))
+    legacy_ta.__setstate__(state)
+    assert legacy_ta.index == -1 and not legacy_ta.is_indexed
+    assert legacy_ta.desired_series == frozenset() and legacy_ta.desired_indices == frozenset()
+    assert pickle.loads(pickle.dumps(ta)).desired_series == ta.desired_series
+
+def test_conflict_index_matches_pairwise_overlaps(create_problem):
+    timetable = create_problem(num_of_weeks=3, seed=7, name="index")
+    for shift in timetable.shifts:
+        assert shift.end_minute > shift.start_minute >= shift.week_id * 7 * 24 * 60
+        for other in timetable.shifts:
+            overlaps = shift.id != other.id and shift.start_minute < other.end_minute and other.start_minute < shift.end_minute
+            assert (other.index in shift.conflicting_indices) == overlaps
+            assert shift.overlaps_with_other_shift(other) == overlaps
+
+if __name__ == "__main__":
+    from conftest import create_problem
+    test_availability_index_matches_list_scans(create_problem)
+    test_availability_index_uses_series_for_weekly_constant_availability(create_problem)
+    test_shift_indices_are_dense()
+    test_domain_objects_are_hashed_by_planning_id()
+    test_unpickling_fills_missing_fields_with_defaults()
+    test_conflict_index_matches_pairwise_overlaps(create_problem)
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from hello_world.domain import TA, Shift, ShiftAssignment, ConstraintParameters
+
+def constraint_scores(score_analysis):
+    return {constraint_ref.constraint_id: (str(analysis.score), analysis.match_count)
+            for constraint_ref, analysis in score_analysis.constraint_map.items()}
+
+def indicted_domain_objects(indicted_objects):
+    # the default constraints also indict their group keys ((TA, week) tuples), counts and shift id lists
+    for indicted in indicted_objects:
+        if isinstance(indicted, tuple):
+            yield from indicted_domain_objects(indicted)
+        elif isinstance(indicted, (TA, Shift, ShiftAssignment, ConstraintParameters)):
+            yield str(indicted)
+
+def indictments(score_explanation):
+    # by constraint, the score and the TAs, shifts and assignments of each match (indictment_map can't be used:
+    # it keys a dict by the indicted objects, and the lists aren't hashable)
+    return {constraint_id: sorted((str(match.score), sorted(indicted_domain_objects(match.indicted_objects)))
+                                  for match in total.constraint_match_set)
+            for constraint_id, total in score_explanation.constraint_match_total_map.items()}
+
+@pytest.mark.parametrize("num_of_weeks", [3])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_fast_constraints_score_like_the_default_ones(problem, create_solution_manager, seed):
+    default, fast = create_solution_manager("default"), create_solution_manager("fast")
+
+    # random assignments: TAs left without shifts, duplicates, unassigned slots, and a few skewed towards one TA
+    rng = np.random.default_rng(seed)
+    for _ in range(5):
+        slot_ta = rng.integers(len(problem.tas) - 1, size=len(problem.shift_assignments))
+        slot_ta[rng.random(len(slot_ta)) < 0.2] = 0
+        slot_ta[rng.random(len(slot_ta)) < 0.05] = -1
+        for assignment, ta_index in zip(problem.shift_assignments, slot_ta.tolist()):
+            assignment.assigned_ta = problem.tas[ta_index] if ta_index >= 0 else None
+        default_analysis, fast_analysis = default.analyze(problem), fast.analyze(problem)
+        assert fast_analysis.score == default_analysis.score
+        assert constraint_scores(fast_analysis) == constraint_scores(default_analysis)
+        assert indictments(fast.explain(problem)) == indictments(default.explain(problem))
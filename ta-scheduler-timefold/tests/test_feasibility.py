@@ -0,0 +1,46 @@
+from collections import Counter
+
+from hello_world.feasibility    import check_feasibility, apply_warm_start
+
+def assert_hard_constraints_met(timetable):
+    assert all(assignment.assigned_ta is not None for assignment in timetable.shift_assignments)
+    assert all(assignment.assigned_ta.is_available_for_shift(assignment.shift) for assignment in timetable.shift_assignments)
+    pairs = Counter((assignment.assigned_ta.id, assignment.shift.id) for assignment in timetable.shift_assignments)
+    assert max(pairs.values()) == 1
+    per_ta = Counter(assignment.assigned_ta.id for assignment in timetable.shift_assignments)
+    assert all(per_ta[ta.id] == ta.required_shifts_per_semester for ta in timetable.tas)
+
+def test_warm_start_meets_the_hard_constraints(create_problem):
+    timetable   = create_problem(num_of_weeks=4, name="feasibility")
+    result      = check_feasibility(timetable)
+    assert result.is_feasible and result.max_flow == result.demand
+
+    assert apply_warm_start(timetable, result) == len(timetable.shift_assignments)
+    assert_hard_constraints_met(timetable)
+
+def test_warm_start_keeps_the_fixed_assignments(create_problem):
+    timetable   = create_problem(num_of_weeks=4, seed=3, name="feasibility")
+    apply_warm_start(timetable, check_feasibility(timetable))
+    kept = {assignment.id: assignment.assigned_ta for assignment in timetable.shift_assignments[::3]}
+    for assignment in timetable.shift_assignments:
+        if assignment.id not in kept:
+            assignment.assigned_ta = None
+
+    result = check_feasibility(timetable)
+    assert result.is_feasible
+    apply_warm_start(timetable, result)
+    assert all(assignment.assigned_ta == kept[assignment.id] for assignment in timetable.shift_assignments if assignment.id in kept)
+    assert_hard_constraints_met(timetable)
+
+def test_infeasible_problem_is_detected(create_problem):
+    timetable   = create_problem(num_of_weeks=4, name="feasibility")
+    shift       = timetable.shifts[0]
+    for ta in timetable.tas[1:]:
+        ta.desired      = [other for other in ta.desired if other.id != shift.id]
+        ta.undesired    = [other for other in ta.undesired if other.id != shift.id]
+        ta.unavailable.append(shift)
+        ta.is_indexed = False
+
+    result = check_feasibility(timetable)
+    assert shift.required_tas > 1
+    assert not result.is_feasible and result.max_flow < result.demand
@@ -0,0 +1,21 @@
+import logging
+
+from hello_world.jvm_cache  import jvm_cache_options
+from hello_world.solver     import TimetableSolverBlocking
+
+LOGGER = logging.getLogger("test")
+
+def test_one_process_records_the_cache_and_the_next_ones_load_it(tmp_path):
+    cache_path = tmp_path / "cache" / "jvm-test.aot"
+    assert f"-XX:AOTCacheOutput={cache_path}" in jvm_cache_options(cache_path)
+    assert jvm_cache_options(cache_path) == []      # recording in the first process
+    cache_path.write_bytes(b"")
+    assert f"-XX:AOTCache={cache_path}" in jvm_cache_options(cache_path)
+    assert not cache_path.with_suffix(".lock").exists()
+
+def test_the_solver_factory_does_not_translate_logging_nor_pydantic():
+    from _jpyinterpreter.translator import type_to_compiled_java_class
+
+    TimetableSolverBlocking(constraint_version="default", logger=LOGGER, use_solver_cache=False).create_solver()
+    modules = {getattr(python_type, "__module__", None) for python_type in type_to_compiled_java_class}
+    assert "logging" not in modules and not any(module and module.startswith("pydantic") for module in modules)
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from timefold.solver.score  import HardMediumSoftScore
+
+from hello_world.problem_ir     import CompiledProblem
+from hello_world.local_search   import IncrementalScoreCalculator, LateAcceptanceLocalSearch, solve_with_local_search
+
+pytestmark = pytest.mark.parametrize("num_of_weeks", [4])
+
+@pytest.mark.parametrize("constraint_version", ["default", "tabriz"])
+def test_score_matches_timefold(problem, solution_manager, constraint_version):
+    calculator          = IncrementalScoreCalculator(CompiledProblem.from_timetable(problem), problem.constraint_parameters, constraint_version)
+    rng = np.random.default_rng(0)
+    for _ in range(3):
+        slot_ta = rng.integers(len(problem.tas), size=len(problem.shift_assignments))
+        for assignment, ta_index in zip(problem.shift_assignments, slot_ta.tolist()):
+            assignment.assigned_ta = problem.tas[ta_index]
+        score = solution_manager.update(problem)
+        assert calculator.load(slot_ta) == (score.hard_score, score.medium_score, score.soft_score)
+
+@pytest.mark.parametrize("constraint_version", ["default", "tabriz"])
+def test_incremental_score_stays_exact(problem, constraint_version):
+    compiled    = CompiledProblem.from_timetable(problem)
+    calculator  = IncrementalScoreCalculator(compiled, problem.constraint_parameters, constraint_version)
+    rng         = np.random.default_rng(1)
+    calculator.load(rng.integers(compiled.num_tas, size=compiled.num_slots))
+    LateAcceptanceLocalSearch(calculator, np.ones(compiled.num_slots, dtype=bool), rng).run(seconds=30, max_steps=2000)
+    assert calculator.score == calculator.calculate_score()
+
+def test_solve_keeps_pinned_assignments_and_returns_a_scored_timetable(problem, solution_manager):
+    pinned  = {}
+    for assignment in problem.shift_assignments[:10]:
+        assignment.assigned_ta  = problem.tas[0] if problem.tas[0].is_available_for_shift(assignment.shift) else problem.tas[1]
+        assignment.pinned       = True
+        pinned[assignment.id]   = assignment.assigned_ta.id
+
+    solution, result = solve_with_local_search(problem, seconds=10, unimproved_seconds=2, random_seed=1)
+    assert isinstance(solution.score, HardMediumSoftScore)
+    assert (solution.score.hard_score, solution.score.medium_score, solution.score.soft_score) == result.score
+    assert all(assignment.get_ta_id() == pinned[assignment.id] for assignment in solution.shift_assignments if assignment.id in pinned)
+    assert all(assignment.assigned_ta is not None for assignment in solution.shift_assignments)
+    score = solution_manager.update(solution)
+    assert score == solution.score
@@ -0,0 +1,46 @@
+from datetime import time
+
+import pytest
+
+from timefold.solver.test import ConstraintVerifier
+
+from hello_world.domain      import Shift, TA, ShiftAssignment, Timetable, ConstraintParameters
+from hello_world.constraints import define_constraints_tabriz_edition, TimetableConstraintGenTabrizEdition
+
+constraint_verifier = ConstraintVerifier.build(define_constraints_tabriz_edition, Timetable, ShiftAssignment)
+
+def penalize_overlapping_shifts(constraint_factory):
+    return TimetableConstraintGenTabrizEdition(constraint_factory).penalize_overlapping_shifts()
+
+def create_timetable(indexed: bool = True) -> Timetable:
+    shifts = [
+        Shift(id="0", series="L01", day_of_week="Mon", week_id=0, start_time=time(14, 30), end_time=time(17, 30), required_tas=1),
+        Shift(id="1", series="L02", day_of_week="Mon", week_id=0, start_time=time(16, 30), end_time=time(17, 30), required_tas=1),
+        Shift(id="2", series="L03", day_of_week="Mon", week_id=0, start_time=time(17, 30), end_time=time(20, 30), required_tas=1),  # back-to-back with L01 and L02
+        Shift(id="3", series="L01", day_of_week="Mon", week_id=1, start_time=time(14, 30), end_time=time(17, 30), required_tas=1),  # same slot, next week
+    ]
+    tas = [TA(id="0", name="TA0", required_shifts_per_semester=4, skill_level=1, desired=[], undesired=[], unavailable=[]),
+           TA(id="1", name="TA1", required_shifts_per_semester=4, skill_level=1, desired=[], undesired=[], unavailable=[])]
+    shift_assignments = [ShiftAssignment(id=shift.id, shift=shift, assigned_ta=None) for shift in shifts]
+    timetable = Timetable(id="overlap", shifts=shifts, tas=tas, shift_assignments=shift_assignments, constraint_parameters=ConstraintParameters())
+    if indexed:
+        timetable.build_availability_index()
+    return timetable
+
+@pytest.mark.parametrize("indexed", [True, False])
+def test_overlapping_shifts_are_penalized(indexed):
+    # without Timetable.build_availability_index too, e.g. for a timetable scored with SolutionManager.update
+    timetable = create_timetable(indexed)
+    ta, other_ta = timetable.tas
+    for shift_assignment in timetable.shift_assignments:
+        shift_assignment.assigned_ta = ta
+
+    # only L01/L02 in week 0 overlap
+    (constraint_verifier.verify_that(penalize_overlapping_shifts)
+        .given(*timetable.shift_assignments)
+        .penalizes_by(1))
+
+    timetable.shift_assignments[1].assigned_ta = other_ta
+    (constraint_verifier.verify_that(penalize_overlapping_shifts)
+        .given(*timetable.shift_assignments)
+        .penalizes_by(0))
@@ -0,0 +1,84 @@
+import logging
+
+from collections import Counter
+from datetime    import time
+
+from timefold.solver.config import Duration
+
+from hello_world.partition  import create_partitions, build_partition_problem, solve_partitions, merge_partition_solutions
+from hello_world.solver     import TimetableSolverPartitioned
+
+LOGGER = logging.getLogger("test")
+
+def test_partitions_cover_the_problem_and_the_semester_budget(create_problem):
+    problem     = create_problem(num_of_weeks=4, name="partition")
+    partitions  = create_partitions(problem, weeks_per_partition=2)
+    assert [partition.week_ids for partition in partitions] == [[0, 1], [2, 3]]
+    assert [int(sum(partition.ta_budget[t] for partition in partitions)) for t in range(len(problem.tas))] \
+        == [ta.required_shifts_per_semester for ta in problem.tas]
+
+    partition_problems = [build_partition_problem(problem, partition) for partition in partitions]
+    assert sorted(assignment.id for part in partition_problems for assignment in part.shift_assignments) \
+        == sorted(assignment.id for assignment in problem.shift_assignments)
+    for partition, part in zip(partitions, partition_problems):
+        assert {shift.week_id for shift in part.shifts} == set(partition.week_ids)
+        # the budgets of a block add up to its demand
+        assert int(partition.ta_budget.sum()) == len(part.shift_assignments)
+        assert all(shift.week_id in partition.week_ids for ta in part.tas for shift in ta.unavailable)
+
+def test_partitioned_solve_assigns_every_shift(create_problem):
+    problem = create_problem(num_of_weeks=4, name="partition")
+    solver  = TimetableSolverPartitioned(constraint_version="default",
+                                         logger=LOGGER,
+                                         random_seed=1,
+                                         weeks_per_partition=2,
+                                         max_workers=1,
+                                         partition_time_budget=Duration(seconds=2),
+                                         repair_time_budget=Duration(seconds=2))
+    solution = solver.solve_problem(problem, log_solution=False)
+    assert all(assignment.assigned_ta is not None for assignment in solution.shift_assignments)
+    assert solution.score.hard_score == 0
+    per_ta = Counter(assignment.get_ta_id() for assignment in solution.shift_assignments)
+    assert all(per_ta[ta.id] == ta.required_shifts_per_semester for ta in solution.tas)
+
+def create_problem_with_a_conflict_across_blocks(create_problem):
+    """Two weeks whose Sunday-night and Monday-night shifts overlap; only TAs 0-2 can take the first and they desire both."""
+    problem = create_problem(num_of_weeks=2, name="partition")
+    sunday  = next(shift for shift in problem.shifts if shift.week_id == 0)
+    monday  = next(shift for shift in problem.shifts if shift.week_id == 1)
+    sunday.day_of_week, sunday.start_time, sunday.end_time = "Sun", time(22, 0), time(2, 0)
+    monday.day_of_week, monday.start_time, monday.end_time = "Mon", time(0, 30), time(3, 0)
+    for i, ta in enumerate(problem.tas):
+        for shifts in (ta.desired, ta.undesired, ta.unavailable):
+            shifts[:] = [shift for shift in shifts if shift.id not in (sunday.id, monday.id)]
+        if i < 3:
+            ta.desired.extend([sunday, monday])
+        else:
+            ta.unavailable.append(sunday)
+            ta.undesired.append(monday)
+    return problem, sunday, monday
+
+def tas_on_both(solution, first, second):
+    return {a.get_ta_id() for a in solution.shift_assignments if a.shift.id == first.id} \
+         & {a.get_ta_id() for a in solution.shift_assignments if a.shift.id == second.id}
+
+def test_the_repair_phase_fixes_conflicts_across_partition_boundaries(create_problem):
+    problem, sunday, monday = create_problem_with_a_conflict_across_blocks(create_problem)
+    problem.build_availability_index()
+    assert monday.index in sunday.conflicting_indices
+    # each block alone cannot see the overlap
+    partitions = create_partitions(problem, weeks_per_partition=1)
+    merge_partition_solutions(problem, solve_partitions([build_partition_problem(problem, partition) for partition in partitions],
+                                                        constraint_version="tabriz", seconds=2, random_seed=1, max_workers=1))
+    assert tas_on_both(problem, sunday, monday)
+
+    problem, sunday, monday = create_problem_with_a_conflict_across_blocks(create_problem)
+    solver = TimetableSolverPartitioned(constraint_version="tabriz",
+                                        logger=LOGGER,
+                                        random_seed=1,
+                                        weeks_per_partition=1,
+                                        max_workers=1,
+                                        partition_time_budget=Duration(seconds=2),
+                                        repair_time_budget=Duration(seconds=3))
+    solution = solver.solve_problem(problem, log_solution=False)
+    assert not tas_on_both(solution, sunday, monday)
@@ -0,0 +1,65 @@
+import numpy  as np
+import pandas as pd
+from pathlib import Path
+
+from hello_world.problem_ir import CompiledProblem, read_availability_folder, DESIRED, NEUTRAL, UNDESIRED, UNAVAILABLE
+
+TEST_DATA   = Path(__file__).parent / "test_data" / "1"
+
+def compile_test_data() -> CompiledProblem:
+    return CompiledProblem.from_files(ta_csv_path=str(TEST_DATA / "ta_list.csv"),
+                                      shift_csv_path=str(TEST_DATA / "shift_list.csv"),
+                                      availability_folder=str(TEST_DATA / "availability"))
+
+def test_compile_from_files():
+    problem = compile_test_data()
+    assert (problem.num_tas, problem.num_shifts, problem.num_slots) == (6, 10, int(problem.shift_required_tas.sum()))
+    assert problem.availability.dtype == np.int8 and problem.availability.shape == (6, 10)
+    assert (problem.shift_end - problem.shift_start == 180).all()
+
+    code_by_status = {"Desired": DESIRED, "Undesired": UNDESIRED, "Unavailable": UNAVAILABLE}
+    for macid, answers in read_availability_folder(str(TEST_DATA / "availability")).items():
+        row = problem.availability[list(problem.ta_ids).index(str(macid))]
+        for series, status in answers.items():
+            shifts = problem.shift_series == list(problem.series_names).index(series)
+            assert (row[shifts] == code_by_status[status]).all()
+
+def test_timetable_round_trip():
+    problem   = compile_test_data()
+    timetable = problem.to_timetable()
+    assert len(timetable.shift_assignments) == problem.num_slots
+    for ta in timetable.tas:
+        assert ta.is_indexed
+        row = problem.availability[ta.index]
+        assert sorted(shift.index for shift in ta.desired) == list(np.flatnonzero(row == DESIRED))
+
+    compiled_again = CompiledProblem.from_timetable(timetable)
+    for column in ["availability", "shift_start", "shift_end", "shift_week", "shift_required_tas", "slot_shift", "ta_max_per_week"]:
+        assert (getattr(compiled_again, column) == getattr(problem, column)).all()
+
+def test_compile_from_timetable_matches_ta_lookups(create_problem):
+    timetable = create_problem(num_of_weeks=4, seed=3, name="ir")
+    problem   = CompiledProblem.from_timetable(timetable)
+    code_by_status = {'** Desired **': DESIRED, '>> Undesired <<': UNDESIRED, 'X Unavailable X': UNAVAILABLE, 'Neutral': NEUTRAL}
+    for ta in timetable.tas:
+        for shift in timetable.shifts:
+            assert problem.availability[ta.index, shift.index] == code_by_status[ta.get_status_for_shift(shift)]
+
+def test_weeks_start_on_monday_when_the_first_shift_is_mid_week():
+    # Wednesday 2025-01-08, then the Mondays 2025-01-13 and 2025-01-20
+    shifts = pd.DataFrame({"series": ["L01", "L02", "L02"], "date": ["2025-01-08", "2025-01-13", "2025-01-20"],
+                           "day_of_week": ["Wed", "Mon", "Mon"], "start_time": ["09:30", "09:30", "09:30"],
+                           "duration": [3, 3, 3], "req_ta_per_shift": [1, 1, 1]})
+    tas     = pd.DataFrame({"macid": ["ta0"], "name": ["TA 0"], "req_shift_per_week": [1]})
+    problem = CompiledProblem.from_dataframes(ta_dataframe=tas, shift_dataframe=shifts, availability_by_ta={})
+    assert list(problem.shift_week) == [0, 1, 2]
+    assert problem.num_of_weeks == 3
+    assert len(set(problem.shift_start)) == 3
+    assert (np.diff(problem.shift_start) > 0).all()
+
+if __name__ == "__main__":
+    from conftest import create_problem
+    test_compile_from_files()
+    test_timetable_round_trip()
+    test_compile_from_timetable_matches_ta_lookups(create_problem)
+    test_weeks_start_on_monday_when_the_first_shift_is_mid_week()
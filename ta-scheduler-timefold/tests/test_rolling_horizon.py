@@ -0,0 +1,93 @@
+import asyncio
+import logging
+
+from collections import Counter
+
+from timefold.solver.config import Duration
+
+from hello_world.solver             import TimetableSolverRollingHorizon
+from hello_world.feasibility        import check_feasibility
+from hello_world.partition          import allocate_semester_budget
+from hello_world.rolling_horizon    import freeze_past_weeks, plan_horizon
+
+LOGGER = logging.getLogger("test")
+
+def create_solver(current_week):
+    solver = TimetableSolverRollingHorizon(constraint_version="default", logger=LOGGER, random_seed=1,
+                                           current_week=current_week, horizon_weeks=2)
+    solver.default_term_time_budget = Duration(seconds=3)
+    return solver
+
+def replan(problem, current_week):
+    return create_solver(current_week).solve_problem(problem, log_solution=False)
+
+def test_weekly_replans_keep_the_past_and_the_semester_totals(create_problem):
+    problem = create_problem(num_of_weeks=6, name="rolling_horizon")
+
+    first = replan(problem, current_week=0)
+    assert all(assignment.assigned_ta is not None for assignment in first.shift_assignments)
+    planned = {assignment.id: assignment.get_ta_id() for assignment in first.shift_assignments}
+
+    second = replan(first, current_week=2)
+    assert all(assignment.get_ta_id() == planned[assignment.id] and assignment.pinned
+               for assignment in second.shift_assignments if assignment.shift.week_id < 2)
+    assert all(assignment.assigned_ta is not None for assignment in second.shift_assignments)
+    assert second.score.hard_score == 0
+    per_ta = Counter(assignment.get_ta_id() for assignment in second.shift_assignments)
+    assert all(per_ta[ta.id] == ta.required_shifts_per_semester for ta in second.tas)
+
+def test_the_async_replan_solves_the_window_and_plans_the_rest(create_problem):
+    problem = create_problem(num_of_weeks=6, name="rolling_horizon")
+    planned = {assignment.id: assignment.get_ta_id() for assignment in replan(problem, current_week=0).shift_assignments}
+
+    solver  = create_solver(current_week=2)
+    replanned = asyncio.run(solver.solve_async(problem))
+    window  = set(solver.horizon_plan.window_weeks)
+    assert window == {2, 3}
+    assert all(assignment.get_ta_id() == planned[assignment.id] and assignment.pinned
+               for assignment in replanned.shift_assignments if assignment.shift.week_id < 2)
+    assert all(assignment.assigned_ta is not None for assignment in replanned.shift_assignments)
+    assert replanned.score is not None and solver.solve_duration is not None
+    # the window was solved by an async job of its own
+    assert {assignment.shift.week_id for assignment in solver.get_solution_history().latest_solution.shift_assignments} == window
+
+def test_the_replan_job_yields_the_window_and_results_in_the_semester(create_problem):
+    problem = create_problem(num_of_weeks=6, name="rolling_horizon")
+    solver  = create_solver(current_week=2)
+
+    async def replan_job():
+        job     = solver.submit_async(problem)
+        events  = [event async for event in job]
+        return events, await job.result()
+    events, replanned = asyncio.run(replan_job())
+    assert replanned is problem and replanned.score is not None
+    assert all(assignment.assigned_ta is not None for assignment in replanned.shift_assignments if assignment.shift.week_id >= 2)
+    # the events are those of the window, up to its final solution
+    assert events and events[-1].is_final
+    assert {assignment.shift.week_id for assignment in events[-1].solution.shift_assignments} == {2, 3}
+
+def test_without_a_feasible_flow_the_remaining_requirement_goes_to_the_weeks_left(create_problem):
+    problem = create_problem(num_of_weeks=4, name="rolling_horizon")
+    flow    = check_feasibility(problem)
+    for assignment, ta_index in zip(problem.shift_assignments, flow.slot_ta.tolist()):
+        if assignment.shift.week_id < 2:
+            assignment.assigned_ta = problem.tas[ta_index]
+    freeze_past_weeks(problem, current_week=2)
+    # nobody can take a shift of week 3: no assignment meets every hard constraint
+    unstaffable = next(shift for shift in problem.shifts if shift.week_id == 3)
+    for ta in problem.tas:
+        for shifts in (ta.desired, ta.undesired):
+            shifts[:] = [shift for shift in shifts if shift.id != unstaffable.id]
+        ta.unavailable.append(unstaffable)
+        ta.is_indexed = False
+
+    plan    = plan_horizon(problem, current_week=2, horizon_weeks=1)
+    assert not plan.feasibility.is_feasible
+    budget  = allocate_semester_budget(problem, [plan.past_weeks, plan.window_weeks, plan.future_weeks], plan.feasibility, fixed_blocks=[0])
+    worked  = Counter(assignment.get_ta_id() for assignment in problem.shift_assignments if assignment.shift.week_id < 2)
+    assert budget[:, 0].tolist() == [worked[ta.id] for ta in problem.tas]
+    assert budget.sum(axis=1).tolist() == [ta.required_shifts_per_semester for ta in problem.tas]
+    assert plan.window.ta_budget.tolist() == budget[:, 1].tolist()
+    # the past block is also closed without fixed_blocks, since all its slots are assigned
+    assert allocate_semester_budget(problem, [plan.past_weeks, plan.window_weeks, plan.future_weeks], plan.feasibility)[:, 0].tolist() \
+        == budget[:, 0].tolist()
@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+from hello_world.scoring        import BatchScorer
+
+@pytest.mark.parametrize("num_of_weeks", [3])
+@pytest.mark.parametrize("constraint_version", ["default", "tabriz"])
+def test_breakdown_matches_score_analysis(problem, solution_manager, constraint_version):
+
+    # random assignments, a few slots left unassigned
+    rng     = np.random.default_rng(0)
+    slot_ta = rng.integers(len(problem.tas), size=(4, len(problem.shift_assignments)))
+    slot_ta[rng.random(slot_ta.shape) < 0.05] = -1
+    scorer  = BatchScorer.from_timetable(problem, constraint_version)
+    batch   = scorer.score_slot_ta(slot_ta)
+    assert len(batch) == 4
+
+    for row in range(len(slot_ta)):
+        for assignment, ta_index in zip(problem.shift_assignments, slot_ta[row].tolist()):
+            assignment.assigned_ta = problem.tas[ta_index] if ta_index >= 0 else None
+        score_analysis = solution_manager.analyze(problem)
+        assert batch.score_str(row) == str(score_analysis.score)
+        assert batch.constraint_map(row) == {constraint_ref.constraint_id: {"score": str(analysis.score), "match_count": analysis.match_count}
+                                             for constraint_ref, analysis in score_analysis.constraint_map.items()}
+        # the same row scored from the timetable
+        assert scorer.score_timetables([problem]).constraint_map(0) == batch.constraint_map(row)
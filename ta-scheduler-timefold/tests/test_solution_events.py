@@ -0,0 +1,64 @@
+import time
+import logging
+
+from copy import deepcopy
+
+from timefold.solver        import SolverJobBuilder
+from timefold.solver.config import Duration
+from timefold.solver.score  import HardMediumSoftScore
+
+from hello_world.solver             import TimetableSolverWithSolverManager
+from hello_world.solution_events    import BestSolutionThrottle
+
+LOGGER = logging.getLogger("test")
+
+def test_the_throttle_delivers_the_latest_improvement_per_interval_and_the_final_solution(problem):
+    solutions = []
+    for soft in range(10):
+        solution = deepcopy(problem)
+        solution.shift_assignments[0].assigned_ta = solution.tas[soft % len(solution.tas)]
+        solution.score = HardMediumSoftScore.of(0, 0, soft)
+        solutions.append(solution)
+
+    events   = []
+    throttle = BestSolutionThrottle(listener=events.append, min_interval_seconds=0.2)
+    for solution in solutions[:5]:
+        throttle.on_best_solution(solution)
+    assert [event.score.soft_score for event in events] == [0]     # the others wait for the end of the interval
+    time.sleep(0.4)
+    assert [event.score.soft_score for event in events] == [0, 4]
+    time.sleep(0.2)
+    for solution in solutions[5:9]:
+        throttle.on_best_solution(solution)
+    throttle.finish(solutions[9])
+    time.sleep(0.4)     # no timer is left to deliver 8
+    assert [event.score.soft_score for event in events] == [0, 4, 5, 9]  # the pending improvement (8) gives way to the final one
+    assert events[-1].is_final and events[-1].solution is solutions[9]
+    assert len(events[0].changed) == len(problem.shift_assignments)
+    assert events[1].changed == {problem.shift_assignments[0].id: solutions[4].tas[4 % len(problem.tas)].id}
+
+def test_diff_events_add_up_to_the_final_solution(problem):
+    solver = TimetableSolverWithSolverManager(constraint_version="default", logger=LOGGER, random_seed=1,
+                                              best_solution_interval_seconds=0.5, best_solution_diffs=True)
+    solver.default_term_time_budget = Duration(seconds=2)
+    events = []
+    solver.best_solution_listeners.append(lambda problem_id, event: events.append(event))
+    solution = solver.solve_problem(problem, log_solution=False)
+
+    assignments = {}
+    for event in events:
+        assignments.update(event.changed)
+    assert events[-1].is_final and events[-1].solution is not None
+    assert all(event.solution is None for event in events[:-1])
+    assert assignments == {assignment.id: assignment.get_ta_id() for assignment in solution.shift_assignments}
+    assert solver.get_solution_history().latest.score == solution.score
+
+def test_the_private_timefold_api_of_the_throttle_is_there():
+    # BestSolutionThrottle.attach relies on these; if this fails, the timefold upgrade broke the throttle
+    solver = TimetableSolverWithSolverManager(constraint_version="default", logger=LOGGER, random_seed=1)
+    solver.create_solver()
+    builder = solver._solver_manager.solve_builder()
+    assert hasattr(builder, "_delegate"), "SolverJobBuilder._delegate is gone: update BestSolutionThrottle.attach"
+    assert hasattr(builder._delegate, "withBestSolutionConsumer") and hasattr(builder._delegate, "withFinalBestSolutionConsumer")
+    from _jpyinterpreter import unwrap_python_like_object    # noqa: F401 (ImportError: update BestSolutionThrottle)
+    assert isinstance(BestSolutionThrottle(listener=lambda event: None).attach(builder), SolverJobBuilder)
@@ -0,0 +1,36 @@
+import logging
+
+from timefold.solver.config import Duration
+from timefold.solver.score  import HardMediumSoftScore
+
+from hello_world.solver             import TimetableSolverWithSolverManager
+from hello_world.solution_history   import SolutionHistory
+
+LOGGER = logging.getLogger("test")
+
+def test_the_ring_keeps_the_last_records_and_the_first_feasible_one(problem):
+    history = SolutionHistory(max_records=3)
+    for hard in range(-5, 1):
+        for index, assignment in enumerate(problem.shift_assignments):
+            assignment.assigned_ta = problem.tas[(index - hard) % len(problem.tas)] if index % 2 == 0 else None
+        problem.score = HardMediumSoftScore.of(min(hard + 1, 0), 0, hard)
+        history.add(problem)
+
+    records = history.records()
+    assert len(history) == 3 and history.total_count == 6
+    assert [record.index for record in records] == [3, 4, 5]
+    assert history.first_feasible.index == 4 and history.time_to_feasible() == history.first_feasible.elapsed_seconds
+    assert [score for _, score in history.score_trajectory()] == [HardMediumSoftScore.of(-1, 0, -2), HardMediumSoftScore.of(0, 0, -1), HardMediumSoftScore.of(0, 0, 0)]
+    assert history.latest is records[-1] and history.latest_solution is problem
+    assert history.assignments(history.latest) == {assignment.id: assignment.get_ta_id() for assignment in problem.shift_assignments}
+
+def test_a_finished_job_keeps_its_history(problem):
+    solver = TimetableSolverWithSolverManager(constraint_version="default", logger=LOGGER, random_seed=1, solution_history_size=4)
+    solver.default_term_time_budget = Duration(seconds=2)
+    solution = solver.solve_problem(problem, log_solution=False)
+
+    history = solver.get_solution_history()
+    assert 0 < len(history) <= 4 and history.total_count >= len(history)
+    assert history.latest.score == solution.score
+    assert history.time_to_feasible() is not None
+    assert history.summary()["score_trajectory"][-1][1] == str(solution.score)
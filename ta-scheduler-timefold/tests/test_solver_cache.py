@@ -0,0 +1,42 @@
+import logging
+
+from timefold.solver.config import Duration
+
+from hello_world.solver         import TimetableSolverBlocking, TimetableSolverWithSolverManager
+from hello_world.solver_cache   import solver_cache_info, clear_solver_cache
+
+LOGGER = logging.getLogger("test")
+
+def test_solvers_of_a_configuration_share_the_factory_and_managers():
+    clear_solver_cache()
+    first   = TimetableSolverWithSolverManager(constraint_version="default", logger=LOGGER, random_seed=1)
+    second  = TimetableSolverWithSolverManager(constraint_version="default", logger=LOGGER, random_seed=1)
+    first.create_solver()
+    second.create_solver()
+    assert second.solver_factory is first.solver_factory
+    assert second._solver_manager is first._solver_manager
+    assert second.get_solution_manager() is first.get_solution_manager()
+    assert solver_cache_info() == {"entries": 1, "hits": 1, "misses": 1}
+
+    # another termination or seed is another factory, and a profiled factory is never shared
+    shorter = TimetableSolverBlocking(constraint_version="default", logger=LOGGER, random_seed=1)
+    shorter.default_term_time_budget = Duration(seconds=5)
+    shorter.create_solver()
+    profiled = TimetableSolverBlocking(constraint_version="default", logger=LOGGER, random_seed=1, profile_constraints=True)
+    profiled.create_solver()
+    assert len({id(solver.solver_factory) for solver in (first, shorter, profiled)}) == 3
+    assert solver_cache_info()["entries"] == 2
+
+    first.set_random_seed(2)
+    first.create_solver()
+    assert first.solver_factory is not second.solver_factory and first.solver_config.random_seed == 2
+    assert second.solver_config.random_seed == 1
+
+def test_warm_up_runs_once_per_factory():
+    clear_solver_cache()
+    solver = TimetableSolverBlocking(constraint_version="default", logger=LOGGER)
+    solver.warm_up(seconds=1)
+    assert solver.cached_factory.warmed_up
+    other = TimetableSolverBlocking(constraint_version="default", logger=LOGGER)
+    other.warm_up(seconds=1)
+    assert other.cached_factory is solver.cached_factory
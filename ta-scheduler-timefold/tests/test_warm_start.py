@@ -0,0 +1,90 @@
+import pickle
+import pytest
+
+from copy import deepcopy
+
+from timefold.solver        import SolverFactory
+from timefold.solver.config import SolverConfig, ScoreDirectorFactoryConfig, TerminationConfig, Duration
+
+from hello_world.domain         import Timetable, ShiftAssignment
+from hello_world.constraints    import constraints_provider_dict
+from hello_world.feasibility    import check_feasibility, apply_warm_start
+from hello_world.warm_start     import seed_from_solution, load_previous_solution
+
+@pytest.fixture
+def previous(create_problem):
+    # a solved problem
+    solution = create_problem(num_of_weeks=4, name="warm_start")
+    apply_warm_start(solution, check_feasibility(solution))
+    return solution
+
+def test_seed_pins_weeks_and_drops_invalid_assignments(previous):
+    problem     = deepcopy(previous)
+    for assignment in problem.shift_assignments:
+        assignment.assigned_ta = None
+
+    # one TA drops the last week
+    dropping_ta = problem.tas[0]
+    last_week   = [shift for shift in problem.shifts if shift.week_id == 3]
+    dropping_ta.unavailable.extend(last_week)
+    dropping_ta.is_indexed = False
+    expected_dropped = sum(1 for assignment in previous.shift_assignments if assignment.get_ta_id() == dropping_ta.id and assignment.shift.week_id == 3)
+
+    result = seed_from_solution(problem, previous, pinned_weeks=[0, 1])
+    assert result.dropped == expected_dropped > 0
+    assert result.seeded == len(problem.shift_assignments) - expected_dropped
+    assert result.pinned == sum(1 for assignment in problem.shift_assignments if assignment.shift.week_id in (0, 1))
+    # the seeded TAs are the problem's own instances, not the previous solution's
+    assert all(assignment.assigned_ta is None or any(assignment.assigned_ta is ta for ta in problem.tas) for assignment in problem.shift_assignments)
+
+def test_seeding_a_previous_solution_resets_its_dropped_and_unpinned_slots(previous):
+    problem     = deepcopy(previous)        # re-planned in place, as the rolling horizon does
+    for assignment in problem.shift_assignments:
+        assignment.pinned = True
+
+    dropping_ta = problem.tas[0]
+    dropping_ta.unavailable.extend(shift for shift in problem.shifts if shift.week_id == 3)
+    dropping_ta.is_indexed = False
+
+    seed_from_solution(problem, previous, pinned_weeks=[0])
+    assert all(assignment.pinned == (assignment.shift.week_id == 0) for assignment in problem.shift_assignments)
+    assert not any(assignment.get_ta_id() == dropping_ta.id for assignment in problem.shift_assignments if assignment.shift.week_id == 3)
+
+def test_a_solution_seeds_itself(previous):
+    # solve_problem(solution, previous_solution=solution): the natural call of a re-plan
+    planned = {assignment.id: assignment.get_ta_id() for assignment in previous.shift_assignments}
+    result  = seed_from_solution(previous, previous, pinned_weeks=[0])
+    assert (result.seeded, result.dropped) == (len(planned), 0)
+    assert {assignment.id: assignment.get_ta_id() for assignment in previous.shift_assignments} == planned
+    assert all(assignment.pinned == (assignment.shift.week_id == 0) for assignment in previous.shift_assignments)
+
+def test_load_previous_solution_from_results_pickles(previous, tmp_path):
+    with open(tmp_path / "solutions.pkl", "wb") as f:
+        pickle.dump([previous], f)
+    with open(tmp_path / "baseline.pkl", "wb") as f:
+        pickle.dump({"problem_database": {}, "solutions": [previous]}, f)
+
+    for file_name in ["solutions.pkl", "baseline.pkl"]:
+        loaded = load_previous_solution(tmp_path / file_name)
+        assert [assignment.get_ta_id() for assignment in loaded.shift_assignments] == [assignment.get_ta_id() for assignment in previous.shift_assignments]
+        assert not any(assignment.pinned for assignment in loaded.shift_assignments)
+
+def test_pinned_assignments_are_kept_by_the_solver(previous):
+    problem     = deepcopy(previous)
+    for assignment in problem.shift_assignments:
+        assignment.assigned_ta = None
+    seed_from_solution(problem, previous, pinned_weeks=[0])
+    for assignment in problem.shift_assignments:
+        if not assignment.pinned:
+            assignment.assigned_ta = None
+
+    solver_config = SolverConfig(random_seed=1,
+                                 solution_class=Timetable,
+                                 entity_class_list=[ShiftAssignment],
+                                 score_director_factory_config=ScoreDirectorFactoryConfig(constraint_provider_function=constraints_provider_dict["default"]),
+                                 termination_config=TerminationConfig(spent_limit=Duration(seconds=2)))
+    solution = SolverFactory.create(solver_config).build_solver().solve(problem)
+
+    previous_ta_ids = {assignment.id: assignment.get_ta_id() for assignment in previous.shift_assignments}
+    assert all(assignment.get_ta_id() == previous_ta_ids[assignment.id] for assignment in solution.shift_assignments if assignment.shift.week_id == 0)
+    assert all(assignment.assigned_ta is not None for assignment in solution.shift_assignments)
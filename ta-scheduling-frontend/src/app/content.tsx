@@ -119,15 +119,37 @@ export default function HomeContent() {
         })
         const job_id = (await response.text()).split("\"")[1]
 
-        let status;
-        do {
-            await new Promise(resolve => setTimeout(resolve, 2000))
-            response = await fetch(`http://localhost:8080/schedules/${job_id}`)
-            const schedule = await response.json()
-            status = schedule.solverStatus
-            dispatch(setTimetable(schedule))
-
-        } while (status !== "NOT_SOLVING")
+        // the server streams the assignments that change as the solver improves, up to the final solution
+        response = await fetch(`http://localhost:8080/schedules/${job_id}`)
+        let schedule = await response.json()
+        const tas = new Map<string, TA>(schedule.tas.map((ta: TA) => [ta.id, ta]))
+        await new Promise<void>(resolve => {
+            const events = new EventSource(`http://localhost:8080/schedules/${job_id}/events`)
+            const applyChanges = (message: MessageEvent) => {
+                const progress = JSON.parse(message.data)
+                schedule = {
+                    ...schedule,
+                    score: progress.score ?? schedule.score,
+                    solverStatus: progress.solverStatus,
+                    shiftAssignments: schedule.shiftAssignments.map((assignment: ShiftAssignment) =>
+                        assignment.id in progress.assignments
+                            ? { ...assignment, assignedTa: tas.get(progress.assignments[assignment.id]) ?? null }
+                            : assignment)
+                }
+                dispatch(setTimetable(schedule))
+            }
+            events.addEventListener("snapshot", applyChanges)
+            events.addEventListener("update", applyChanges)
+            events.addEventListener("final", (message) => {
+                applyChanges(message as MessageEvent)
+                events.close()
+                resolve()
+            })
+            events.onerror = () => {
+                events.close()
+                resolve()
+            }
+        })
 
         setGenerationStatus("Complete")
     }
@@ -0,0 +1,63 @@
+import numpy as np
+
+from typing import Any
+
+from .domain import Timetable
+
+# Availability codes of the TA x shift matrix
+DESIRED, NEUTRAL, UNDESIRED, UNAVAILABLE = 1, 0, -1, -2
+
+# Severity of the issues, mirroring the score levels of the constraints they predict
+ERROR   = "error"       # the hard constraints cannot all be met
+WARNING = "warning"     # medium (required shifts) or soft (preferences) constraints will be violated
+
+
+def availability_matrix(schedule: Timetable) -> np.ndarray:
+    """Builds the int8 TA x shift availability matrix (DESIRED, NEUTRAL, UNDESIRED, UNAVAILABLE)."""
+    column_by_shift_id = {shift.id: column for column, shift in enumerate(schedule.shifts)}
+    matrix = np.full((len(schedule.tas), len(schedule.shifts)), NEUTRAL, dtype=np.int8)
+    # later statuses win, matching TA.get_status_for_shift (desired > undesired > unavailable)
+    for code, attribute in [(UNAVAILABLE, "unavailable"), (UNDESIRED, "undesired"), (DESIRED, "desired")]:
+        for row, ta in enumerate(schedule.tas):
+            matrix[row, [column_by_shift_id[shift.id] for shift in getattr(ta, attribute) if shift.id in column_by_shift_id]] = code
+    return matrix
+
+
+def analyze_capacity(schedule: Timetable) -> dict[str, Any]:
+    """Vectorized capacity analysis, so hopeless problems can be rejected before spending a solve budget.
+
+    Checks the available TAs of every shift against its required TAs, and the TAs' required shifts
+    against the total demand and their own availability.
+    """
+    matrix          = availability_matrix(schedule)
+    required        = np.array([shift.required_tas for shift in schedule.shifts], dtype=np.int64)
+    ta_required     = np.array([ta.required_shifts for ta in schedule.tas], dtype=np.int64)
+    shift_available = (matrix != UNAVAILABLE).sum(axis=0)
+    shift_willing   = (matrix >= NEUTRAL).sum(axis=0)
+    ta_available    = (matrix != UNAVAILABLE).sum(axis=1)
+    issues: list[dict[str, Any]] = []
+
+    def add_issue(code: str, severity: str, message: str, **ids: str) -> None:
+        issues.append({"code": code, "severity": severity, "message": message, **ids})
+
+    for i in np.flatnonzero(required > shift_available):
+        shift = schedule.shifts[i]
+        add_issue("TMTBL.shifts.unavailable", ERROR, f"Only {shift_available[i]} TAs are available for shift '{shift}', but {required[i]} are required.", shift_id=shift.id)
+    for i in np.flatnonzero(required > shift_willing):
+        shift = schedule.shifts[i]
+        add_issue("TMTBL.shifts.undesired", WARNING, f"Only {shift_willing[i]} TAs find shift '{shift}' desired/neutral, but {required[i]} are required.", shift_id=shift.id)
+    if ta_required.sum() != required.sum():
+        add_issue("TMTBL.workforce.count", WARNING, f"The TAs require {ta_required.sum()} shifts in total, but the shifts require {required.sum()} TAs.")
+    for t in np.flatnonzero(ta_required > ta_available):
+        ta = schedule.tas[t]
+        add_issue("TMTBL.ta.available", WARNING, f"TA '{ta.name}' requires {ta_required[t]} shifts, but is available for only {ta_available[t]}.", ta_id=ta.id)
+
+    return {
+        "is_feasible"           : not any(issue["severity"] == ERROR for issue in issues),
+        "num_tas"               : len(schedule.tas),
+        "num_shifts"            : len(schedule.shifts),
+        "total_demand"          : int(required.sum()),
+        "total_required_shifts" : int(ta_required.sum()),
+        "shift_available_tas"   : {shift.id: int(count) for shift, count in zip(schedule.shifts, shift_available)},
+        "issues"                : issues,
+    }
@@ -1,3 +1,6 @@
+from .jvm_cache import start_jvm
+start_jvm()     # with the class cache, before the domain classes start the JVM without it
+
 from .json_serialization import *
 
 from dataclasses import dataclass
@@ -22,6 +25,10 @@ class Shift(JsonDomainBase):
     def __str__(self):
         return f'{self.series} {self.day_of_week} {self.start_time.strftime("%H:%M")}'
     
+    def set_required_tas(self, required_tas: int) -> None:
+        # setter for problem changes: the translated modifiers cannot call BaseModel.__setattr__ on another object
+        self.required_tas = required_tas
+
 
 class TA(JsonDomainBase):
     id: Annotated[str, PlanningId]
@@ -61,6 +68,10 @@ class ShiftAssignment(JsonDomainBase):
     assigned_ta: Annotated[TA | None,
                         PlanningVariable,
                         Field(default=None)]
+
+    def unassign(self) -> None:
+        # used by the problem changes (see Shift.set_required_tas)
+        self.assigned_ta = None
     
     # def __str__(self):
     #     return f'{self.shift} {self.assigned_ta}'
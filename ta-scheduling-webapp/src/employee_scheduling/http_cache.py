@@ -0,0 +1,79 @@
+import gzip
+import threading
+
+from typing import Callable, Hashable, Optional
+
+from fastapi import Request, Response
+
+# Conditional, compressed JSON responses for the schedules that clients poll: the ETag names the version of the
+# schedule, so an unchanged schedule costs a 304, and a changed one is serialized and compressed once per version.
+
+GZIP_MIN_SIZE = 1024    # smaller bodies are sent as they are
+GZIP_LEVEL = 6
+
+
+def _matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags or etag.removeprefix("W/") in [tag.removeprefix("W/") for tag in tags]
+
+
+def _quality(parameters: list[str]) -> float:
+    # the q of an Accept-Encoding entry: 1 without one, 0 ("not acceptable") if it is malformed
+    for parameter in parameters:
+        name, _, value = parameter.partition("=")
+        if name.strip().lower() == "q":
+            try:
+                return float(value)
+            except ValueError:
+                return 0
+    return 1
+
+
+def _accepts_gzip(request: Request) -> bool:
+    for encoding in request.headers.get("accept-encoding", "").split(","):
+        name, *parameters = encoding.split(";")
+        if name.strip().lower() == "gzip":
+            return _quality(parameters) > 0
+    return False
+
+
+class ResponseCache:
+    def __init__(self):
+        # {key: (etag, body, gzipped body)}, one version per key
+        self._bodies: dict[Hashable, tuple[str, bytes, Optional[bytes]]] = {}
+        self._lock = threading.Lock()
+
+    def json_response(self, request: Request, etag: str, make_body: Callable[[], bytes], key: Optional[Hashable] = None) -> Response:
+        # 304 if the client has `etag`; otherwise the body (from the cache with a `key`), gzipped if the client accepts it
+        headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+        if _matches(request, etag):
+            return Response(status_code=304, headers=headers)
+
+        cached = self._get(key, etag)
+        body, gzipped = cached[1:] if cached else (make_body(), None)
+        if _accepts_gzip(request) and len(body) >= GZIP_MIN_SIZE:
+            if gzipped is None:
+                gzipped = gzip.compress(body, compresslevel=GZIP_LEVEL)
+            headers["Content-Encoding"] = "gzip"
+        if key is not None:
+            with self._lock:
+                self._bodies[key] = (etag, body, gzipped)
+        return Response(gzipped if "Content-Encoding" in headers else body, media_type="application/json", headers=headers)
+
+    def _get(self, key: Optional[Hashable], etag: str) -> Optional[tuple[str, bytes, Optional[bytes]]]:
+        if key is None:
+            return None
+        with self._lock:
+            cached = self._bodies.get(key)
+        return cached if cached is not None and cached[0] == etag else None
+
+    def size(self) -> int:
+        with self._lock:
+            return sum(len(body) + len(gzipped or b"") for _, body, gzipped in self._bodies.values())
+
+    def discard(self, key: Hashable):
+        with self._lock:
+            self._bodies.pop(key, None)
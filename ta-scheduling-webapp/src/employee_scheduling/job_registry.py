@@ -0,0 +1,122 @@
+import os
+import time
+import threading
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from .domain import Timetable
+
+# The schedules a worker keeps in memory, within a budget: the schedules being solved stay, and a finished one
+# leaves memory when it is idle for JOB_TTL_SECONDS or, least recently read first, when the schedules exceed
+# MEMORY_BUDGET_MB. A finished schedule is already saved, compressed, in the job store, which serves it until it
+# is read again and reloaded.
+
+MEMORY_BUDGET_MB = float(os.environ.get("TA_SCHEDULER_MEMORY_BUDGET_MB", 256))
+JOB_TTL_SECONDS = float(os.environ.get("TA_SCHEDULER_JOB_TTL_SECONDS", 3600))
+BYTES_PER_JSON_BYTE = 9     # a Timetable takes ~9 times the size of its JSON (tracemalloc on the demo data)
+
+
+def estimate_size(schedule: Timetable) -> int:
+    # the assigned TAs are references to the TAs of the schedule, not copies as in the JSON
+    return BYTES_PER_JSON_BYTE * len(schedule.model_dump_json(exclude={"shift_assignments": {"__all__": {"assigned_ta"}}},
+                                                              exclude_none=True))
+
+
+@dataclass
+class _Entry:
+    schedule: Timetable
+    size: int                   # estimated once per job: the solutions of a job share its shape
+    finished: bool = False
+    last_access: float = field(default_factory=time.monotonic)
+
+
+class JobRegistry:
+    def __init__(self, memory_budget_bytes: int = int(MEMORY_BUDGET_MB * 2 ** 20), ttl_seconds: float = JOB_TTL_SECONDS,
+                 on_evict: Optional[Callable[[str], None]] = None):
+        self.memory_budget_bytes = memory_budget_bytes
+        self.ttl_seconds = ttl_seconds
+        self.on_evict = on_evict        # called with the id of each evicted job
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()      # the least recently used first
+        self._size = 0
+        self._lock = threading.RLock()
+        self.evictions = 0
+        self.reloads = 0
+
+    def __contains__(self, job_id: str) -> bool:
+        with self._lock:
+            return job_id in self._entries
+
+    def __getitem__(self, job_id: str) -> Timetable:
+        schedule = self.get(job_id)
+        if schedule is None:
+            raise KeyError(job_id)
+        return schedule
+
+    def get(self, job_id: str) -> Optional[Timetable]:
+        with self._lock:
+            entry = self._entries.get(job_id)
+            if entry is not None:
+                self._touch(job_id, entry)
+        self._evict()
+        return entry.schedule if entry is not None else None
+
+    def __setitem__(self, job_id: str, schedule: Timetable):
+        # a job being solved, or its new best solution
+        with self._lock:
+            entry = self._entries.get(job_id)
+            if entry is None:
+                entry = self._entries[job_id] = _Entry(schedule, estimate_size(schedule))
+                self._size += entry.size
+            else:
+                entry.schedule = schedule
+                self._touch(job_id, entry)
+        self._evict()
+
+    def finish(self, job_id: str):
+        # the job's final schedule is in the job store, so it can be evicted
+        with self._lock:
+            entry = self._entries.get(job_id)
+            if entry is not None:
+                entry.finished = True
+                self._touch(job_id, entry)
+        self._evict()
+
+    def reload(self, job_id: str, schedule: Timetable):
+        # a finished schedule read back from the job store
+        with self._lock:
+            if job_id not in self._entries:
+                self._entries[job_id] = _Entry(schedule, estimate_size(schedule), finished=True)
+                self._size += self._entries[job_id].size
+                self.reloads += 1
+        self._evict()
+
+    def _touch(self, job_id: str, entry: _Entry):
+        entry.last_access = time.monotonic()
+        self._entries.move_to_end(job_id)
+
+    def _evict(self):
+        evicted = []
+        with self._lock:
+            now = time.monotonic()
+            for job_id, entry in list(self._entries.items()):
+                if not entry.finished:
+                    continue
+                if self._size <= self.memory_budget_bytes and now - entry.last_access < self.ttl_seconds:
+                    break       # the entries after it were used more recently
+                del self._entries[job_id]
+                self._size -= entry.size
+                self.evictions += 1
+                evicted.append(job_id)
+        if self.on_evict is not None:
+            for job_id in evicted:
+                self.on_evict(job_id)
+
+    def stats(self) -> dict:
+        self._evict()
+        with self._lock:
+            solving = sum(not entry.finished for entry in self._entries.values())
+            return {"jobs": len(self._entries), "solving": solving, "finished": len(self._entries) - solving,
+                    "estimatedBytes": self._size, "budgetBytes": self.memory_budget_bytes, "ttlSeconds": self.ttl_seconds,
+                    "evictions": self.evictions, "reloads": self.reloads}
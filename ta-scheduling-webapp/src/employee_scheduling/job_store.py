@@ -0,0 +1,165 @@
+import os
+import json
+import time
+import zlib
+import sqlite3
+import threading
+
+from dataclasses import dataclass
+from typing import Optional
+
+from .domain import Timetable
+from .progress import score_to_json
+
+# The jobs of the app in a local SQLite file: the submitted problem, the solver status, the best score and solution
+# and their version, so every worker process serves every job and the jobs outlive a restart (without solving again).
+# A solve delivers a best solution up to twice a second; the store keeps the latest one of each job in memory and a
+# writer thread saves them together every FLUSH_SECONDS, so a job costs one serialization and one transaction per
+# flush instead of per improvement. The final solution is saved right away.
+
+JOB_STORE_PATH = os.environ.get("TA_SCHEDULER_JOB_STORE", "data/jobs.sqlite3")
+FLUSH_SECONDS = float(os.environ.get("TA_SCHEDULER_JOB_STORE_FLUSH_SECONDS", 1))
+COMPRESS_LEVEL = 6
+_LOADED_AT = time.time()    # the jobs of this pid updated before then were left by an earlier process with the pid
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id          TEXT PRIMARY KEY,
+    name        TEXT,
+    status      TEXT    NOT NULL,
+    score       TEXT,
+    version     INTEGER NOT NULL DEFAULT 0,
+    owner_pid   INTEGER NOT NULL,
+    problem     BLOB    NOT NULL,
+    solution    BLOB,
+    created_at  REAL    NOT NULL,
+    updated_at  REAL    NOT NULL
+)
+"""
+_RECORD_COLUMNS = "id, name, status, score, version, owner_pid, created_at, updated_at"
+
+
+def _is_running(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def dump_schedule(schedule: Timetable) -> bytes:
+    return zlib.compress(schedule.model_dump_json(by_alias=True, exclude_none=True).encode(), COMPRESS_LEVEL)
+
+
+def load_schedule(blob: bytes) -> Timetable:
+    return Timetable.model_validate_json(zlib.decompress(blob))
+
+
+@dataclass(frozen=True)
+class JobRecord:
+    id: str
+    name: Optional[str]         # the id of the timetable
+    status: str                 # a SolverStatus name
+    score: Optional[dict]       # as in the schedule JSON
+    version: int                # of the best solution, as in the ETag and the events
+    owner_pid: int              # the worker process that solves the job
+    created_at: float
+    updated_at: float
+
+
+class JobStore:
+    def __init__(self, path: str = JOB_STORE_PATH, flush_seconds: float = FLUSH_SECONDS):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._local = threading.local()      # a connection per thread
+        self._pending: dict[str, tuple[Timetable, int, str, float]] = {}   # {job: (best solution, version, status, time)}
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # one flush at a time, so a job's versions are written in order
+        self._closed = threading.Event()
+        with self._connection() as connection:
+            connection.execute(_SCHEMA)
+        self._recover()
+        self._writer = threading.Thread(target=self._write_behind, args=(flush_seconds,), name="job-store-writer", daemon=True)
+        self._writer.start()
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._local.connection = sqlite3.connect(self.path, timeout=10)
+            connection.execute("PRAGMA journal_mode=WAL")       # readers don't wait for the writers of other workers
+            connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def _recover(self):
+        # the jobs of the processes that are gone (a restart) stay with their last saved solution, not solving;
+        # a job of this pid is stale if an earlier process that had the same pid left it
+        with self._connection() as connection:
+            rows = connection.execute("SELECT id, owner_pid, updated_at FROM jobs WHERE status != 'NOT_SOLVING'").fetchall()
+            stale = [(time.time(), job_id) for job_id, pid, updated_at in rows
+                     if (updated_at < _LOADED_AT if pid == os.getpid() else not _is_running(pid))]
+            connection.executemany("UPDATE jobs SET status = 'NOT_SOLVING', updated_at = ? WHERE id = ?", stale)
+
+    def create(self, job_id: str, problem: Timetable, status: str = "SOLVING_SCHEDULED"):
+        now = time.time()
+        with self._connection() as connection:
+            connection.execute("INSERT INTO jobs (id, name, status, score, version, owner_pid, problem, created_at, updated_at) "
+                               "VALUES (?, ?, ?, ?, 0, ?, ?, ?, ?)",
+                               (job_id, problem.id, status, json.dumps(score_to_json(problem.score)), os.getpid(),
+                                dump_schedule(problem), now, now))
+
+    def save_best(self, job_id: str, schedule: Timetable, version: int, status: str, final: bool = False):
+        # write-behind: the writer thread saves the latest solution of the job; a final solution is saved now
+        with self._pending_lock:
+            self._pending[job_id] = (schedule, version, status, time.time())
+        if final:
+            self.flush()
+
+    def set_status(self, job_id: str, status: str):
+        self.flush()
+        with self._connection() as connection:
+            connection.execute("UPDATE jobs SET status = ?, updated_at = ? WHERE id = ?", (status, time.time(), job_id))
+
+    def flush(self):
+        with self._flush_lock:
+            with self._pending_lock:
+                pending, self._pending = self._pending, {}
+            if not pending:
+                return
+            rows = [(status, json.dumps(score_to_json(schedule.score)), version, dump_schedule(schedule), updated_at, job_id)
+                    for job_id, (schedule, version, status, updated_at) in pending.items()]
+            with self._connection() as connection:
+                connection.executemany("UPDATE jobs SET status = ?, score = ?, version = ?, solution = ?, updated_at = ? "
+                                       "WHERE id = ?", rows)
+
+    def _write_behind(self, flush_seconds: float):
+        while not self._closed.wait(flush_seconds):
+            self.flush()
+
+    def close(self):
+        self._closed.set()
+        self._writer.join()
+        self.flush()
+
+    def _record(self, row: tuple) -> JobRecord:
+        record = JobRecord(row[0], row[1], row[2], json.loads(row[3]) if row[3] else None, *row[4:])
+        if record.status != "NOT_SOLVING" and record.owner_pid != os.getpid() and not _is_running(record.owner_pid):
+            # its worker died while solving
+            return JobRecord(**{**record.__dict__, "status": "NOT_SOLVING"})
+        return record
+
+    def get(self, job_id: str) -> Optional[JobRecord]:
+        row = self._connection().execute(f"SELECT {_RECORD_COLUMNS} FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._record(row) if row is not None else None
+
+    def list(self) -> list[JobRecord]:
+        rows = self._connection().execute(f"SELECT {_RECORD_COLUMNS} FROM jobs ORDER BY created_at").fetchall()
+        return [self._record(row) for row in rows]
+
+    def load(self, job_id: str) -> Optional[tuple[JobRecord, Timetable]]:
+        # the record and its best solution (the problem until the first one is saved)
+        row = self._connection().execute(f"SELECT {_RECORD_COLUMNS}, COALESCE(solution, problem) FROM jobs WHERE id = ?",
+                                         (job_id,)).fetchone()
+        return (self._record(row[:-1]), load_schedule(row[-1])) if row is not None else None
@@ -0,0 +1,57 @@
+import os
+import re
+import time
+import hashlib
+import importlib.metadata
+
+from pathlib import Path
+
+import jpype
+import timefold.solver
+from _jpyinterpreter import get_default_jvm_path
+
+# On-disk AOT cache of the JVM classes Timefold loads at start-up (JDK 25+): the first process records it
+# at exit, the next ones load it. The classes generated from the domain and the constraints are bound to
+# the live Python objects, so they are translated again in every process.
+# Set TA_SCHEDULER_JVM_CACHE=0 to start the JVM without it.
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "ta-scheduler"
+
+
+def _java_feature_version(jvm_path: str) -> int:
+    release_path = Path(jvm_path).parents[2] / "release"    # <java home>/lib/server/libjvm.so
+    match = re.search(r'JAVA_VERSION="(\d+)', release_path.read_text()) if release_path.exists() else None
+    return int(match.group(1)) if match else 0
+
+
+def _cache_options(jvm_path: str) -> list[str]:
+    # the JVM and the Timefold jars on the class path
+    key = f"{jvm_path}:{os.stat(jvm_path).st_mtime_ns}:{Path(timefold.solver.__file__).parent}:{importlib.metadata.version('timefold')}"
+    cache_path = CACHE_DIR / f"jvm-{hashlib.sha256(key.encode()).hexdigest()[:16]}.aot"
+    lock_path = cache_path.with_suffix(".lock")
+    quiet = ["-Xlog:aot*=off", "-Xlog:cds*=off"]
+    if cache_path.exists():
+        lock_path.unlink(missing_ok=True)
+        return quiet + [f"-XX:AOTCache={cache_path}"]
+
+    # only one process records the cache (a lock older than 10 minutes was left by one that could not)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    if lock_path.exists() and time.time() - lock_path.stat().st_mtime > 600:
+        lock_path.unlink(missing_ok=True)
+    try:
+        os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+    except FileExistsError:
+        return []
+    return quiet + [f"-XX:AOTCacheOutput={cache_path}"]
+
+
+def start_jvm() -> None:
+    if jpype.isJVMStarted():
+        return
+    jvm_path = get_default_jvm_path()
+    options = []
+    if os.environ.get("TA_SCHEDULER_JVM_CACHE") != "0" and _java_feature_version(jvm_path) >= 25:
+        try:
+            options = _cache_options(jvm_path)
+        except OSError:
+            options = []
+    timefold.solver.init(jvm_path, *options)
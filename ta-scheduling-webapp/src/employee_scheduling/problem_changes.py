@@ -0,0 +1,141 @@
+from typing import Annotated, Collection, Literal, Union
+from uuid   import uuid4
+
+from pydantic               import Field
+from timefold.solver        import ProblemChange, ProblemChangeDirector
+
+from .domain                import Timetable, TA, ShiftAssignment
+from .json_serialization    import JsonDomainBase
+
+# Notes on the working solution seen by ProblemChange.do_change (it is the translated Java object):
+#  - its ids are Java strings, so they are compared with str()
+#  - the modifiers are translated too, so they mutate through list methods or the domain setters
+#    (Shift.set_required_tas, ShiftAssignment.unassign) and new objects are built with model_construct
+
+def _find(items: list, item_id: str):
+    return next(item for item in items if str(item.id) == item_id)
+
+def _position(items: list, item_id: str) -> int | None:
+    return next((position for position, item in enumerate(items) if str(item.id) == item_id), None)
+
+
+class MarkUnavailable(ProblemChange[Timetable]):
+    """Marks a TA unavailable for a shift and frees the TA's assignments on it."""
+    def __init__(self, ta_id: str, shift_id: str):
+        self.ta_id      = ta_id
+        self.shift_id   = shift_id
+
+    def do_change(self, working_solution: Timetable, problem_change_director: ProblemChangeDirector) -> None:
+        shift = _find(working_solution.shifts, self.shift_id)
+        ta    = _find(working_solution.tas, self.ta_id)
+        desired_position    = _position(ta.desired, self.shift_id)
+        undesired_position  = _position(ta.undesired, self.shift_id)
+        already_unavailable = _position(ta.unavailable, self.shift_id) is not None
+
+        def make_unavailable(ta: TA) -> None:
+            if desired_position is not None:
+                ta.desired.pop(desired_position)
+            if undesired_position is not None:
+                ta.undesired.pop(undesired_position)
+            if not already_unavailable:
+                ta.unavailable.append(shift)
+        problem_change_director.change_problem_property(ta, make_unavailable)
+
+        # the solver restarts with the construction heuristic, which reassigns the freed slots
+        for assignment in working_solution.shift_assignments:
+            if str(assignment.shift.id) == self.shift_id and assignment.assigned_ta is not None and str(assignment.assigned_ta.id) == self.ta_id:
+                problem_change_director.change_variable(assignment, "assigned_ta", lambda assignment: assignment.unassign())
+
+
+class SetRequiredTas(ProblemChange[Timetable]):
+    """Changes the required TAs of a shift, adding or removing its shift assignments to match."""
+    def __init__(self, shift_id: str, required_tas: int):
+        self.shift_id       = shift_id
+        self.required_tas   = required_tas
+
+    def do_change(self, working_solution: Timetable, problem_change_director: ProblemChangeDirector) -> None:
+        shift           = _find(working_solution.shifts, self.shift_id)
+        required_tas    = self.required_tas
+        problem_change_director.change_problem_property(shift, lambda shift: shift.set_required_tas(required_tas))
+
+        positions = [position for position, assignment in enumerate(working_solution.shift_assignments) if str(assignment.shift.id) == self.shift_id]
+        for _ in range(len(positions), required_tas):
+            assignment = ShiftAssignment.model_construct(id=str(uuid4()), shift=shift, assigned_ta=None)
+            problem_change_director.add_entity(assignment, lambda assignment: working_solution.shift_assignments.append(assignment))
+        # remove the surplus from the end, so the remaining positions stay valid
+        for position in reversed(positions[required_tas:]):
+            problem_change_director.remove_entity(working_solution.shift_assignments[position],
+                                                  lambda assignment: working_solution.shift_assignments.pop(position))
+
+
+class AddTa(ProblemChange[Timetable]):
+    """Adds a TA, with their preferences referring to the working solution's shifts.
+
+    The new TA starts without assignments; the solver staffs them like the other TAs, e.g. on the
+    slots that MarkUnavailable freed. A TA whose id the working solution already has is not added again.
+    """
+    def __init__(self, ta: TA):
+        self.ta = ta
+
+    def do_change(self, working_solution: Timetable, problem_change_director: ProblemChangeDirector) -> None:
+        if _position(working_solution.tas, self.ta.id) is not None:
+            return
+        shifts_dict = {str(shift.id): shift for shift in working_solution.shifts}
+        ta = TA.model_construct(id              = self.ta.id,
+                                name            = self.ta.name,
+                                required_shifts = self.ta.required_shifts,
+                                desired         = [shifts_dict[shift.id] for shift in self.ta.desired],
+                                undesired       = [shifts_dict[shift.id] for shift in self.ta.undesired],
+                                unavailable     = [shifts_dict[shift.id] for shift in self.ta.unavailable],
+                                is_grad_student = self.ta.is_grad_student)
+        problem_change_director.add_problem_fact(ta, lambda ta: working_solution.tas.append(ta))
+
+
+# Request bodies of PATCH /schedules/{problem_id}, selected by "kind"
+class MarkUnavailableRequest(JsonDomainBase):
+    # the TA cannot take the shift any more: their assignments on it are freed
+    kind: Literal["markUnavailable"]
+    ta_id: str
+    shift_id: str
+
+class SetRequiredTasRequest(JsonDomainBase):
+    # the shift needs another number of TAs: its shift assignments are added or removed
+    kind: Literal["setRequiredTas"]
+    shift_id: str
+    required_tas: Annotated[int, Field(ge=0)]
+
+class AddTaRequest(JsonDomainBase):
+    # a new TA (with their desired, undesired and unavailable shifts) joins the pool the solver assigns from
+    kind: Literal["addTa"]
+    ta: TA
+
+ScheduleChange = Annotated[Union[MarkUnavailableRequest, SetRequiredTasRequest, AddTaRequest], Field(discriminator="kind")]
+
+
+def create_problem_change(schedule: Timetable, change: ScheduleChange, added_ta_ids: Collection[str] = ()) -> ProblemChange[Timetable]:
+    """Validates the change against the current schedule and builds the matching ProblemChange.
+
+    `added_ta_ids` are the TAs already submitted to the job, which the schedule only has from its next best
+    solution. Raises a ValueError for unknown (or, for a new TA, duplicate) ids.
+    """
+    shift_ids   = {shift.id for shift in schedule.shifts}
+    ta_ids      = {ta.id for ta in schedule.tas} | set(added_ta_ids)
+
+    if isinstance(change, MarkUnavailableRequest):
+        if change.ta_id not in ta_ids:
+            raise ValueError(f"Unknown TA '{change.ta_id}'")
+        if change.shift_id not in shift_ids:
+            raise ValueError(f"Unknown shift '{change.shift_id}'")
+        return MarkUnavailable(ta_id=change.ta_id, shift_id=change.shift_id)
+
+    if isinstance(change, SetRequiredTasRequest):
+        if change.shift_id not in shift_ids:
+            raise ValueError(f"Unknown shift '{change.shift_id}'")
+        return SetRequiredTas(shift_id=change.shift_id, required_tas=change.required_tas)
+
+    if change.ta.id in ta_ids:
+        raise ValueError(f"TA '{change.ta.id}' already exists")
+    unknown_shift_ids = {shift.id for shift in change.ta.desired + change.ta.undesired + change.ta.unavailable} - shift_ids
+    if unknown_shift_ids:
+        raise ValueError(f"Unknown shifts {sorted(unknown_shift_ids)}")
+    return AddTa(ta=change.ta)
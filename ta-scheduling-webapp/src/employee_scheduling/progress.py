@@ -0,0 +1,134 @@
+import json
+import asyncio
+import threading
+
+from typing import AsyncIterator, Callable, Optional
+
+from timefold.solver.score import HardMediumSoftScore
+
+# Server-sent events of the solver progress (GET /schedules/{problem_id}/events): each best solution event is
+# serialized once and queued to the clients of its job, so the server's work grows with the improvements instead
+# of clients x polling frequency. A client gets a "snapshot" (all assignments) when it connects, an "update"
+# (the changed assignments) per improvement and a "final" event when the solver terminates.
+# Each event is a new version of the schedule; the clients that poll get the assignments changed since the
+# version they have (GET /schedules/{problem_id}?since=<version>).
+# The events and versions live in the worker that solves the job; the other workers follow the job in the job store.
+
+KEEP_ALIVE_SECONDS = 15     # a comment line keeps proxies from closing a quiet stream
+STORE_POLL_SECONDS = 1      # how often the stream of a job solved by another worker checks the job store
+
+
+def score_to_json(score: Optional[HardMediumSoftScore]) -> Optional[dict]:
+    # the fields of the score in the schedule JSON
+    if score is None:
+        return None
+    return {"initScore": score.init_score, "hardScore": score.hard_score,
+            "mediumScore": score.medium_score, "softScore": score.soft_score}
+
+
+def format_event(kind: str, version: int, data: dict) -> str:
+    return f"event: {kind}\nid: {version}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+class SolverProgress:
+    def __init__(self):
+        self.lock = threading.RLock()      # held by the schedule updates, so a snapshot and the next update line up
+        self._subscribers: dict[str, set[tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = {}
+        self._versions: dict[str, int] = {}
+        self._changed_at: dict[str, dict[str, int]] = {}    # {job: {shift assignment id: version of its last change}}
+        self._history_from: dict[str, int] = {}             # the first version of a reloaded job's changes
+        self._finished: set[str] = set()
+
+    def start(self, job_id: str):
+        with self.lock:
+            self._versions[job_id] = 0
+            self._changed_at[job_id] = {}
+            self._finished.discard(job_id)
+
+    def restore(self, job_id: str, version: int):
+        # a finished job reloaded from the job store, without the history of its changes
+        with self.lock:
+            self._versions[job_id] = self._history_from[job_id] = version
+            self._changed_at[job_id] = {}
+            self._finished.add(job_id)
+
+    def forget_changes(self, job_id: str):
+        # a finished job evicted from memory keeps its version, not the history of its changes
+        with self.lock:
+            self._history_from[job_id] = self._versions.get(job_id, 0)
+            self._changed_at.pop(job_id, None)
+
+    def version(self, job_id: str) -> int:
+        with self.lock:
+            return self._versions.get(job_id, 0)
+
+    def changed_since(self, job_id: str, since: int) -> Optional[set[str]]:
+        # the shift assignments changed after version `since`; None if `since` is not a version of the job
+        with self.lock:
+            if not self._history_from.get(job_id, 0) <= since <= self._versions.get(job_id, 0):
+                return None
+            return {assignment_id for assignment_id, version in self._changed_at.get(job_id, {}).items() if version > since}
+
+    def publish(self, job_id: str, kind: str, data: dict) -> int:
+        # called from the solver's consumer threads; returns the new version
+        with self.lock:
+            version = self._versions[job_id] = self._versions.get(job_id, 0) + 1
+            changed_at = self._changed_at.setdefault(job_id, {})
+            for assignment_id in data["assignments"]:
+                changed_at[assignment_id] = version
+            if kind == "final":
+                self._finished.add(job_id)
+            message = format_event(kind, version, data)
+            for loop, queue in self._subscribers.get(job_id, ()):
+                loop.call_soon_threadsafe(queue.put_nowait, message)
+            return version
+
+    async def stream(self, job_id: str, snapshot: Callable[[], dict], is_solving: Callable[[], bool]) -> AsyncIterator[str]:
+        # snapshot() returns the current {"score", "solverStatus", "assignments"} of the job
+        queue: asyncio.Queue[str] = asyncio.Queue()
+        subscriber = (asyncio.get_running_loop(), queue)
+        with self.lock:
+            finished = job_id in self._finished
+            first = format_event("final" if finished else "snapshot", self._versions.get(job_id, 0), snapshot())
+            if not finished:
+                self._subscribers.setdefault(job_id, set()).add(subscriber)
+        try:
+            yield first
+            while not finished:
+                try:
+                    message = await asyncio.wait_for(queue.get(), KEEP_ALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    if not is_solving():     # the job ended without a final solution (e.g., it failed)
+                        with self.lock:
+                            message = format_event("final", self._versions.get(job_id, 0), snapshot())
+                    else:
+                        message = ": keep-alive\n\n"
+                finished = message.startswith("event: final")
+                yield message
+        finally:
+            with self.lock:
+                self._subscribers.get(job_id, set()).discard(subscriber)
+
+
+async def poll_stream(state: Callable[[], tuple[int, str]], snapshot: Callable[[], tuple[int, dict]],
+                      interval_seconds: float = STORE_POLL_SECONDS) -> AsyncIterator[str]:
+    # the events of a job that another worker solves, from its saved versions: state() returns the stored
+    # (version, solver status), snapshot() the stored (version, {"score", "solverStatus", "assignments"})
+    version, data = await asyncio.to_thread(snapshot)
+    finished = data["solverStatus"] == "NOT_SOLVING"
+    yield format_event("final" if finished else "snapshot", version, data)
+    sent, last_state, quiet_seconds = data["assignments"], (version, data["solverStatus"]), 0.0
+    while not finished:
+        await asyncio.sleep(interval_seconds)
+        current = await asyncio.to_thread(state)
+        if current == last_state:
+            quiet_seconds += interval_seconds
+            if quiet_seconds >= KEEP_ALIVE_SECONDS:
+                quiet_seconds = 0.0
+                yield ": keep-alive\n\n"
+            continue
+        version, data = await asyncio.to_thread(snapshot)
+        changed = {assignment_id: ta_id for assignment_id, ta_id in data["assignments"].items() if sent.get(assignment_id, "") != ta_id}
+        sent, last_state, quiet_seconds = data["assignments"], (version, data["solverStatus"]), 0.0
+        finished = data["solverStatus"] == "NOT_SOLVING"
+        yield format_event("final" if finished else "update", version, {**data, "assignments": changed})
@@ -1,10 +1,23 @@
-from fastapi import FastAPI
+import os
+import json
+
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from uuid import uuid4
+from threading import Thread
 # Custom imports
 from .domain import Timetable
 from .utils  import DemoData, generate_demo_data, initialize_logger, DataConstructor
 from .solver import solver_manager
+from .capacity import analyze_capacity
+from .problem_changes import AddTaRequest, ScheduleChange, create_problem_change
+from .solution_events import BestSolutionEvent
+from .progress import SolverProgress, score_to_json, poll_stream
+from .http_cache import ResponseCache
+from .job_store import JobRecord, JobStore
+from .job_registry import JobRegistry
+from timefold.solver import SolverStatus
 from fastapi.middleware.cors import CORSMiddleware
 
 
@@ -27,13 +40,39 @@ async def log_requests(request, call_next):
     response = await call_next(request)
     return response
 
-app.add_middleware(CORSMiddleware, allow_origins=origins, allow_credentials=True, allow_methods=["*"], allow_headers=["*"])
+app.add_middleware(CORSMiddleware, allow_origins=origins, allow_credentials=True, allow_methods=["*"], allow_headers=["*"],
+                   expose_headers=["ETag"])     # the version of a schedule, for ?since= and If-None-Match
+
+jobs = JobStore()
+progress = SolverProgress()
+responses = ResponseCache()
+# the TAs added by PATCH to each running job; its schedule has them from the next best solution on
+added_ta_ids: dict[str, set[str]] = {}
+# the running jobs changed by PATCH: their improvements come as whole solutions, since a diff of the assignments
+# misses the new TAs, shift assignments and availabilities
+changed_jobs: set[str] = set()
+
+def forget_job(problem_id: str):
+    progress.forget_changes(problem_id)
+    responses.discard(problem_id)
 
-data_sets: dict[str, Timetable] = {}
+# the schedules of the jobs this worker solves and of the finished jobs read recently; the job store has all the
+# jobs, including those of the other workers and of the earlier runs of the app
+data_sets = JobRegistry(on_evict=forget_job)
 
 logger = initialize_logger()
 logger.info("initialized the 'app' logger")
 
+@app.on_event("startup")
+def warm_up_solver():
+    # in the background, so the server starts accepting requests right away
+    Thread(target=solver_manager.warm_up, name="solver-warm-up", daemon=True).start()
+
+@app.on_event("shutdown")
+def close_job_store():
+    # saves the best solutions the writer has not saved yet
+    jobs.close()
+
 @app.get("/demo-data")
 async def demo_data_list() -> list[str]:
     return [e for e in DemoData]
@@ -60,26 +99,161 @@ async def get_timetable_from_data_folder(data_folder: str) -> Timetable:
     return constructor.timetable
 
 
-@app.get("/schedules/{problem_id}",  response_model_exclude_none=True)
-async def get_timetable(problem_id: str) -> Timetable:
+def assignments_json(schedule: Timetable, assignment_ids: set[str] | None = None) -> dict[str, str | None]:
+    # {shift assignment id: TA id} of all the assignments, or of `assignment_ids`
+    return {assignment.id: assignment.assigned_ta.id if assignment.assigned_ta is not None else None
+            for assignment in schedule.shift_assignments if assignment_ids is None or assignment.id in assignment_ids}
+
+
+def job_status(problem_id: str, record: JobRecord | None = None) -> SolverStatus:
+    # the solver of this worker knows its jobs; the job store has the status of the others
+    if problem_id in data_sets:
+        return solver_manager.get_solver_status(problem_id)
+    record = record or jobs.get(problem_id)
+    return SolverStatus[record.status] if record is not None else SolverStatus.NOT_SOLVING
+
+
+def registered_schedule(problem_id: str) -> Timetable | None:
+    # the schedule in memory; a finished job that is not in memory (evicted, or of another worker or an earlier
+    # run) is reloaded from the job store, while the jobs that other workers are solving are only read from it
+    schedule = data_sets.get(problem_id)
+    if schedule is None:
+        record = jobs.get(problem_id)
+        if record is not None and record.status == SolverStatus.NOT_SOLVING.name:
+            record, schedule = jobs.load(problem_id)
+            with progress.lock:
+                progress.restore(problem_id, record.version)
+                data_sets.reload(problem_id, schedule)
+    return schedule
+
+
+@app.get("/schedules/{problem_id}", response_model=Timetable, response_model_exclude_none=True)
+async def get_timetable(problem_id: str, request: Request, since: int | None = None) -> Response:
+    # the schedule, or with `since` (a version from the ETag, the events or a previous response) only the
+    # assignments changed after that version; If-None-Match with the ETag of the current version gives a 304
     logger.info(f"accessing '{problem_id}' problem_id")
-    schedule = data_sets[problem_id]
-    return schedule.model_copy(update={
-        'solver_status': solver_manager.get_solver_status(problem_id)
-    })
+    schedule = registered_schedule(problem_id)
+    if schedule is not None:
+        solver_status = solver_manager.get_solver_status(problem_id)
+        with progress.lock:
+            schedule = data_sets.get(problem_id) or schedule
+            version = progress.version(problem_id)
+            changed = progress.changed_since(problem_id, since) if since is not None else None
+        load_schedule = lambda: schedule
+    else:
+        # a job of another worker or of an earlier run, as last saved; the store keeps no history of the changes
+        record = jobs.get(problem_id)
+        if record is None:
+            raise HTTPException(status_code=404, detail=f"Unknown problem '{problem_id}'")
+        solver_status, version = job_status(problem_id, record), record.version
+        changed = set() if since == version else None
+        load_schedule = lambda: jobs.load(problem_id)[1]
+
+    if since is None:
+        etag = f'W/"{version}-{solver_status.name}"'
+        return responses.json_response(request, etag, key=problem_id, make_body=lambda: load_schedule().model_copy(update={
+            'solver_status': solver_status
+        }).model_dump_json(by_alias=True, exclude_none=True).encode())
+
+    def delta() -> bytes:
+        schedule = load_schedule()
+        return json.dumps({"version": version, "since": since, "full": changed is None, "score": score_to_json(schedule.score),
+                           "solverStatus": solver_status.name, "assignments": assignments_json(schedule, changed)},
+                          separators=(',', ':')).encode()
+
+    etag = f'W/"{version}-{solver_status.name}-{since}"'
+    return responses.json_response(request, etag, make_body=delta)
 
 @app.get("/schedules")
 async def list_schedules() -> dict[str, str]:
-    return {problem_id: f"{data_sets[problem_id].id}--status: {solver_manager.get_solver_status(problem_id)}" for problem_id in data_sets}
+    return {record.id: f"{record.name}--status: {job_status(record.id, record)}" for record in jobs.list()}
+
+def rss_bytes() -> int | None:
+    # the resident memory of the process, where /proc has it
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, AttributeError, ValueError):
+        return None
+
+@app.get("/status")
+async def get_status() -> dict:
+    # the memory of this worker: the schedules it keeps (see job_registry), its cached responses and its process
+    return {"pid": os.getpid(), "schedules": data_sets.stats(), "responseCacheBytes": responses.size(),
+            "rssBytes": rss_bytes()}
 
 @app.get("/schedules/{problem_id}/status")
 async def get_solver_status(problem_id: str) -> str:
-    return solver_manager.get_solver_status(problem_id)
+    return job_status(problem_id)
 
 
-def update_schedule(problem_id: str, schedule: Timetable):
+@app.get("/schedules/{problem_id}/events")
+async def stream_solver_progress(problem_id: str) -> StreamingResponse:
+    # server-sent events: a snapshot of the assignments, their changes as the solver improves, and the final solution
+    schedule = registered_schedule(problem_id)
+    if schedule is None:
+        if jobs.get(problem_id) is None:
+            raise HTTPException(status_code=404, detail=f"Unknown problem '{problem_id}'")
+        return StreamingResponse(poll_stream(lambda: stored_state(problem_id), lambda: stored_snapshot(problem_id)),
+                                 media_type="text/event-stream", headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+    def snapshot() -> dict:
+        current = data_sets.get(problem_id) or schedule
+        return {"score": score_to_json(current.score),
+                "solverStatus": solver_manager.get_solver_status(problem_id).name,
+                "assignments": assignments_json(current)}
+
+    def is_solving() -> bool:
+        return solver_manager.get_solver_status(problem_id) != SolverStatus.NOT_SOLVING
+
+    return StreamingResponse(progress.stream(problem_id, snapshot, is_solving), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+def stored_state(problem_id: str) -> tuple[int, str]:
+    record = jobs.get(problem_id)
+    return record.version, job_status(problem_id, record).name
+
+
+def stored_snapshot(problem_id: str) -> tuple[int, dict]:
+    record, schedule = jobs.load(problem_id)
+    return record.version, {"score": score_to_json(schedule.score), "solverStatus": job_status(problem_id, record).name,
+                            "assignments": assignments_json(schedule)}
+
+
+def update_schedule(problem_id: str, event: BestSolutionEvent):
     global data_sets
-    data_sets[problem_id] = schedule
+    solver_status = "NOT_SOLVING" if event.is_final else "SOLVING_ACTIVE"
+    with progress.lock:
+        if event.solution is not None:
+            data_sets[problem_id] = event.solution
+        else:
+            # an improvement without the solution: a copy of the stored schedule with the changed assignments
+            schedule = data_sets[problem_id]
+            tas = {ta.id: ta for ta in schedule.tas}
+            shift_assignments = [
+                shift_assignment if shift_assignment.id not in event.changed else
+                shift_assignment.model_copy(update={'assigned_ta': tas.get(event.changed[shift_assignment.id])})
+                for shift_assignment in schedule.shift_assignments
+            ]
+            data_sets[problem_id] = schedule.model_copy(update={'shift_assignments': shift_assignments, 'score': event.score})
+        version = progress.publish(problem_id, "final" if event.is_final else "update",
+                                   {"score": score_to_json(event.score), "solverStatus": solver_status,
+                                    "assignments": event.changed})
+        schedule = data_sets[problem_id]
+    jobs.save_best(problem_id, schedule, version, solver_status, final=event.is_final)
+    if event.is_final:
+        added_ta_ids.pop(problem_id, None)
+        changed_jobs.discard(problem_id)
+        data_sets.finish(problem_id)
+
+
+def job_failed(problem_id: str, error: Exception):
+    logger.error(f"solving '{problem_id}' failed: {error}")
+    jobs.set_status(problem_id, "NOT_SOLVING")
+    added_ta_ids.pop(problem_id, None)
+    changed_jobs.discard(problem_id)
+    data_sets.finish(problem_id)
 
 
 def fix_timetable(schedule: Timetable) -> Timetable:
@@ -107,16 +281,53 @@ def fix_timetable(schedule: Timetable) -> Timetable:
     return schedule
 
 
+@app.post("/schedules/capacity")
+async def check_capacity(schedule: Timetable) -> dict:
+    return analyze_capacity(schedule)
+
+
 @app.post("/schedules")
 async def solve_timetable(schedule: Timetable) -> str:
+    # reject the problems no solution can staff before spending a solve budget on them
+    capacity_report = analyze_capacity(schedule)
+    if not capacity_report["is_feasible"]:
+        raise HTTPException(status_code=422, detail=capacity_report)
+
     job_id = str(uuid4())
     print("Hello world")
     data_sets[job_id] = fix_timetable(schedule)
+    jobs.create(job_id, data_sets[job_id])
+    progress.start(job_id)
     solver_manager.solve_and_listen(job_id, schedule,
-                                    lambda solution: update_schedule(job_id, solution))
+                                    lambda event: update_schedule(job_id, event), diffs_only=lambda: job_id not in changed_jobs,
+                                    on_exception=lambda error: job_failed(job_id, error))
     return job_id
 
 
+@app.patch("/schedules/{problem_id}")
+async def change_schedule(problem_id: str, change: ScheduleChange) -> str:
+    # the running job keeps its best solution and repairs it, instead of restarting the solve
+    if problem_id not in data_sets and jobs.get(problem_id) is None:
+        raise HTTPException(status_code=404, detail=f"Unknown problem '{problem_id}'")
+    # only the worker that solves the job can change it; the registry keeps the jobs being solved, but the job
+    # may have finished (and been evicted) since its status was read
+    solving = solver_manager.get_solver_status(problem_id) == SolverStatus.SOLVING_ACTIVE
+    schedule = data_sets.get(problem_id) if solving else None
+    if schedule is None:
+        raise HTTPException(status_code=409, detail=f"Problem '{problem_id}' is not being solved by this worker")
+    try:
+        problem_change = create_problem_change(schedule, change, added_ta_ids.get(problem_id, ()))
+    except ValueError as error:
+        raise HTTPException(status_code=422, detail=str(error))
+    if isinstance(change, AddTaRequest):
+        added_ta_ids.setdefault(problem_id, set()).add(change.ta.id)
+    changed_jobs.add(problem_id)
+
+    logger.info(f"PATCH: submitting a {change.kind} change to '{problem_id}'")
+    solver_manager.add_problem_change(problem_id, problem_change)
+    return problem_id
+
+
 @app.delete("/schedules/{problem_id}")
 async def stop_solving(problem_id: str) -> None:
     solver_manager.terminate_early(problem_id)
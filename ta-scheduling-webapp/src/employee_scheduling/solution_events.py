@@ -0,0 +1,99 @@
+import time
+import threading
+
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from timefold.solver import SolverJobBuilder
+from timefold.solver.score import HardMediumSoftScore
+
+from .domain import Timetable
+
+# Throttled best solution events: early in a solve the solver improves many times a second, and converting
+# each improvement back to a Python Timetable costs more than the solver's step. The consumers below get the
+# Java solutions, deliver at most one event per interval (the latest improvement) plus the final solution,
+# and with `diffs_only` read the assignment ids without converting the solution (`diffs_only` may be a function,
+# asked at each improvement, e.g. to convert the solutions whose problem has changed).
+
+
+def read_assignments(solution: Any) -> dict[str, Optional[str]]:
+    # works on a Timetable and on the Java solution (which has PythonNone for None)
+    assignments = {}
+    for shift_assignment in solution.shift_assignments:
+        ta_id = getattr(shift_assignment.assigned_ta, "id", None)
+        assignments[str(shift_assignment.id)] = None if ta_id is None else str(ta_id)
+    return assignments
+
+
+@dataclass(frozen=True)
+class BestSolutionEvent:
+    score: HardMediumSoftScore
+    changed: dict[str, Optional[str]]       # {shift assignment id: TA id} that differ from the previous event
+    solution: Optional[Timetable] = None    # None for the improvements with diffs_only
+    is_final: bool = False
+
+
+class BestSolutionThrottle:
+    # The listener is called under the throttle's lock, on the solver's consumer thread for the final solution and
+    # the improvements that need no wait: it must return quickly and must not wait for the solver job, or the
+    # solver blocks.
+    def __init__(self, listener: Callable[[BestSolutionEvent], None], min_interval_seconds: float = 0.5,
+                 diffs_only: bool | Callable[[], bool] = False):
+        self.listener = listener
+        self.min_interval_seconds = min_interval_seconds
+        self.diffs_only = diffs_only
+        self._previous: dict[str, Optional[str]] = {}
+        self._last_delivery = float("-inf")
+        self._pending = None
+        self._timer: Optional[threading.Timer] = None
+        self._finished = False
+        self._lock = threading.RLock()
+
+    def attach(self, builder: SolverJobBuilder) -> SolverJobBuilder:
+        # with_best_solution_consumer converts every solution before calling its consumer, so set Java consumers;
+        # SolverJobBuilder._delegate and unwrap_python_like_object are private, hence the timefold pin in pyproject.toml
+        from java.util.function import Consumer
+        from _jpyinterpreter import unwrap_python_like_object
+        delegate = builder._delegate.withBestSolutionConsumer(Consumer @ self.on_best_solution) \
+                                    .withFinalBestSolutionConsumer(Consumer @ (lambda solution: self.finish(unwrap_python_like_object(solution))))
+        return SolverJobBuilder(delegate)
+
+    def on_best_solution(self, java_solution: Any):
+        with self._lock:
+            if self._finished:
+                return
+            wait = self._last_delivery + self.min_interval_seconds - time.monotonic()
+            if wait <= 0 and self._timer is None:
+                self._deliver(java_solution)
+                return
+            self._pending = java_solution
+            if self._timer is None:
+                self._timer = threading.Timer(max(wait, 0), self._deliver_pending)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def finish(self, solution: Timetable):
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer, self._pending, self._finished = None, None, True
+            self._deliver(solution, is_final=True)
+
+    def _deliver_pending(self):
+        with self._lock:
+            pending, self._pending, self._timer = self._pending, None, None
+            if pending is not None and not self._finished:
+                self._deliver(pending)
+
+    def _deliver(self, solution: Any, is_final: bool = False):
+        from _jpyinterpreter import unwrap_python_like_object
+        is_java = not isinstance(solution, Timetable)
+        if is_java and not (self.diffs_only() if callable(self.diffs_only) else self.diffs_only):
+            solution, is_java = unwrap_python_like_object(solution), False
+        score = unwrap_python_like_object(solution.score) if is_java else solution.score
+        assignments = read_assignments(solution)
+        changed = {assignment_id: ta_id for assignment_id, ta_id in assignments.items()
+                   if assignment_id not in self._previous or self._previous[assignment_id] != ta_id}
+        self._previous = assignments
+        self._last_delivery = time.monotonic()
+        self.listener(BestSolutionEvent(score=score, changed=changed, solution=None if is_java else solution, is_final=is_final))
@@ -1,42 +1,82 @@
-from timefold.solver        import SolverManager, SolverFactory, SolutionManager
+import os
+import threading
+
+from timefold.solver        import SolverManager, SolverFactory, SolutionManager, ProblemChange
 from timefold.solver.config import (SolverConfig, ScoreDirectorFactoryConfig,
-                                    TerminationConfig, Duration)
+                                    TerminationConfig, Duration, SolverConfigOverride)
 from timefold.solver.score  import ConstraintFactory, Constraint
 
 from .domain        import Timetable, ShiftAssignment
+from .solution_events import BestSolutionEvent, BestSolutionThrottle
 from .constraints   import define_constraints
+from .utils         import DemoData, generate_demo_data
 from typing import Callable
 
+# seconds of the warm-up solve at start-up (0 disables it)
+WARM_UP_SECONDS = float(os.environ.get("TA_SCHEDULER_WARM_UP_SECONDS", 2))
+# at most one best solution per interval reaches the listeners of solve_and_listen (0: every improvement)
+BEST_SOLUTION_INTERVAL_SECONDS = float(os.environ.get("TA_SCHEDULER_BEST_SOLUTION_INTERVAL_SECONDS", 0.5))
+
+# one SolverFactory per (constraint provider, time limit) in the process: creating one translates the
+# constraints to Java and compiles their network, which takes seconds
+_solver_factories: dict[tuple[Callable, int], SolverFactory] = {}
+_solver_factories_lock = threading.Lock()
+
+def get_solver_factory(define_constraints: Callable[[ConstraintFactory], list[Constraint]], spent_limit_seconds: int = 30) -> SolverFactory:
+    with _solver_factories_lock:
+        key = (define_constraints, spent_limit_seconds)
+        if key not in _solver_factories:
+            _solver_factories[key] = SolverFactory.create(SolverConfig(
+                solution_class    = Timetable,
+                entity_class_list = [ShiftAssignment],
+                score_director_factory_config    = ScoreDirectorFactoryConfig(
+                    constraint_provider_function = define_constraints
+                ),
+                termination_config=TerminationConfig(
+                    spent_limit=Duration(seconds=spent_limit_seconds)
+                )
+            ))
+        return _solver_factories[key]
+
 
 class Solver:
     solver_manager: SolverManager
     solution_manager: SolutionManager
-    
-    def __init__(self, define_constraints: Callable[[ConstraintFactory], list[Constraint]]):
-        self.solver_config   = SolverConfig(
-            solution_class    = Timetable,
-            entity_class_list = [ShiftAssignment],
-            score_director_factory_config    = ScoreDirectorFactoryConfig(
-                constraint_provider_function = define_constraints
-            ),
-            termination_config=TerminationConfig(
-                spent_limit=Duration(seconds=30)
-            )
-        )
-
-        self.solver_manager   = SolverManager.create(SolverFactory.create(self.solver_config))
+
+    def __init__(self, define_constraints: Callable[[ConstraintFactory], list[Constraint]], spent_limit_seconds: int = 30):
+        self.solver_factory   = get_solver_factory(define_constraints, spent_limit_seconds)
+        self.solver_manager   = SolverManager.create(self.solver_factory)
         self.solution_manager = SolutionManager.create(self.solver_manager)
+        self.warmed_up        = threading.Event()
+
+    def warm_up(self, seconds: float = WARM_UP_SECONDS):
+        # a short solve of the demo data, so the first request runs JIT-compiled constraints
+        if seconds > 0:
+            termination = TerminationConfig(spent_limit=Duration(milliseconds=int(seconds * 1000)))
+            self.solver_factory.build_solver(SolverConfigOverride(termination_config=termination)).solve(generate_demo_data(DemoData.DemoA))
+        self.warmed_up.set()
 
     def solve(self, timetable: Timetable) -> Timetable:
         return self.solver_manager.solve(timetable)
-    
-    def solve_and_listen(self, job_id: str, timetable: Timetable, listener: Callable[[Timetable], None]):
-        self.solver_manager.solve_and_listen(job_id, timetable, listener)
-    
+
+    def solve_and_listen(self, job_id: str, timetable: Timetable, listener: Callable[[BestSolutionEvent], None],
+                         min_interval_seconds: float = BEST_SOLUTION_INTERVAL_SECONDS, diffs_only: bool | Callable[[], bool] = False,
+                         on_exception: Callable[[Exception], None] | None = None):
+        # the listener gets the latest improvement once per interval and the final solution (see solution_events)
+        throttle = BestSolutionThrottle(listener, min_interval_seconds=min_interval_seconds, diffs_only=diffs_only)
+        builder = self.solver_manager.solve_builder().with_problem_id(job_id).with_problem(timetable)
+        if on_exception is not None:
+            builder = builder.with_exception_handler(lambda problem_id, error: on_exception(error))
+        return throttle.attach(builder).run()
+
+    def add_problem_change(self, job_id: str, problem_change: ProblemChange[Timetable]):
+        # applied to the best solution of the running job, which the solver then repairs
+        return self.solver_manager.add_problem_change(job_id, problem_change)
+
     def terminate_early(self):
         self.solver_manager.terminate_early()
-        
+
     def get_solver_status(self, job_id: str) -> str:
         return self.solver_manager.get_solver_status(job_id)
 
-solver_manager = Solver(define_constraints)
\ No newline at end of file
+solver_manager = Solver(define_constraints)
@@ -1,4 +1,4 @@
-let autoRefreshIntervalId = null;
+let progressEvents = null;
 const zoomMin = 2 * 1000 * 60 * 60 * 24 // 2 day in milliseconds
 const zoomMax = 4 * 7 * 1000 * 60 * 60 * 24 // 4 weeks in milliseconds
 
@@ -395,38 +395,40 @@ function getScoreComponents(score) {
     return components;
 }
 
+
 function refreshSolvingButtons(solving) {
     if (solving) {
         $("#solveButton").hide();
         $("#stopSolvingButton").show();
-        if (autoRefreshIntervalId == null) {
-            autoRefreshIntervalId = setInterval(refreshSchedule, 2000);
+        if (progressEvents == null) {
+            listenToProgress();
         }
     } else {
         $("#solveButton").show();
         $("#stopSolvingButton").hide();
-        if (autoRefreshIntervalId != null) {
-            clearInterval(autoRefreshIntervalId);
-            autoRefreshIntervalId = null;
+        if (progressEvents != null) {
+            progressEvents.close();
+            progressEvents = null;
         }
     }
 }
 
-function refreshSolvingButtons(solving) {
-    if (solving) {
-        $("#solveButton").hide();
-        $("#stopSolvingButton").show();
-        if (autoRefreshIntervalId == null) {
-            autoRefreshIntervalId = setInterval(refreshSchedule, 2000);
+function listenToProgress() {
+    // the server pushes the score as the solver improves, and a final event once it terminates
+    progressEvents = new EventSource(`/schedules/${scheduleId}/events`);
+    const showScore = function (message) {
+        const score = JSON.parse(message.data).score;
+        if (score != null) {
+            $("#score").text(`Score: ${score.hardScore}hard/${score.mediumScore}medium/${score.softScore}soft`);
         }
-    } else {
-        $("#solveButton").show();
-        $("#stopSolvingButton").hide();
-        if (autoRefreshIntervalId != null) {
-            clearInterval(autoRefreshIntervalId);
-            autoRefreshIntervalId = null;
-        }
-    }
+    };
+    progressEvents.addEventListener("snapshot", showScore);
+    progressEvents.addEventListener("update", showScore);
+    progressEvents.addEventListener("final", function (message) {
+        showScore(message);
+        refreshSolvingButtons(false);
+        refreshSchedule();
+    });
 }
 
 function stopSolving() {
@@ -0,0 +1,44 @@
+import os
+import time
+import tempfile
+
+import pytest
+
+# read when employee_scheduling.rest_api is imported: no warm-up solve, and a job store of the tests' own
+os.environ.setdefault("TA_SCHEDULER_WARM_UP_SECONDS", "0")
+os.environ.setdefault("TA_SCHEDULER_JOB_STORE", os.path.join(tempfile.mkdtemp(prefix="ta-scheduler-tests-"), "jobs.sqlite3"))
+
+
+def wait_until(condition, timeout_seconds: float = 30):
+    deadline = time.monotonic() + timeout_seconds
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.1)
+
+
+@pytest.fixture(scope="session")
+def client():
+    from fastapi.testclient import TestClient
+    from employee_scheduling.rest_api import app
+    return TestClient(app)
+
+
+@pytest.fixture
+def terminate(client):
+    # stops a job of the app; returns once its final best solution is in the schedule
+    from employee_scheduling.rest_api import solver_manager
+
+    def stop(job_id: str):
+        solver_manager.solver_manager.terminate_early(job_id)
+        client.get(f"/schedules/{job_id}/events")     # the stream ends with the final best solution
+    return stop
+
+
+@pytest.fixture
+def solving_job(client, terminate):
+    # a DemoA job that has a first best solution
+    job_id = client.post("/schedules", json=client.get("/demo-data/DemoA").json()).json()
+    wait_until(lambda: client.get(f"/schedules/{job_id}/status").json() == "SOLVING_ACTIVE"
+                       and "score" in client.get(f"/schedules/{job_id}").json())
+    yield job_id
+    terminate(job_id)
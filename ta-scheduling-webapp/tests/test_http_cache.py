@@ -0,0 +1,76 @@
+import gzip
+
+import pytest
+from starlette.requests import Request
+
+from employee_scheduling.http_cache import GZIP_MIN_SIZE, ResponseCache
+
+
+def request(**headers) -> Request:
+    return Request({"type": "http", "method": "GET", "path": "/", "query_string": b"",
+                    "headers": [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]})
+
+
+def test_if_none_match_with_the_etag_is_304_and_without_it_the_body():
+    cache = ResponseCache()
+    make_body = lambda: b'{"a":1}'
+    assert cache.json_response(request(if_none_match='W/"1"'), 'W/"1"', make_body).status_code == 304
+    assert cache.json_response(request(if_none_match='"0", W/"1"'), 'W/"1"', make_body).status_code == 304
+    assert cache.json_response(request(if_none_match='"1"'), 'W/"1"', make_body).status_code == 304     # weak comparison
+
+    response = cache.json_response(request(if_none_match='W/"0"'), 'W/"1"', make_body)
+    assert response.status_code == 200 and response.body == b'{"a":1}' and response.headers["etag"] == 'W/"1"'
+    assert cache.json_response(request(), 'W/"1"', make_body).status_code == 200
+
+@pytest.mark.parametrize("accept_encoding, gzipped", [("gzip", True), ("deflate, gzip;q=0.5", True), ("gzip;q=0", False),
+                                                      ("gzip; q=0.0", False), ("gzip;q=0.000", False), ("deflate", False),
+                                                      ("", False)])
+def test_gzip_unless_the_client_refuses_it(accept_encoding, gzipped):
+    body = b"x" * GZIP_MIN_SIZE
+    response = ResponseCache().json_response(request(accept_encoding=accept_encoding), 'W/"1"', lambda: body)
+    assert ("content-encoding" in response.headers) == gzipped
+    assert (gzip.decompress(response.body) if gzipped else response.body) == body
+
+def test_bodies_under_the_size_threshold_are_not_gzipped():
+    for size, gzipped in [(GZIP_MIN_SIZE - 1, False), (GZIP_MIN_SIZE, True)]:
+        response = ResponseCache().json_response(request(accept_encoding="gzip"), 'W/"1"', lambda: b"x" * size)
+        assert (response.headers.get("content-encoding") == "gzip") == gzipped
+
+def test_a_body_is_made_once_per_version_of_its_key():
+    cache, made = ResponseCache(), []
+    make_body = lambda: made.append(1) or b"x" * GZIP_MIN_SIZE
+    for etag in ['W/"1"', 'W/"1"', 'W/"2"']:
+        cache.json_response(request(accept_encoding="gzip"), etag, make_body, key="job")
+    assert len(made) == 2
+    cache.discard("job")
+    assert cache.size() == 0
+
+
+def test_get_timetable_is_304_for_the_current_etag(client, solving_job, terminate):
+    terminate(solving_job)
+    response = client.get(f"/schedules/{solving_job}")
+    assert response.status_code == 200 and response.headers["content-encoding"] == "gzip"
+    etag = response.headers["etag"]
+    assert etag.endswith('-NOT_SOLVING"')
+
+    assert client.get(f"/schedules/{solving_job}", headers={"If-None-Match": etag}).status_code == 304
+    assert client.get(f"/schedules/{solving_job}", headers={"If-None-Match": 'W/"0-SOLVING_ACTIVE"'}).status_code == 200
+
+def test_get_timetable_since_a_version_has_the_assignments_changed_after_it(client, solving_job, terminate):
+    terminate(solving_job)
+    schedule = client.get(f"/schedules/{solving_job}").json()
+    version  = int(client.get(f"/schedules/{solving_job}").headers["etag"].split('"')[1].split("-")[0])
+    assert version > 0
+
+    current = client.get(f"/schedules/{solving_job}", params={"since": version}).json()
+    assert current["version"] == version and not current["full"] and current["assignments"] == {}
+
+    # the first best solution (version 1) changed every assignment of the problem (version 0)
+    older = client.get(f"/schedules/{solving_job}", params={"since": 0}).json()
+    assert not older["full"]
+    assert older["assignments"] == {assignment["id"]: assignment.get("assignedTa", {}).get("id")
+                                    for assignment in schedule["shiftAssignments"]}
+    assert older["score"] == schedule["score"] and older["solverStatus"] == "NOT_SOLVING"
+
+    # a version the job never had gives the whole schedule
+    assert client.get(f"/schedules/{solving_job}", params={"since": version + 1}).json()["full"]
@@ -0,0 +1,107 @@
+import time
+import threading
+
+import pytest
+from timefold.solver import SolverStatus
+
+from employee_scheduling.job_registry import JobRegistry, estimate_size
+from employee_scheduling.utils import DemoData, generate_demo_data
+
+from conftest import wait_until
+
+
+@pytest.fixture(scope="module")
+def schedule():
+    return generate_demo_data(DemoData.DemoA)
+
+
+@pytest.fixture(scope="module")
+def size(schedule):
+    return estimate_size(schedule)
+
+
+def test_finished_jobs_over_the_budget_are_evicted_least_recently_used_first(schedule, size):
+    evicted = []
+    registry = JobRegistry(memory_budget_bytes=int(3.5 * size), ttl_seconds=3600, on_evict=evicted.append)
+    for job_id in "abc":
+        registry[job_id] = schedule
+        registry.finish(job_id)
+    assert evicted == [] and registry.stats()["estimatedBytes"] == 3 * size
+
+    registry.get("a")               # "b" is now the least recently used
+    registry["d"] = schedule
+    assert evicted == ["b"] and "b" not in registry and registry.get("b") is None
+    assert [job_id in registry for job_id in "acd"] == [True, True, True]
+    assert registry.stats()["evictions"] == 1
+
+def test_jobs_being_solved_are_never_evicted(schedule, size):
+    evicted = []
+    registry = JobRegistry(memory_budget_bytes=0, ttl_seconds=0, on_evict=evicted.append)
+    for job_id in "ab":
+        registry[job_id] = schedule
+    assert registry.stats()["solving"] == 2 and evicted == []
+    assert registry["a"] is schedule and registry.get("b") is schedule
+
+    registry.finish("a")
+    assert evicted == ["a"] and "b" in registry
+    with pytest.raises(KeyError):
+        registry["a"]
+
+def test_finished_jobs_idle_for_the_ttl_are_evicted(schedule, size):
+    evicted = []
+    registry = JobRegistry(memory_budget_bytes=100 * size, ttl_seconds=0.2, on_evict=evicted.append)
+    registry["finished"], registry["solving"] = schedule, schedule
+    registry.finish("finished")
+    registry.get("finished")
+    assert evicted == []
+    time.sleep(0.3)
+    assert registry.stats()["jobs"] == 1 and evicted == ["finished"] and "solving" in registry
+
+def test_reloaded_jobs_count_as_finished(schedule, size):
+    registry = JobRegistry(memory_budget_bytes=100 * size, ttl_seconds=0.2)
+    registry.reload("job", schedule)
+    registry.reload("job", generate_demo_data(DemoData.DemoB))     # already there: kept as it is
+    assert registry.get("job") is schedule
+    assert registry.stats() == {**registry.stats(), "jobs": 1, "finished": 1, "reloads": 1, "estimatedBytes": size}
+    time.sleep(0.3)
+    registry.stats()
+    assert "job" not in registry
+
+def test_on_evict_is_called_outside_the_registry_lock(schedule, size):
+    # another thread can use the registry from on_evict (the app's hook takes the progress lock)
+    def on_evict(job_id):
+        reader = threading.Thread(target=lambda: registry.get("b"))
+        reader.start()
+        reader.join(timeout=5)
+        results.append(not reader.is_alive())
+
+    results = []
+    registry = JobRegistry(memory_budget_bytes=size, ttl_seconds=3600, on_evict=on_evict)
+    registry["a"], registry["b"] = schedule, schedule
+    registry.finish("a")
+    assert results == [True]
+
+
+def test_a_job_solved_by_this_worker_stays_in_the_registry(client, solving_job, monkeypatch):
+    # what change_schedule relies on: a job the solver reports as SOLVING_ACTIVE has its schedule in data_sets
+    from employee_scheduling.rest_api import data_sets, solver_manager
+
+    monkeypatch.setattr(data_sets, "memory_budget_bytes", 0)
+    monkeypatch.setattr(data_sets, "ttl_seconds", 0)
+    data_sets.stats()       # evicts what it can
+    assert solver_manager.get_solver_status(solving_job) == SolverStatus.SOLVING_ACTIVE
+    assert solving_job in data_sets
+    response = client.patch(f"/schedules/{solving_job}", json={"kind": "setRequiredTas", "shiftId": "0", "requiredTas": 1})
+    assert response.status_code == 200
+
+def test_changing_a_job_that_finished_and_was_evicted_is_409(client, solving_job, terminate, monkeypatch):
+    # the job may finish and leave the registry between the status check and the change
+    from employee_scheduling.rest_api import data_sets, solver_manager
+
+    terminate(solving_job)
+    monkeypatch.setattr(data_sets, "ttl_seconds", 0)
+    # the final best solution is streamed just before the registry hears that the job finished
+    wait_until(lambda: data_sets.stats() and solving_job not in data_sets)
+    monkeypatch.setattr(solver_manager, "get_solver_status", lambda job_id: SolverStatus.SOLVING_ACTIVE)
+    response = client.patch(f"/schedules/{solving_job}", json={"kind": "setRequiredTas", "shiftId": "0", "requiredTas": 1})
+    assert response.status_code == 409
@@ -0,0 +1,100 @@
+import os
+import sqlite3
+import subprocess
+
+import pytest
+from timefold.solver.score import HardMediumSoftScore
+
+from employee_scheduling.job_store import JobStore
+from employee_scheduling.utils import DemoData, generate_demo_data
+
+
+def dump(schedule) -> str:
+    return schedule.model_dump_json(by_alias=True, exclude_none=True)
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "jobs.sqlite3")
+
+
+@pytest.fixture
+def store(path):
+    store = JobStore(path, flush_seconds=3600)      # flushed by the tests
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def solution():
+    solution = generate_demo_data(DemoData.DemoA)
+    for assignment in solution.shift_assignments:
+        assignment.assigned_ta = solution.tas[0]
+    solution.score = HardMediumSoftScore.of(-1, -2, 3)
+    return solution
+
+
+def test_a_job_round_trips_from_its_problem_to_its_best_solution(store, solution):
+    problem = generate_demo_data(DemoData.DemoA)
+    store.create("job", problem)
+    record, loaded = store.load("job")
+    assert (record.status, record.version, record.owner_pid, record.name) == ("SOLVING_SCHEDULED", 0, os.getpid(), problem.id)
+    assert dump(loaded) == dump(problem)
+
+    store.save_best("job", solution, version=3, status="SOLVING_ACTIVE")
+    assert store.load("job")[0].version == 0        # written behind
+    store.flush()
+    record, loaded = store.load("job")
+    assert (record.status, record.version) == ("SOLVING_ACTIVE", 3)
+    assert record.score == {"initScore": 0, "hardScore": -1, "mediumScore": -2, "softScore": 3}
+    assert dump(loaded) == dump(solution)
+
+    solution.score = HardMediumSoftScore.of(0, 0, 1)
+    store.save_best("job", solution, version=4, status="NOT_SOLVING", final=True)     # saved right away
+    record, loaded = store.load("job")
+    assert (record.status, record.version, loaded.score) == ("NOT_SOLVING", 4, solution.score)
+    assert store.load("unknown") is None and store.get("unknown") is None
+
+def test_status_updates_flush_the_pending_solution_first(store, solution):
+    store.create("job", generate_demo_data(DemoData.DemoA))
+    store.set_status("job", "SOLVING_ACTIVE")
+    assert store.get("job").status == "SOLVING_ACTIVE"
+
+    store.save_best("job", solution, version=1, status="SOLVING_ACTIVE")
+    store.set_status("job", "NOT_SOLVING")
+    record = store.get("job")
+    assert (record.status, record.version) == ("NOT_SOLVING", 1)
+    assert record.updated_at >= record.created_at
+
+def test_a_second_store_on_the_file_sees_the_jobs_of_the_first(store, path, solution):
+    store.create("first", generate_demo_data(DemoData.DemoA))
+    store.create("second", generate_demo_data(DemoData.DemoB))
+    store.save_best("first", solution, version=2, status="SOLVING_ACTIVE", final=True)
+
+    other = JobStore(path, flush_seconds=3600)
+    try:
+        assert [record.id for record in other.list()] == ["first", "second"]
+        record, loaded = other.load("first")
+        # the first store's process is alive: its jobs are still being solved
+        assert (record.status, record.version) == ("SOLVING_ACTIVE", 2) and dump(loaded) == dump(solution)
+
+        other.set_status("second", "NOT_SOLVING")
+        assert store.get("second").status == "NOT_SOLVING"
+    finally:
+        other.close()
+
+def test_the_jobs_of_a_dead_process_are_not_solving(store, path):
+    store.create("job", generate_demo_data(DemoData.DemoA), status="SOLVING_ACTIVE")
+    process = subprocess.Popen(["true"])
+    process.wait()
+    with sqlite3.connect(path) as connection:
+        connection.execute("UPDATE jobs SET owner_pid = ? WHERE id = 'job'", (process.pid,))
+    assert store.get("job").status == "NOT_SOLVING"
+
+    # and so are the ones left by an earlier process with this pid, once a store opens the file
+    with sqlite3.connect(path) as connection:
+        connection.execute("UPDATE jobs SET owner_pid = ?, updated_at = 0 WHERE id = 'job'", (os.getpid(),))
+    assert store.get("job").status == "SOLVING_ACTIVE"
+    other = JobStore(path, flush_seconds=3600)
+    other.close()
+    assert store.get("job").status == "NOT_SOLVING"
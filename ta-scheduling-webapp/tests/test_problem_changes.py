@@ -0,0 +1,95 @@
+import time
+
+from conftest import wait_until
+
+CHANGE_SECONDS = 1      # for the solver to pick up a problem change before the job is terminated
+
+NEW_TA = {"id": "new", "name": "New TA", "requiredShifts": 1, "desired": [], "undesired": [], "unavailable": [],
+          "isGradStudent": False}
+
+
+def assigned(schedule: dict, shift_id: str) -> list:
+    return [assignment.get("assignedTa", {}).get("id") for assignment in schedule["shiftAssignments"]
+            if assignment["shift"]["id"] == shift_id]
+
+
+def test_changing_an_unknown_job_is_404(client):
+    response = client.patch("/schedules/unknown", json={"kind": "setRequiredTas", "shiftId": "0", "requiredTas": 1})
+    assert response.status_code == 404
+
+def test_changing_a_job_that_is_not_solving_is_409(client, solving_job, terminate):
+    terminate(solving_job)
+    response = client.patch(f"/schedules/{solving_job}", json={"kind": "setRequiredTas", "shiftId": "0", "requiredTas": 1})
+    assert response.status_code == 409
+
+def test_changes_with_unknown_or_duplicate_ids_are_422(client, solving_job):
+    changes = [{"kind": "markUnavailable", "taId": "unknown", "shiftId": "0"},
+               {"kind": "markUnavailable", "taId": "0", "shiftId": "unknown"},
+               {"kind": "setRequiredTas", "shiftId": "unknown", "requiredTas": 1},
+               {"kind": "addTa", "ta": {**NEW_TA, "id": "0"}},
+               {"kind": "addTa", "ta": {**NEW_TA, "unavailable": [{"id": "unknown", "series": "L99", "dayOfWeek": "Mon",
+                                                                   "startTime": "09:00:00", "endTime": "12:00:00"}]}}]
+    for change in changes:
+        assert client.patch(f"/schedules/{solving_job}", json=change).status_code == 422, change
+
+def test_a_ta_added_twice_before_the_next_best_solution_is_422(client, solving_job):
+    responses = [client.patch(f"/schedules/{solving_job}", json={"kind": "addTa", "ta": NEW_TA}) for _ in range(2)]
+    assert [response.status_code for response in responses] == [200, 422]
+
+def test_mark_unavailable_frees_the_ta_from_the_shift(client, solving_job, terminate):
+    schedule    = client.get(f"/schedules/{solving_job}").json()
+    assignment  = next(assignment for assignment in schedule["shiftAssignments"] if "assignedTa" in assignment)
+    ta_id, shift_id = assignment["assignedTa"]["id"], assignment["shift"]["id"]
+
+    response = client.patch(f"/schedules/{solving_job}", json={"kind": "markUnavailable", "taId": ta_id, "shiftId": shift_id})
+    assert response.status_code == 200
+    time.sleep(CHANGE_SECONDS)
+    terminate(solving_job)
+
+    schedule = client.get(f"/schedules/{solving_job}").json()
+    ta = next(ta for ta in schedule["tas"] if ta["id"] == ta_id)
+    assert shift_id in [shift["id"] for shift in ta["unavailable"]]
+    assert ta_id not in assigned(schedule, shift_id)
+
+def test_set_required_tas_adds_shift_assignments(client, solving_job, terminate):
+    response = client.patch(f"/schedules/{solving_job}", json={"kind": "setRequiredTas", "shiftId": "3", "requiredTas": 3})
+    assert response.status_code == 200
+    time.sleep(CHANGE_SECONDS)
+    terminate(solving_job)
+
+    schedule = client.get(f"/schedules/{solving_job}").json()
+    assert len(assigned(schedule, "3")) == 3
+    assert next(shift for shift in schedule["shifts"] if shift["id"] == "3")["requiredTas"] == 3
+
+def test_add_ta_adds_the_ta_to_the_pool(client, solving_job, terminate):
+    response = client.patch(f"/schedules/{solving_job}", json={"kind": "addTa", "ta": NEW_TA})
+    assert response.status_code == 200
+    time.sleep(CHANGE_SECONDS)
+    terminate(solving_job)
+
+    schedule = client.get(f"/schedules/{solving_job}").json()
+    assert [ta["id"] for ta in schedule["tas"]].count("new") == 1
+
+def test_the_schedule_has_the_changes_while_the_job_is_solving(client, solving_job):
+    # the improvements after a change carry the new TA and shift assignments, not only the changed assignments
+    assert client.patch(f"/schedules/{solving_job}", json={"kind": "setRequiredTas", "shiftId": "3", "requiredTas": 3}).status_code == 200
+    assert client.patch(f"/schedules/{solving_job}", json={"kind": "addTa", "ta": NEW_TA}).status_code == 200
+
+    def changed() -> bool:
+        schedule = client.get(f"/schedules/{solving_job}").json()
+        return "new" in [ta["id"] for ta in schedule["tas"]] and len(assigned(schedule, "3")) == 3
+    wait_until(changed)
+    assert client.get(f"/schedules/{solving_job}/status").json() == "SOLVING_ACTIVE"
+
+    schedule = client.get(f"/schedules/{solving_job}").json()
+    ta_ids   = {ta["id"] for ta in schedule["tas"]}
+    assert next(shift for shift in schedule["shifts"] if shift["id"] == "3")["requiredTas"] == 3
+    assert all(assignment["assignedTa"]["id"] in ta_ids for assignment in schedule["shiftAssignments"] if "assignedTa" in assignment)
+
+def test_a_failed_job_forgets_its_changes(client, solving_job):
+    from employee_scheduling.rest_api import added_ta_ids, changed_jobs, job_failed
+
+    assert client.patch(f"/schedules/{solving_job}", json={"kind": "addTa", "ta": NEW_TA}).status_code == 200
+    assert solving_job in added_ta_ids and solving_job in changed_jobs
+    job_failed(solving_job, RuntimeError("the solver failed"))
+    assert solving_job not in added_ta_ids and solving_job not in changed_jobs
@@ -0,0 +1,48 @@
+import json
+import time
+import threading
+
+
+def parse_events(text: str) -> list[tuple[str, int, dict]]:
+    # (kind, version, data) of the server-sent events, without the keep-alive comments
+    events = []
+    for block in text.split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines() if line and not line.startswith(":"))
+        if fields:
+            events.append((fields["event"], int(fields["id"]), json.loads(fields["data"])))
+    return events
+
+
+def current_assignments(client, job_id: str) -> dict:
+    schedule = client.get(f"/schedules/{job_id}").json()
+    return {assignment["id"]: assignment.get("assignedTa", {}).get("id") for assignment in schedule["shiftAssignments"]}
+
+
+def test_a_client_gets_a_snapshot_the_updates_and_the_final_solution(client, solving_job):
+    from employee_scheduling.rest_api import solver_manager
+
+    streamed = {}
+    reader = threading.Thread(target=lambda: streamed.update(text=client.get(f"/schedules/{solving_job}/events").text))
+    reader.start()
+    time.sleep(2)       # a few improvements, if the solver finds any
+    solver_manager.solver_manager.terminate_early(solving_job)
+    reader.join(timeout=30)
+    assert not reader.is_alive()
+
+    events = parse_events(streamed["text"])
+    kinds, versions = [kind for kind, _, _ in events], [version for _, version, _ in events]
+    assert kinds == ["snapshot"] + ["update"] * (len(events) - 2) + ["final"]
+    assert versions == sorted(set(versions))
+    assert events[-1][2]["solverStatus"] == "NOT_SOLVING"
+
+    # the snapshot and the changes make up the final schedule
+    assignments = dict(events[0][2]["assignments"])
+    for _, _, data in events[1:]:
+        assignments.update(data["assignments"])
+    assert assignments == current_assignments(client, solving_job)
+
+    # a client that connects after the end gets the final schedule at once
+    late = parse_events(client.get(f"/schedules/{solving_job}/events").text)
+    assert [(kind, version) for kind, version, _ in late] == [("final", versions[-1])]
+    assert late[0][2]["assignments"] == current_assignments(client, solving_job)
+    assert late[0][2]["score"] == events[-1][2]["score"]
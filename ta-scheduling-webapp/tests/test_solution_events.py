@@ -0,0 +1,13 @@
+from timefold.solver import SolverJobBuilder
+
+
+def test_the_private_timefold_api_of_the_throttle_is_there():
+    # BestSolutionThrottle.attach relies on these; if this fails, the timefold upgrade broke the throttle
+    from employee_scheduling.solver import solver_manager
+    from employee_scheduling.solution_events import BestSolutionThrottle
+
+    builder = solver_manager.solver_manager.solve_builder()
+    assert hasattr(builder, "_delegate"), "SolverJobBuilder._delegate is gone: update BestSolutionThrottle.attach"
+    assert hasattr(builder._delegate, "withBestSolutionConsumer") and hasattr(builder._delegate, "withFinalBestSolutionConsumer")
+    from _jpyinterpreter import unwrap_python_like_object    # noqa: F401 (ImportError: update BestSolutionThrottle)
+    assert isinstance(BestSolutionThrottle(listener=lambda event: None).attach(builder), SolverJobBuilder)